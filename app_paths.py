@@ -0,0 +1,56 @@
+"""
+Emplacements des fichiers de l'application
+Dossiers utilisateur (cache, données) selon le système
+"""
+
+import os
+import sys
+
+APP_NAME = "pdf_reader"
+
+def user_cache_dir(*parts):
+    """
+    Obtient (et crée) un dossier de cache utilisateur
+    
+    Args:
+        *parts (str): Sous-dossiers éventuels
+    
+    Returns:
+        str: Chemin du dossier
+    """
+    if sys.platform.startswith('win'):
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+        base = os.path.join(base, APP_NAME, 'Cache')
+    elif sys.platform == 'darwin':
+        base = os.path.join(os.path.expanduser('~/Library/Caches'), APP_NAME)
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+        base = os.path.join(base, APP_NAME)
+        
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+    
+def user_data_dir(*parts):
+    """
+    Obtient (et crée) un dossier de données utilisateur (conservées, à la
+    différence du cache)
+    
+    Args:
+        *parts (str): Sous-dossiers éventuels
+    
+    Returns:
+        str: Chemin du dossier
+    """
+    if sys.platform.startswith('win'):
+        base = os.environ.get('APPDATA') or os.path.expanduser('~\\AppData\\Roaming')
+        base = os.path.join(base, APP_NAME)
+    elif sys.platform == 'darwin':
+        base = os.path.join(os.path.expanduser('~/Library/Application Support'), APP_NAME)
+    else:
+        base = os.environ.get('XDG_DATA_HOME') or os.path.expanduser('~/.local/share')
+        base = os.path.join(base, APP_NAME)
+        
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""
+Cache persistant de l'audio synthétisé
+Fichiers audio adressés par le contenu, partagés entre les sessions
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import unicodedata
+from collections import OrderedDict
+from app_paths import user_cache_dir
+
+# Version des clés : à incrémenter si la normalisation des phrases change
+AUDIO_KEY_VERSION = 1
+
+class AudioCache:
+    """Cache disque LRU de l'audio des phrases déjà synthétisées"""
+    
+    def __init__(self, cache_dir=None, max_bytes=500 * 1024 * 1024):
+        """
+        Initialisation du cache
+        
+        Args:
+            cache_dir (str, optional): Dossier du cache
+                (par défaut dans le dossier de cache utilisateur)
+            max_bytes (int): Taille maximale du cache (octets)
+        """
+        if cache_dir is None:
+            cache_dir = user_cache_dir("audio")
+        else:
+            os.makedirs(cache_dir, exist_ok=True)
+            
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        
+        # Statistiques
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        
+        self._lock = threading.Lock()
+        
+        # Index LRU : nom de fichier -> taille (du plus ancien au plus récent)
+        # Construit au premier accès, dans le thread de synthèse : le
+        # parcours du dossier ne bloque pas la création de l'interface
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._indexed = False
+        
+    def _ensure_index(self):
+        """Construit l'index au premier accès (appelé sous self._lock)"""
+        if not self._indexed:
+            self._load_index()
+            self._indexed = True
+            
+    def _load_index(self):
+        """Reconstruit l'index à partir des fichiers présents (ordre = date d'accès)"""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.tmp'):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, name, stat.st_size))
+                
+        for _, name, size in sorted(entries):
+            self._entries[name] = size
+            self._total_bytes += size
+            
+    def make_key(self, text, lang, engine, voice, rate):
+        """
+        Calcule la clé d'une phrase synthétisée
+        
+        Args:
+            text (str): Phrase
+            lang (str): Code de langue
+            engine (str): Moteur de synthèse ('gtts', 'pyttsx3', ...)
+            voice (str): Identifiant de la voix
+            rate (int): Vitesse de synthèse
+        
+        Returns:
+            str: Clé hexadécimale
+        """
+        normalized = unicodedata.normalize('NFC', re.sub(r'\s+', ' ', text).strip())
+        fields = (str(AUDIO_KEY_VERSION), normalized, lang or '', engine,
+                  str(voice or ''), str(rate or ''))
+        return hashlib.sha256('\x1f'.join(fields).encode('utf-8')).hexdigest()
+        
+    def _path(self, name):
+        """Chemin d'un fichier du cache (réparti en sous-dossiers)"""
+        return os.path.join(self.cache_dir, name[:2], name)
+        
+    def get(self, key, audio_format):
+        """
+        Obtient l'audio d'une phrase déjà synthétisée
+        
+        Args:
+            key (str): Clé de la phrase (voir make_key)
+            audio_format (str): Format de l'audio ('mp3', 'wav', ...)
+        
+        Returns:
+            bytes: Audio, ou None si absent du cache
+        """
+        name = f"{key}.{audio_format}"
+        with self._lock:
+            self._ensure_index()
+            known = name in self._entries
+            if known:
+                self._entries.move_to_end(name)
+                
+        data = None
+        if known:
+            path = self._path(name)
+            try:
+                with open(path, 'rb') as file:
+                    data = file.read()
+                # La date de modification sert d'ordre LRU entre les sessions
+                os.utime(path)
+            except OSError:
+                with self._lock:
+                    size = self._entries.pop(name, 0)
+                    self._total_bytes -= size
+                data = None
+                
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.bytes_saved += len(data)
+        return data
+        
+    def put(self, key, audio_format, data):
+        """
+        Enregistre l'audio d'une phrase
+        
+        Args:
+            key (str): Clé de la phrase (voir make_key)
+            audio_format (str): Format de l'audio ('mp3', 'wav', ...)
+            data (bytes): Audio
+        """
+        if not data or len(data) > self.max_bytes:
+            return
+            
+        name = f"{key}.{audio_format}"
+        path = self._path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        
+        # Écriture atomique : un fichier n'est jamais lu à moitié écrit
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+            
+        with self._lock:
+            self._ensure_index()
+            self._total_bytes += len(data) - self._entries.pop(name, 0)
+            self._entries[name] = len(data)
+            evicted = self._evict()
+            
+        for old_name in evicted:
+            try:
+                os.remove(self._path(old_name))
+            except OSError:
+                pass
+                
+    def _evict(self):
+        """
+        Retire de l'index les entrées les moins récemment utilisées
+        
+        Returns:
+            list: Noms des fichiers à supprimer
+        """
+        evicted = []
+        while self._total_bytes > self.max_bytes and self._entries:
+            name, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            evicted.append(name)
+        return evicted
+        
+    def clear(self):
+        """Vide complètement le cache"""
+        with self._lock:
+            self._ensure_index()
+            names = list(self._entries)
+            self._entries.clear()
+            self._total_bytes = 0
+        for name in names:
+            try:
+                os.remove(self._path(name))
+            except OSError:
+                pass
+                
+    def stats(self):
+        """
+        Obtient les statistiques du cache
+        
+        Returns:
+            dict: Succès, échecs, taux de succès, octets économisés et taille
+        """
+        with self._lock:
+            self._ensure_index()
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'bytes_saved': self.bytes_saved,
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'entries': len(self._entries)
+            }
\ No newline at end of file
@@ -0,0 +1,166 @@
+"""
+Outils sur les formats audio
+Durée et assemblage des fichiers MP3 / WAV sans décodage
+"""
+
+import io
+import wave
+
+# Débits MPEG Layer III (kbit/s) selon l'index du débit
+_MPEG1_L3_BITRATES = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0)
+_MPEG2_L3_BITRATES = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0)
+
+# Fréquences d'échantillonnage selon la version MPEG (index 3 = MPEG 1)
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000)
+}
+
+def audio_duration(data, audio_format):
+    """
+    Calcule la durée d'un audio
+    
+    Args:
+        data (bytes): Audio
+        audio_format (str): Format de l'audio ('mp3', 'wav')
+    
+    Returns:
+        float: Durée en secondes, ou None si le format n'est pas reconnu
+    """
+    try:
+        if audio_format == "mp3":
+            return mp3_duration(data)
+        if audio_format == "wav":
+            return wav_duration(data)
+    except Exception:
+        pass
+    return None
+    
+def wav_duration(data):
+    """
+    Calcule la durée d'un fichier WAV
+    
+    Args:
+        data (bytes): Contenu du fichier WAV
+    
+    Returns:
+        float: Durée en secondes
+    """
+    with wave.open(io.BytesIO(data), 'rb') as wav:
+        return wav.getnframes() / float(wav.getframerate())
+        
+def mp3_duration(data):
+    """
+    Calcule la durée d'un MP3 en parcourant les en-têtes de trames
+    
+    Les trames illisibles sont ignorées (resynchronisation octet par octet),
+    ce qui couvre les MP3 concaténés de gTTS.
+    
+    Args:
+        data (bytes): Contenu du fichier MP3
+    
+    Returns:
+        float: Durée en secondes, ou None si aucune trame n'est trouvée
+    """
+    pos = 0
+    length = len(data)
+    
+    # Étiquette ID3v2 éventuelle en tête
+    if data[:3] == b'ID3' and length >= 10:
+        tag_size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        pos = 10 + tag_size
+        
+    duration = 0.0
+    frames = 0
+    while pos + 4 <= length:
+        b1 = data[pos + 1]
+        if data[pos] != 0xFF or (b1 & 0xE0) != 0xE0:
+            pos += 1
+            continue
+            
+        version = (b1 >> 3) & 0x03
+        layer = (b1 >> 1) & 0x03
+        b2 = data[pos + 2]
+        bitrate_index = b2 >> 4
+        rate_index = (b2 >> 2) & 0x03
+        if version == 1 or layer != 1 or rate_index == 3 or bitrate_index in (0, 15):
+            # Pas une trame MPEG Layer III valide
+            pos += 1
+            continue
+            
+        sample_rate = _SAMPLE_RATES[version][rate_index]
+        padding = (b2 >> 1) & 0x01
+        if version == 3:
+            bitrate = _MPEG1_L3_BITRATES[bitrate_index] * 1000
+            samples = 1152
+            frame_length = 144 * bitrate // sample_rate + padding
+        else:
+            bitrate = _MPEG2_L3_BITRATES[bitrate_index] * 1000
+            samples = 576
+            frame_length = 72 * bitrate // sample_rate + padding
+            
+        duration += samples / sample_rate
+        frames += 1
+        pos += frame_length
+        
+    return duration if frames else None
+    
+class AudioWriter:
+    """Écriture progressive d'un fichier audio à partir de segments (phrases)"""
+    
+    def __init__(self, path, audio_format):
+        """
+        Initialisation de l'écriture
+        
+        Args:
+            path (str): Fichier à écrire
+            audio_format (str): Format des segments et du fichier ('mp3', 'wav')
+        """
+        self.path = path
+        self.audio_format = audio_format
+        self.duration = 0.0
+        self.segments = 0
+        
+        # Les trames MP3 se concatènent telles quelles ; les segments WAV
+        # sont réécrits sous un en-tête unique
+        self._file = open(path, 'wb') if audio_format != "wav" else None
+        self._wav = None
+        self._params = None
+        
+    def write(self, data):
+        """
+        Ajoute un segment à la fin du fichier
+        
+        Args:
+            data (bytes): Audio du segment
+        """
+        if self.audio_format == "wav":
+            with wave.open(io.BytesIO(data), 'rb') as segment:
+                params = segment.getparams()[:3]
+                if self._wav is None:
+                    self._wav = wave.open(self.path, 'wb')
+                    self._wav.setparams(segment.getparams())
+                    self._params = params
+                elif params != self._params:
+                    raise Exception(f"Erreur: segment WAV incompatible ({params} au lieu de {self._params})")
+                self._wav.writeframes(segment.readframes(segment.getnframes()))
+        else:
+            self._file.write(data)
+            
+        duration = audio_duration(data, self.audio_format)
+        if duration:
+            self.duration += duration
+        self.segments += 1
+        
+    def close(self):
+        """Termine l'écriture du fichier"""
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+        elif self.audio_format == "wav" and not self.segments:
+            # Aucun segment : fichier vide
+            open(self.path, 'wb').close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""
+Tâches en arrière-plan pour l'interface graphique
+Travaux longs (extraction) hors du thread de l'interface, annulables, avec
+des rappels exécutés dans le thread de l'interface
+"""
+
+import threading
+
+class JobCancelled(Exception):
+    """Levée dans une tâche annulée (voir BackgroundJob.check)"""
+    
+class BackgroundJob:
+    """Tâche exécutée dans un thread séparé"""
+    
+    def __init__(self, target, dispatch, on_progress=None, on_done=None, on_error=None):
+        """
+        Initialisation de la tâche
+        
+        Args:
+            target (callable): Travail à exécuter, appelé avec la tâche
+                (pour signaler la progression et vérifier l'annulation) ;
+                sa valeur de retour est transmise à `on_done`
+            dispatch (callable): (fonction, *arguments) -> exécution différée
+                dans le thread de l'interface (par exemple via `after`)
+            on_progress (callable, optional): Rappel de progression
+            on_done (callable, optional): Rappel de fin, avec le résultat
+            on_error (callable, optional): Rappel d'erreur, avec l'exception
+        """
+        self.target = target
+        self.dispatch = dispatch
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        
+    @property
+    def cancelled(self):
+        """Indique si la tâche a été annulée"""
+        return self._cancelled.is_set()
+        
+    def start(self):
+        """Démarre la tâche"""
+        self._thread.start()
+        return self
+        
+    def cancel(self):
+        """
+        Annule la tâche
+        
+        Le travail s'arrête à sa prochaine vérification (check) ; aucun rappel
+        n'est plus exécuté, même s'il était déjà en attente.
+        """
+        self._cancelled.set()
+        
+    def check(self):
+        """Lève JobCancelled si la tâche a été annulée (appelé par le travail)"""
+        if self._cancelled.is_set():
+            raise JobCancelled()
+            
+    def report(self, *args):
+        """
+        Signale une progression (appelé par le travail)
+        
+        Args:
+            *args: Arguments transmis à `on_progress`
+        """
+        self.check()
+        if self.on_progress:
+            self.call(self.on_progress, *args)
+            
+    def call(self, callback, *args):
+        """
+        Exécute une fonction dans le thread de l'interface, sauf si la tâche
+        est annulée entre-temps
+        
+        Args:
+            callback (callable): Fonction à exécuter
+            *args: Arguments de la fonction
+        """
+        def deliver():
+            if not self._cancelled.is_set():
+                callback(*args)
+        self.dispatch(deliver)
+        
+    def join(self, timeout=None):
+        """Attend la fin de la tâche"""
+        self._thread.join(timeout)
+        
+    def _run(self):
+        """Exécution du travail dans le thread de la tâche"""
+        try:
+            result = self.target(self)
+        except JobCancelled:
+            return
+        except Exception as e:
+            if self.on_error:
+                self.call(self.on_error, e)
+            else:
+                print(f"⚠ Tâche en arrière-plan: {e}")
+            return
+        if self.on_done:
+            self.call(self.on_done, result)
+            
+class JobRunner:
+    """Tâches en arrière-plan nommées : une seule tâche active par nom"""
+    
+    def __init__(self, dispatch):
+        """
+        Initialisation
+        
+        Args:
+            dispatch (callable): (fonction, *arguments) -> exécution différée
+                dans le thread de l'interface
+        """
+        self.dispatch = dispatch
+        self._jobs = {}
+        self._lock = threading.Lock()
+        
+    def submit(self, name, target, on_progress=None, on_done=None, on_error=None):
+        """
+        Démarre une tâche ; la tâche précédente de même nom est annulée
+        
+        Args:
+            name (str): Nom de la tâche (par exemple 'load')
+            target (callable): Travail à exécuter (voir BackgroundJob)
+            on_progress (callable, optional): Rappel de progression
+            on_done (callable, optional): Rappel de fin
+            on_error (callable, optional): Rappel d'erreur
+        
+        Returns:
+            BackgroundJob: Tâche démarrée
+        """
+        job = BackgroundJob(target, self.dispatch, on_progress, on_done, on_error)
+        with self._lock:
+            previous = self._jobs.get(name)
+            self._jobs[name] = job
+        if previous:
+            previous.cancel()
+        return job.start()
+        
+    def cancel(self, name):
+        """
+        Annule la tâche active d'un nom donné
+        
+        Args:
+            name (str): Nom de la tâche
+        """
+        with self._lock:
+            job = self._jobs.pop(name, None)
+        if job:
+            job.cancel()
+            
+    def cancel_all(self):
+        """Annule toutes les tâches actives"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+        for job in jobs:
+            job.cancel()
\ No newline at end of file
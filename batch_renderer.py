@@ -0,0 +1,419 @@
+"""
+Rendu audio en lot (sans interface graphique)
+Conversion de nombreux PDF en fichiers audio, avec reprise après interruption
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Tâche de rendu : une plage de pages d'un document -> un fichier audio
+RenderJob = namedtuple('RenderJob', ['pdf_path', 'start_page', 'end_page', 'output_base'])
+
+# Fichier des tâches terminées (dans le dossier de sortie)
+MANIFEST_NAME = "manifest.json"
+
+def _remove_partial(part_base):
+    """
+    Supprime les fichiers partiels d'un rendu interrompu
+    
+    Args:
+        part_base (str): Chemin du fichier partiel sans extension
+    """
+    for audio_format in ("mp3", "wav"):
+        try:
+            os.remove(f"{part_base}.{audio_format}")
+        except OSError:
+            pass
+            
+def _render_job(job, engine_mode, speed, strip_boilerplate=True):
+    """
+    Rendu d'une tâche (exécuté dans un processus fils)
+    
+    L'audio est écrit dans un fichier partiel, renommé une fois complet :
+    un fichier de sortie présent est toujours un rendu terminé.
+    
+    Args:
+        job (RenderJob): Tâche à rendre
+        engine_mode (str): 'auto', 'online' ou 'offline'
+        speed (float): Vitesse de lecture
+        strip_boilerplate (bool): Retire les en-têtes et pieds de page répétés
+    
+    Returns:
+        dict: Fichier produit, pages, phrases, durée de l'audio et du rendu
+    """
+    from profiling import profile_session
+    
+    with profile_session("rendu", job.pdf_path):
+        return _render(job, engine_mode, speed, strip_boilerplate)
+        
+def _render(job, engine_mode, speed, strip_boilerplate):
+    """Corps de _render_job (profilé en mode profilage)"""
+    from pdf_processor import PDFProcessor
+    from voice_engine import VoiceEngine
+    
+    started = time.perf_counter()
+    processor = PDFProcessor(strip_boilerplate=strip_boilerplate)
+    engine = VoiceEngine(engine_mode)
+    engine.set_speed(speed)
+    
+    part_base = f"{job.output_base}.part"
+    _remove_partial(part_base)
+    
+    try:
+        start, end = processor.get_page_range(job.pdf_path, job.start_page, job.end_page)
+        
+        def render():
+            pages = processor.iter_pages(job.pdf_path, start, end)
+            return engine.render_pages(pages, start, end, part_base)
+            
+        try:
+            part_path, duration, sentences = render()
+        except Exception as e:
+            if engine.current_engine != "online" or engine_mode == "online":
+                raise
+            # MP3 et WAV ne se mélangent pas : nouveau rendu complet hors ligne
+            print(f"⚠ {os.path.basename(job.pdf_path)}: {e}, nouveau rendu hors ligne")
+            _remove_partial(part_base)
+            engine.engine_mode = "offline"
+            part_path, duration, sentences = render()
+            
+        output_path = job.output_base + os.path.splitext(part_path)[1]
+        os.replace(part_path, output_path)
+    except Exception:
+        _remove_partial(part_base)
+        raise
+    finally:
+        processor.close()
+        
+    return {
+        'output': output_path,
+        'engine': engine.current_engine,
+        'pages': end - start + 1,
+        'sentences': sentences,
+        'audio_seconds': duration,
+        'seconds': time.perf_counter() - started
+    }
+    
+def parse_spec(spec):
+    """
+    Analyse une spécification de document ('rapport.pdf', 'rapport.pdf:10-20',
+    'rapport.pdf:1-10,11-20', 'rapport.pdf:5', 'rapport.pdf:ch7,ch7.2')
+    
+    Args:
+        spec (str): Chemin du PDF, suivi éventuellement de plages de pages
+            ou de chapitres du sommaire
+    
+    Returns:
+        tuple: (chemin du PDF, liste de plages (début, fin) ou de numéros de
+            chapitres (str) ; [(None, None)] pour le document entier)
+    """
+    path, _, ranges = spec.rpartition(':')
+    if not path or not ranges or not (ranges[0].isdigit() or ranges.startswith('ch')):
+        return spec, [(None, None)]
+        
+    page_ranges = []
+    for part in ranges.split(','):
+        if part.startswith('ch'):
+            number = part[2:]
+            if not number or not all(field.isdigit() for field in number.split('.')):
+                raise Exception(f"Erreur: chapitre invalide '{part}' dans '{spec}'")
+            page_ranges.append(number)
+            continue
+        try:
+            first, _, last = part.partition('-')
+            page_ranges.append((int(first), int(last or first)))
+        except ValueError:
+            raise Exception(f"Erreur: plage de pages invalide '{part}' dans '{spec}'")
+    return path, page_ranges
+    
+class BatchRenderer:
+    """Rendu de plusieurs documents en parallèle, reprenable"""
+    
+    def __init__(self, output_dir, max_workers=2, engine_mode="auto", speed=1.0,
+                 resume=True, strip_boilerplate=True):
+        """
+        Initialisation du rendu en lot
+        
+        Args:
+            output_dir (str): Dossier des fichiers audio produits
+            max_workers (int): Nombre de documents rendus simultanément
+            engine_mode (str): 'auto' (selon la connexion), 'online' ou 'offline'
+            speed (float): Vitesse de lecture (0.5 à 2.0)
+            resume (bool): Ignore les tâches déjà terminées (voir le manifeste)
+            strip_boilerplate (bool): Retire les en-têtes, pieds de page et
+                numéros de page répétés
+        """
+        self.output_dir = output_dir
+        self.max_workers = max(1, max_workers)
+        self.engine_mode = engine_mode
+        self.speed = speed
+        self.resume = resume
+        self.strip_boilerplate = strip_boilerplate
+        
+        os.makedirs(output_dir, exist_ok=True)
+        self.manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+        self.manifest = self._load_manifest() if resume else {}
+        
+    def plan(self, specs):
+        """
+        Construit les tâches de rendu
+        
+        Args:
+            specs (list): Spécifications de documents (voir parse_spec)
+        
+        Les chapitres sont résolus en plages de pages à partir du sommaire
+        de chaque document.
+        
+        Returns:
+            list: Tâches (RenderJob), un fichier de sortie par plage
+        """
+        jobs = []
+        used = set()
+        processor = None
+        for spec in specs:
+            pdf_path, page_ranges = parse_spec(spec)
+            stem = os.path.splitext(os.path.basename(pdf_path))[0]
+            for page_range in page_ranges:
+                if isinstance(page_range, str):
+                    if processor is None:
+                        from pdf_processor import PDFProcessor
+                        processor = PDFProcessor()
+                    start, end = processor.get_chapter_range(pdf_path, page_range)
+                    name = f"{stem}_ch{page_range}"
+                else:
+                    start, end = page_range
+                    name = stem if start is None else f"{stem}_p{start}-{end}"
+                
+                # Deux documents de même nom dans des dossiers différents
+                unique, index = name, 2
+                while unique in used:
+                    unique, index = f"{name}_{index}", index + 1
+                used.add(unique)
+                
+                jobs.append(RenderJob(
+                    os.path.abspath(pdf_path),
+                    start,
+                    end,
+                    os.path.join(self.output_dir, unique)
+                ))
+        if processor is not None:
+            processor.close()
+        return jobs
+        
+    def job_key(self, job):
+        """
+        Calcule la clé d'une tâche dans le manifeste
+        
+        Args:
+            job (RenderJob): Tâche
+        
+        Returns:
+            str: Clé (change si le PDF, la plage ou les réglages changent)
+        """
+        stat = os.stat(job.pdf_path)
+        fields = [job.pdf_path, stat.st_size, stat.st_mtime_ns, job.start_page,
+                  job.end_page, job.output_base, self.engine_mode, self.speed,
+                  self.strip_boilerplate]
+        return hashlib.sha256(json.dumps(fields).encode('utf-8')).hexdigest()
+        
+    def run(self, jobs):
+        """
+        Rend les tâches en parallèle
+        
+        Args:
+            jobs (list): Tâches (RenderJob)
+        
+        Returns:
+            dict: Résumé (documents, pages, durée de l'audio, débit)
+        """
+        started = time.perf_counter()
+        summary = {
+            'done': 0, 'skipped': 0, 'failed': 0,
+            'pages': 0, 'sentences': 0, 'audio_seconds': 0.0
+        }
+        
+        pending = []
+        for job in jobs:
+            try:
+                key = self.job_key(job)
+            except OSError as e:
+                print(f"⚠ {job.pdf_path}: {e}")
+                summary['failed'] += 1
+                continue
+            entry = self.manifest.get(key)
+            if entry and os.path.exists(entry['output']):
+                summary['skipped'] += 1
+                continue
+            pending.append((key, job))
+            
+        if summary['skipped']:
+            print(f"✓ {summary['skipped']} document(s) déjà rendu(s), ignoré(s)")
+            
+        if pending:
+            workers = min(self.max_workers, len(pending))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(_render_job, job, self.engine_mode, self.speed,
+                                    self.strip_boilerplate): (key, job)
+                    for key, job in pending
+                }
+                try:
+                    for count, future in enumerate(as_completed(futures), 1):
+                        key, job = futures[future]
+                        self._collect(future, key, job, summary, count, len(pending))
+                except KeyboardInterrupt:
+                    # Les tâches terminées restent dans le manifeste
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                    
+        elapsed = time.perf_counter() - started
+        summary['seconds'] = elapsed
+        summary['pages_per_second'] = summary['pages'] / elapsed if elapsed else 0.0
+        summary['realtime_factor'] = summary['audio_seconds'] / elapsed if elapsed else 0.0
+        return summary
+        
+    def _collect(self, future, key, job, summary, count, total):
+        """Enregistre le résultat d'une tâche terminée"""
+        name = os.path.basename(job.pdf_path)
+        try:
+            result = future.result()
+        except Exception as e:
+            summary['failed'] += 1
+            print(f"⚠ [{count}/{total}] {name}: {e}")
+            return
+            
+        summary['done'] += 1
+        summary['pages'] += result['pages']
+        summary['sentences'] += result['sentences']
+        summary['audio_seconds'] += result['audio_seconds']
+        
+        self.manifest[key] = result
+        self._save_manifest()
+        print(f"✓ [{count}/{total}] {name} → {os.path.basename(result['output'])} "
+              f"({result['pages']} pages, {result['audio_seconds']:.1f} s d'audio, "
+              f"{result['seconds']:.1f} s)")
+        
+    def _load_manifest(self):
+        """Lecture du manifeste des tâches terminées"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+            
+    def _save_manifest(self):
+        """Écriture atomique du manifeste"""
+        fd, temp_path = tempfile.mkstemp(dir=self.output_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            json.dump(self.manifest, file, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.manifest_path)
+        
+def list_chapters(specs):
+    """
+    Affiche le sommaire (chapitres et plages de pages) des documents
+    
+    Args:
+        specs (list): Spécifications de documents (les plages sont ignorées)
+    
+    Returns:
+        int: Code de sortie (1 si au moins un document est illisible)
+    """
+    from pdf_processor import PDFProcessor
+    
+    processor = PDFProcessor()
+    status = 0
+    try:
+        for spec in specs:
+            pdf_path, _ = parse_spec(spec)
+            try:
+                chapters = processor.get_chapters(pdf_path)
+            except Exception as e:
+                print(f"⚠ {pdf_path}: {e}")
+                status = 1
+                continue
+            print(f"{pdf_path} :")
+            if not chapters:
+                print("  (pas de sommaire)")
+            for chapter in chapters:
+                indent = "  " * (chapter.level + 1)
+                print(f"{indent}ch{chapter.number}  {chapter.title}  "
+                      f"(p. {chapter.start_page}-{chapter.end_page})")
+    finally:
+        processor.close()
+    return status
+    
+def main(argv=None):
+    """
+    Point d'entrée en ligne de commande
+    
+    Args:
+        argv (list, optional): Arguments (par défaut ceux du processus)
+    
+    Returns:
+        int: Code de sortie (1 si au moins un document a échoué)
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py batch",
+        description="Convertit des PDF en fichiers audio (un fichier par document ou par plage de pages)"
+    )
+    parser.add_argument('documents', nargs='*',
+                        help="PDF à convertir, éventuellement suivis de plages ou de "
+                             "chapitres : rapport.pdf:1-10,11-20 ou rapport.pdf:ch7,ch7.2")
+    parser.add_argument('-f', '--from-file',
+                        help="Fichier listant les documents (un par ligne)")
+    parser.add_argument('-o', '--output-dir', default="audio",
+                        help="Dossier de sortie (par défaut : audio)")
+    parser.add_argument('-j', '--jobs', type=int, default=2,
+                        help="Nombre de documents rendus simultanément (par défaut : 2)")
+    parser.add_argument('--engine', choices=("auto", "online", "offline"), default="auto",
+                        help="Moteur de synthèse (par défaut : selon la connexion)")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="Vitesse de lecture (0.5 à 2.0)")
+    parser.add_argument('--no-resume', action='store_true',
+                        help="Refait aussi les documents déjà rendus")
+    parser.add_argument('--keep-headers', action='store_true',
+                        help="Lit aussi les en-têtes, pieds de page et numéros de page")
+    parser.add_argument('--list-chapters', action='store_true',
+                        help="Affiche le sommaire des documents sans les convertir")
+    args = parser.parse_args(argv)
+    
+    specs = list(args.documents)
+    if args.from_file:
+        with open(args.from_file, 'r', encoding='utf-8') as file:
+            specs.extend(line.strip() for line in file if line.strip() and not line.startswith('#'))
+    if not specs:
+        parser.error("aucun document à convertir")
+    if args.list_chapters:
+        return list_chapters(specs)
+        
+    renderer = BatchRenderer(
+        args.output_dir,
+        max_workers=args.jobs,
+        engine_mode=args.engine,
+        speed=args.speed,
+        resume=not args.no_resume,
+        strip_boilerplate=not args.keep_headers
+    )
+    try:
+        jobs = renderer.plan(specs)
+    except Exception as e:
+        print(f"⚠ {e}")
+        return 1
+    summary = renderer.run(jobs)
+    
+    print(f"\n{summary['done']} rendu(s), {summary['skipped']} ignoré(s), {summary['failed']} échec(s)")
+    print(f"{summary['pages']} pages, {summary['sentences']} phrases, "
+          f"{summary['audio_seconds']:.1f} s d'audio en {summary['seconds']:.1f} s")
+    print(f"Débit : {summary['pages_per_second']:.2f} pages/s, "
+          f"{summary['realtime_factor']:.2f} s d'audio par seconde")
+    return 1 if summary['failed'] else 0
+    
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+Micro-benchmark du nettoyage du texte (PDFProcessor._clean_text)
+Compare l'implémentation actuelle à l'implémentation d'origine :
+sortie identique octet pour octet sur un corpus de référence, puis vitesse
+
+Usage : python benchmarks/bench_clean_text.py [fichier.pdf ...]
+"""
+
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf_processor import PDFProcessor
+
+def legacy_clean_text(text):
+    """Implémentation d'origine de _clean_text (référence)"""
+    # Suppression des sauts de ligne excessifs
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    
+    # Correction des mots coupés en fin de ligne
+    text = re.sub(r'(\w+)-\n(\w+)', r'\1\2', text)
+    
+    # Remplacement des sauts de ligne simples par des espaces
+    # sauf s'ils sont suivis d'une majuscule (nouveau paragraphe)
+    lines = text.split('\n')
+    cleaned_lines = []
+    
+    for i, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            cleaned_lines.append('')
+            continue
+            
+        # Si la ligne se termine par un signe de ponctuation
+        # et la suivante commence par une majuscule, on garde le saut
+        if i < len(lines) - 1:
+            next_line = lines[i + 1].strip()
+            if line and next_line:
+                # Fin de phrase détectée
+                if line[-1] in '.!?:' or next_line[0].isupper():
+                    cleaned_lines.append(line)
+                else:
+                    # Concaténation avec la ligne suivante
+                    cleaned_lines.append(line + ' ')
+            else:
+                cleaned_lines.append(line)
+        else:
+            cleaned_lines.append(line)
+            
+    text = ''.join(cleaned_lines)
+    
+    # Nettoyage des espaces multiples
+    text = re.sub(r' {2,}', ' ', text)
+    
+    return text
+    
+# Fragments du corpus : mots accentués, coupures, ponctuation, espaces variés
+WORDS = ["rapport", "Annuel", "économie", "données", "été", "Ça", "l'année",
+         "2024", "x_y", "ÉTAT", "coût", "über", "naïve", "B2B", "déjà-vu", "-"]
+ENDINGS = ["", ".", ":", "!", "?", ",", "-", ";", " ", "  ", "\t", "\xa0", "-\t"]
+PREFIXES = ["", "", "", " ", "  ", "\t", "\xa0", "• ", "1. "]
+
+def random_page(rng, lines):
+    """
+    Génère une page brute aléatoire (comme renvoyée par extract_text)
+    
+    Args:
+        rng (random.Random): Générateur
+        lines (int): Nombre de lignes
+    
+    Returns:
+        str: Texte de la page
+    """
+    result = []
+    for _ in range(lines):
+        if rng.random() < 0.1:
+            # Lignes vides ou blanches, parfois en série
+            result.extend([rng.choice(["", " ", "\t"])] * rng.randint(1, 4))
+            continue
+        words = [rng.choice(WORDS) for _ in range(rng.randint(1, 8))]
+        separator = rng.choice([" ", " ", "  ", " \xa0"])
+        result.append(rng.choice(PREFIXES) + separator.join(words) + rng.choice(ENDINGS))
+    return "\n".join(result)
+    
+def golden_corpus(pdf_paths=()):
+    """
+    Corpus de référence : pages générées (graine fixe) et pages de PDF
+    
+    Args:
+        pdf_paths (iterable): PDF dont le texte brut est ajouté au corpus
+    
+    Returns:
+        list: Textes bruts
+    """
+    rng = random.Random(1234)
+    corpus = ["", "\n", "a-\nb-\nc", "a-\nbc-\nd", "mot-\n\nsuite", "-\nx", "x-\n"]
+    corpus += [random_page(rng, rng.randint(1, 60)) for _ in range(3000)]
+    
+    # Courtes chaînes ciblant les cas limites (coupures en chaîne, blancs)
+    symbols = ['a', '_', '-', '\n', ' ', 'é', '1', '²', '.', 'A', '\xa0', '\t', '-\n', '  ']
+    corpus += [''.join(rng.choice(symbols) for _ in range(rng.randint(0, 30)))
+               for _ in range(20000)]
+    
+    for pdf_path in pdf_paths:
+        import PyPDF2
+        with open(pdf_path, 'rb') as file:
+            for page in PyPDF2.PdfReader(file).pages:
+                corpus.append(page.extract_text() or "")
+    return corpus
+    
+def best_time(function, pages, repeat):
+    """Meilleur temps (secondes) de nettoyage de toutes les pages"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for page in pages:
+            function(page)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+    
+def main(argv=None):
+    """Vérifie l'équivalence puis mesure la vitesse"""
+    argv = sys.argv[1:] if argv is None else argv
+    processor = PDFProcessor(use_text_cache=False)
+    
+    # Sortie identique octet pour octet
+    corpus = golden_corpus(argv)
+    for index, page in enumerate(corpus):
+        expected = legacy_clean_text(page)
+        actual = processor._clean_text(page)
+        if actual != expected:
+            print(f"⚠ Différence sur la page {index} du corpus : {page!r}")
+            return 1
+    print(f"✓ Sortie identique sur {len(corpus)} pages")
+    
+    # Grandes pages : livres scannés, milliers de lignes courtes
+    rng = random.Random(42)
+    for lines in (200, 2000, 10000):
+        pages = [random_page(rng, lines) for _ in range(10)]
+        legacy = best_time(legacy_clean_text, pages, 5)
+        current = best_time(processor._clean_text, pages, 5)
+        print(f"{lines:>6} lignes/page : {legacy * 100:8.2f} ms → {current * 100:8.2f} ms "
+              f"par page (x{legacy / current:.1f})")
+    return 0
+    
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,215 @@
+"""
+Moteurs vocaux simulés pour les benchmarks
+Synthèse et lecture remplacées par des attentes de durée configurable :
+mesures reproductibles, sans carte son, voix système ni connexion Internet
+"""
+
+import io
+import os
+import sys
+import threading
+import time
+import wave
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from voice_engine import VoiceEngine
+
+# Trame MPEG-2 Layer III muette de 24 ms (audio "en ligne" simulé)
+MP3_FRAME = bytes([0xFF, 0xF3, 0x44, 0x00]) + b'\0' * 92
+MP3_FRAME_SECONDS = 0.024
+
+class Latency:
+    """Durées simulées de la synthèse et de la lecture"""
+    
+    def __init__(self, synthesis_base=0.02, synthesis_per_char=0.0001,
+                 audio_per_char=0.0003):
+        """
+        Initialisation
+        
+        Args:
+            synthesis_base (float): Coût fixe d'un appel de synthèse (s)
+            synthesis_per_char (float): Coût de synthèse par caractère (s)
+            audio_per_char (float): Durée d'audio produite par caractère (s)
+        """
+        self.synthesis_base = synthesis_base
+        self.synthesis_per_char = synthesis_per_char
+        self.audio_per_char = audio_per_char
+        
+    def synthesis(self, text):
+        """Durée de synthèse d'un texte"""
+        return self.synthesis_base + self.synthesis_per_char * len(text)
+        
+    def audio(self, text):
+        """Durée de l'audio d'un texte"""
+        return self.audio_per_char * len(text)
+        
+def silent_wav(seconds, rate=8000):
+    """Audio WAV muet d'une durée donnée"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as output:
+        output.setnchannels(1)
+        output.setsampwidth(2)
+        output.setframerate(rate)
+        output.writeframes(b'\0\0' * int(seconds * rate))
+    return buffer.getvalue()
+    
+def silent_mp3(seconds):
+    """Audio MP3 muet d'une durée donnée (trames de 24 ms)"""
+    return MP3_FRAME * max(1, round(seconds / MP3_FRAME_SECONDS))
+    
+class PlaybackLog:
+    """Horodatage du début et de la fin de chaque audio joué"""
+    
+    def __init__(self):
+        """Initialisation d'un journal vide"""
+        self.started = None
+        self.spans = []
+        self._lock = threading.Lock()
+        
+    def start(self):
+        """Début de la lecture mesurée (référence du temps)"""
+        self.started = time.perf_counter()
+        self.spans = []
+        
+    def record(self, begin, end):
+        """Enregistre un audio joué entre `begin` et `end`"""
+        with self._lock:
+            self.spans.append((begin, end))
+            
+    def summary(self):
+        """
+        Résumé de la lecture
+        
+        Returns:
+            dict: Délai avant le premier audio, silences entre deux audios
+                (moyenne, 95e centile, maximum), nombre d'audios
+        """
+        if not self.spans:
+            return {'time_to_first_audio': None, 'gap_mean': None,
+                    'gap_p95': None, 'gap_max': None, 'segments': 0}
+        gaps = sorted(max(0.0, begin - end) for (_, end), (begin, _)
+                      in zip(self.spans, self.spans[1:]))
+        return {
+            'time_to_first_audio': self.spans[0][0] - self.started,
+            'gap_mean': sum(gaps) / len(gaps) if gaps else 0.0,
+            'gap_p95': gaps[int(0.95 * (len(gaps) - 1))] if gaps else 0.0,
+            'gap_max': gaps[-1] if gaps else 0.0,
+            'segments': len(self.spans)
+        }
+        
+class FakeOfflineTTS:
+    """Moteur simulé avec l'interface de pyttsx3 utilisée par VoiceEngine"""
+    
+    def __init__(self, latency, log):
+        """
+        Initialisation
+        
+        Args:
+            latency (Latency): Durées simulées
+            log (PlaybackLog): Journal de lecture (lecture directe)
+        """
+        self.latency = latency
+        self.log = log
+        self.properties = {'rate': 150, 'volume': 1.0, 'voices': [], 'voice': None}
+        self._spoken = []
+        self._files = []
+        
+    def say(self, text):
+        """Phrase à dire au prochain runAndWait"""
+        self._spoken.append(text)
+        
+    def save_to_file(self, text, path):
+        """Phrase à rendre dans un fichier au prochain runAndWait"""
+        self._files.append((text, path))
+        
+    def runAndWait(self):
+        """Synthèse (attente) puis lecture (attente) ou écriture des fichiers"""
+        spoken, self._spoken = self._spoken, []
+        files, self._files = self._files, []
+        
+        for text in spoken:
+            time.sleep(self.latency.synthesis(text))
+            begin = time.perf_counter()
+            time.sleep(self.latency.audio(text))
+            self.log.record(begin, time.perf_counter())
+            
+        for text, path in files:
+            time.sleep(self.latency.synthesis(text))
+            with open(path, 'wb') as file:
+                file.write(silent_wav(self.latency.audio(text)))
+                
+    def stop(self):
+        """Arrêt (sans effet)"""
+        self._spoken = []
+        
+    def setProperty(self, name, value):
+        """Réglage d'une propriété"""
+        self.properties[name] = value
+        
+    def getProperty(self, name):
+        """Lecture d'une propriété"""
+        return self.properties.get(name)
+        
+class BenchVoiceEngine(VoiceEngine):
+    """
+    VoiceEngine dont la synthèse et la lecture sont simulées
+    
+    Tout le reste (découpage, blocs, synthèse anticipée, lots, pause) est
+    le code réel.
+    """
+    
+    def __init__(self, engine_mode="offline", latency=None, mixer=True):
+        """
+        Initialisation
+        
+        Args:
+            engine_mode (str): 'online' (gTTS simulé) ou 'offline' (pyttsx3 simulé)
+            latency (Latency, optional): Durées simulées
+            mixer (bool): Lecture par pygame simulée (hors ligne : rendu par
+                lots) ; sinon lecture directe par le moteur hors ligne
+        """
+        super().__init__(engine_mode)
+        self.latency = latency or Latency()
+        self.log = PlaybackLog()
+        self.audio_cache = None
+        self._mixer_ready = mixer
+        
+    def _init_online_engine(self):
+        """gTTS et pygame simulés"""
+        self.current_engine = "online"
+        self.gtts_available = True
+        self._mixer_ready = True
+        
+    def _init_offline_engine(self):
+        """pyttsx3 simulé"""
+        self.engine = FakeOfflineTTS(self.latency, self.log)
+        self.current_engine = "offline"
+        self.gtts_available = False
+        
+    def _ensure_mixer(self):
+        """Lecteur simulé disponible selon la configuration"""
+        return self._mixer_ready
+        
+    def _synthesize_online(self, chunk):
+        """Synthèse gTTS simulée"""
+        time.sleep(self.latency.synthesis(chunk.text))
+        return silent_mp3(self.latency.audio(chunk.text))
+        
+    def _play_audio(self, audio, audio_format):
+        """Lecture simulée : attente de la durée de l'audio (interrompue par l'arrêt)"""
+        from audio_format import audio_duration
+        
+        begin = time.perf_counter()
+        deadline = time.monotonic() + (audio_duration(audio, audio_format) or 0.0)
+        while not self.control.stopped:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self.control.wait(remaining)
+        self.log.record(begin, time.perf_counter())
+        
+    def read_pages(self, *args, **kwargs):
+        """Lecture mesurée (voir PlaybackLog.summary)"""
+        self.log.start()
+        return super().read_pages(*args, **kwargs)
\ No newline at end of file
@@ -0,0 +1,304 @@
+"""
+Suite de benchmarks : extraction, nettoyage, découpage, langue, synthèse
+Documents synthétiques reproductibles, moteurs vocaux simulés, résultats en
+JSON et comparaison avec une référence (détection des régressions)
+
+Usage :
+    python benchmarks/run_benchmarks.py [--quick] [-o resultats.json]
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Caches (texte, audio) dans un dossier temporaire : mesures à froid et
+# dossiers de l'utilisateur intacts
+WORK_DIR = tempfile.mkdtemp(prefix="pdf_reader_bench_")
+os.environ['XDG_CACHE_HOME'] = os.path.join(WORK_DIR, "cache")
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', "1")
+
+import PyPDF2
+from pdf_processor import PDFProcessor
+from language_id import LanguageIdentifier, TRAINING_TEXTS
+from sentence_index import split_sentences
+from text_cache import PageTextCache
+from synthetic_pdf import write_pdf, LAYOUTS
+from fake_tts import BenchVoiceEngine, Latency
+
+# Tailles de documents (pages) : complète et rapide
+FULL_SIZES = (10, 100, 400)
+QUICK_SIZES = (10, 50)
+
+# Écart relatif toléré avant de signaler une régression, et écart absolu
+# en dessous duquel une différence est considérée comme du bruit (s)
+DEFAULT_TOLERANCE = 0.25
+NOISE_FLOOR = 0.002
+
+def measure(function, repeat):
+    """
+    Exécute une fonction plusieurs fois
+    
+    Args:
+        function (callable): Fonction mesurée
+        repeat (int): Nombre d'exécutions
+    
+    Returns:
+        dict: Meilleur temps et temps médian (s)
+    """
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return {'best': min(times), 'median': statistics.median(times)}
+    
+def make_documents(sizes):
+    """
+    Génère les documents synthétiques
+    
+    Args:
+        sizes (tuple): Nombres de pages
+    
+    Returns:
+        dict: (mise en page, pages) -> chemin du PDF
+    """
+    directory = os.path.join(WORK_DIR, "pdf")
+    os.makedirs(directory, exist_ok=True)
+    return {
+        (layout, pages): write_pdf(os.path.join(directory, f"{layout}_{pages}.pdf"), pages, layout)
+        for layout in LAYOUTS
+        for pages in sizes
+    }
+    
+def bench_extraction(documents, repeat):
+    """Extraction complète (extract_text) : à froid, puis depuis le cache de texte"""
+    results = {}
+    for (layout, pages), path in documents.items():
+        def cold():
+            processor = PDFProcessor(use_text_cache=False)
+            processor.extract_text(path)
+            processor.close()
+        results[f"extract_text.cold.{layout}.{pages}"] = measure(cold, repeat)
+        
+        cache = PageTextCache(os.path.join(WORK_DIR, f"text_{layout}_{pages}.sqlite3"))
+        PDFProcessor(text_cache=cache).extract_text(path)
+        def warm():
+            processor = PDFProcessor(text_cache=cache)
+            processor.extract_text(path)
+            processor.close()
+        results[f"extract_text.warm.{layout}.{pages}"] = measure(warm, repeat)
+        cache.close()
+    return results
+    
+def raw_pages(path):
+    """Texte brut (non nettoyé) des pages d'un PDF"""
+    with open(path, 'rb') as file:
+        return [page.extract_text() or "" for page in PyPDF2.PdfReader(file).pages]
+        
+def bench_text(documents, repeat):
+    """Nettoyage, découpage en phrases et détection de la langue (plus grand document)"""
+    processor = PDFProcessor(use_text_cache=False)
+    engine = BenchVoiceEngine()
+    results = {}
+    largest = max(pages for _, pages in documents)
+    
+    for layout in LAYOUTS:
+        raw = raw_pages(documents[(layout, largest)])
+        cleaned = [processor._clean_text(page) for page in raw]
+        text = "\n\n".join(cleaned)
+        
+        results[f"clean_text.{layout}.{largest}"] = measure(
+            lambda: [processor._clean_text(page) for page in raw], repeat
+        )
+        results[f"split_sentences.{layout}.{largest}"] = measure(
+            lambda: engine._split_into_sentences(text), repeat
+        )
+        
+        # Identifiant neuf à chaque mesure : sans les décisions mémorisées
+        results[f"detect_language.{layout}.{largest}"] = measure(
+            lambda: LanguageIdentifier(TRAINING_TEXTS).sentence_languages(
+                (sentence for _, _, sentence in split_sentences(text)), default='fr'),
+            repeat
+        )
+    processor.close()
+    return results
+    
+# Page mêlant français et anglais (texte nettoyé : une seule ligne) et
+# langue attendue de chaque phrase
+MIXED_PAGE = (
+    ("fr", "Le lecteur ouvre le document et lit chaque page à voix haute."),
+    ("fr", "Bonjour tout le monde."),
+    ("en", "The following paragraph was written in English by the author."),
+    ("en", "It explains how the figures were collected during the year."),
+    ("en", "See you tomorrow."),
+    ("fr", "Nous revenons ensuite au texte principal du rapport annuel."),
+    ("fr", "Merci beaucoup.")
+)
+
+def check_languages():
+    """
+    Vérifie la langue de chaque phrase d'une page bilingue et le découpage
+    des blocs gTTS à chaque changement de langue
+    
+    Returns:
+        list: Anomalies constatées (vide si tout est correct)
+    """
+    engine = BenchVoiceEngine()
+    expected = {sentence: lang for lang, sentence in MIXED_PAGE}
+    text = " ".join(sentence for _, sentence in MIXED_PAGE)
+    
+    errors = []
+    units = list(engine._page_units([(1, text)], 1, 1))
+    for unit in units:
+        if unit.lang != expected.get(unit.text):
+            errors.append(f"langue {unit.lang} pour « {unit.text} » ({expected.get(unit.text)} attendu)")
+            
+    for chunk in engine._online_chunks(units):
+        languages = {expected.get(unit.text) for unit in chunk.units}
+        if languages != {chunk.lang}:
+            errors.append(f"bloc {chunk.lang} mêlant {sorted(map(str, languages))} : « {chunk.text} »")
+    return errors
+    
+def bench_playback(documents, repeat, pages=2):
+    """
+    Lecture de bout en bout avec moteurs simulés : délai avant le premier
+    audio et silences entre deux audios
+    """
+    path = documents[("prose", min(size for _, size in documents))]
+    configurations = {
+        'online': dict(engine_mode="online"),
+        'offline_batched': dict(engine_mode="offline", mixer=True),
+        'offline_direct': dict(engine_mode="offline", mixer=False)
+    }
+    results = {}
+    for name, options in configurations.items():
+        runs = []
+        for _ in range(repeat):
+            processor = PDFProcessor(use_text_cache=False)
+            engine = BenchVoiceEngine(latency=Latency(), **options)
+            first, last = processor.get_page_range(path, 1, pages)
+            started = time.perf_counter()
+            engine.read_pages(processor.iter_pages(path, first, last), first, last)
+            summary = engine.log.summary()
+            summary['total'] = time.perf_counter() - started
+            runs.append(summary)
+            processor.close()
+            
+        for metric in ('time_to_first_audio', 'gap_mean', 'gap_p95', 'gap_max', 'total'):
+            values = [run[metric] for run in runs if run[metric] is not None]
+            if values:
+                results[f"playback.{name}.{metric}"] = {
+                    'best': min(values), 'median': statistics.median(values)
+                }
+    return results
+    
+def compare(results, baseline, tolerance):
+    """
+    Compare les résultats à une référence (temps médians)
+    
+    Args:
+        results (dict): Résultats courants
+        baseline (dict): Résultats de référence
+        tolerance (float): Écart relatif toléré
+    
+    Returns:
+        list: Régressions (nom, référence, valeur, rapport)
+    """
+    regressions = []
+    for name, reference in sorted(baseline.items()):
+        current = results.get(name)
+        if current is None:
+            continue
+        before, after = reference['median'], current['median']
+        ratio = after / before if before else float('inf')
+        marker = ""
+        if after - before > NOISE_FLOOR and ratio > 1 + tolerance:
+            regressions.append((name, before, after, ratio))
+            marker = "  ⚠ régression"
+        print(f"{name:<48} {before * 1000:10.2f} ms → {after * 1000:10.2f} ms  x{ratio:.2f}{marker}")
+    return regressions
+    
+def main(argv=None):
+    """
+    Point d'entrée en ligne de commande
+    
+    Args:
+        argv (list, optional): Arguments (par défaut ceux du processus)
+    
+    Returns:
+        int: Code de sortie (1 en cas de régression ou d'erreur de langue)
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks du lecteur PDF vocal")
+    parser.add_argument('--quick', action='store_true',
+                        help="Documents plus petits et moins de répétitions")
+    parser.add_argument('-r', '--repeat', type=int, default=None,
+                        help="Nombre de répétitions de chaque mesure")
+    parser.add_argument('-o', '--output', default="benchmark_results.json",
+                        help="Fichier JSON des résultats")
+    parser.add_argument('--baseline',
+                        help="Résultats de référence (JSON) à comparer")
+    parser.add_argument('--save-baseline',
+                        help="Enregistre aussi les résultats comme référence")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Écart relatif toléré (par défaut : 0.25)")
+    args = parser.parse_args(argv)
+    
+    sizes = QUICK_SIZES if args.quick else FULL_SIZES
+    repeat = args.repeat or (2 if args.quick else 5)
+    
+    errors = check_languages()
+    for error in errors:
+        print(f"⚠ Détection de la langue : {error}")
+    if not errors:
+        print("✓ Langues d'une page bilingue")
+        
+    try:
+        documents = make_documents(sizes)
+        results = {}
+        for label, bench in (("Extraction", bench_extraction),
+                             ("Texte", bench_text),
+                             ("Lecture", bench_playback)):
+            started = time.perf_counter()
+            results.update(bench(documents, repeat))
+            print(f"✓ {label} ({time.perf_counter() - started:.1f} s)")
+    finally:
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
+        
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'date': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'quick': args.quick,
+            'repeat': repeat
+        },
+        'results': results
+    }
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"✓ Résultats enregistrés dans {path}")
+        
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n⚠ {len(regressions)} régression(s) au-delà de {args.tolerance:.0%}")
+            return 1
+        print("\n✓ Aucune régression")
+    return 1 if errors else 0
+    
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+Génération de PDF synthétiques pour les benchmarks
+Documents reproductibles (graine fixe) de taille et de mise en page variables,
+écrits sans dépendance (objets PDF minimaux, police Helvetica)
+"""
+
+import random
+
+# Mises en page disponibles
+LAYOUTS = ("prose", "columns", "headers", "multilingual")
+
+# Vocabulaire par langue (accents compris : encodage WinAnsi)
+VOCABULARY = {
+    'fr': ("le lecteur vocal lit chaque page du document avec une voix claire et "
+           "respecte la ponctuation des phrases où les données de l'année été "
+           "présentées au comité économique rapport annuel très détaillé").split(),
+    'en': ("the reader speaks every page of the document with a clear voice and "
+           "follows the punctuation of sentences where the yearly figures were "
+           "presented to the board in a detailed annual report").split(),
+    'de': ("der Leser spricht jede Seite des Dokuments mit einer klaren Stimme und "
+           "beachtet die Zeichensetzung der Sätze über die Zahlen des Jahres im "
+           "ausführlichen Bericht für den Vorstand").split()
+}
+
+# Dimensions d'une page A4 (points) et interlignage
+PAGE_WIDTH = 595
+PAGE_HEIGHT = 842
+LEADING = 14
+
+def _sentence(rng, lang):
+    """Phrase aléatoire (majuscule initiale, ponctuation finale)"""
+    words = [rng.choice(VOCABULARY[lang]) for _ in range(rng.randint(5, 18))]
+    if rng.random() < 0.3:
+        words[rng.randrange(1, len(words))] += ","
+    text = " ".join(words)
+    return text[0].upper() + text[1:] + rng.choice(".....!?")
+    
+def _paragraph_lines(rng, lang, width):
+    """
+    Lignes d'un paragraphe, coupées à `width` caractères (avec parfois un
+    mot coupé en fin de ligne)
+    """
+    words = " ".join(_sentence(rng, lang) for _ in range(rng.randint(2, 6))).split()
+    lines = []
+    line = ""
+    for word in words:
+        if line and len(line) + 1 + len(word) > width:
+            if len(word) > 6 and rng.random() < 0.15:
+                cut = len(word) // 2
+                lines.append(f"{line} {word[:cut]}-")
+                line = word[cut:]
+                continue
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}" if line else word
+    if line:
+        lines.append(line)
+    return lines
+    
+def _escape(text):
+    """Chaîne littérale PDF (encodage WinAnsi)"""
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return escaped.encode("cp1252", errors="replace")
+    
+def _text_block(lines, x, y):
+    """Opérateurs d'un bloc de texte commençant en (x, y)"""
+    ops = [b"BT /F1 11 Tf %d TL %d %d Td" % (LEADING, x, y)]
+    ops.extend(b"(" + _escape(line) + b") Tj T*" for line in lines)
+    ops.append(b"ET")
+    return b"\n".join(ops)
+    
+def _page_content(rng, layout, page_number, lines_per_page):
+    """
+    Contenu d'une page selon la mise en page
+    
+    Args:
+        rng (random.Random): Générateur
+        layout (str): Mise en page (voir LAYOUTS)
+        page_number (int): Numéro de la page
+        lines_per_page (int): Nombre de lignes de texte de la page
+    
+    Returns:
+        bytes: Flux de contenu de la page
+    """
+    def body(lang_of, width, count):
+        lines = []
+        paragraph = 0
+        while len(lines) < count:
+            lines.extend(_paragraph_lines(rng, lang_of(paragraph), width))
+            lines.append("")
+            paragraph += 1
+        return lines[:count]
+        
+    top = PAGE_HEIGHT - 60
+    if layout == "columns":
+        half = lines_per_page // 2
+        left = body(lambda _: 'fr', 40, half)
+        right = body(lambda _: 'fr', 40, lines_per_page - half)
+        return _text_block(left, 50, top) + b"\n" + _text_block(right, 310, top)
+        
+    if layout == "multilingual":
+        languages = ('fr', 'en', 'de')
+        return _text_block(body(lambda i: languages[i % 3], 85, lines_per_page), 50, top)
+        
+    lines = body(lambda _: 'fr', 85, lines_per_page)
+    if layout == "headers":
+        # En-tête et pied de page répétés sur chaque page
+        lines = ["Rapport annuel 2024 - Direction financière", ""] + lines
+        lines += ["", f"Page {page_number}"]
+    return _text_block(lines, 50, top)
+    
+def write_pdf(path, pages, layout="prose", lines_per_page=40, seed=0):
+    """
+    Écrit un PDF synthétique
+    
+    Args:
+        path (str): Fichier à écrire
+        pages (int): Nombre de pages
+        layout (str): Mise en page (voir LAYOUTS)
+        lines_per_page (int): Lignes de texte par page
+        seed (int): Graine du générateur (même graine : même document)
+    
+    Returns:
+        str: Chemin du fichier écrit
+    """
+    if layout not in LAYOUTS:
+        raise Exception(f"Erreur: mise en page inconnue '{layout}'")
+        
+    rng = random.Random(f"{seed}:{layout}:{pages}")
+    
+    # Objets : 1 catalogue, 2 arbre des pages, 3 police, puis page et contenu
+    objects = {}
+    kids = []
+    for index in range(pages):
+        page_id = 4 + 2 * index
+        content_id = page_id + 1
+        content = _page_content(rng, layout, index + 1, lines_per_page)
+        kids.append(page_id)
+        objects[page_id] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % (PAGE_WIDTH, PAGE_HEIGHT, content_id)
+        )
+        objects[content_id] = (
+            b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream"
+        )
+    objects[1] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[2] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids)
+    )
+    objects[3] = (b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+                  b"/Encoding /WinAnsiEncoding >>")
+    
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = len(output)
+        output += b"%d 0 obj\n" % object_id + objects[object_id] + b"\nendobj\n"
+        
+    count = max(objects) + 1
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % count
+    for object_id in range(1, count):
+        output += b"%010d 00000 n \n" % offsets[object_id]
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (count, xref)
+    
+    with open(path, 'wb') as file:
+        file.write(output)
+    return path
\ No newline at end of file
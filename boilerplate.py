@@ -0,0 +1,159 @@
+"""
+Détection des en-têtes et pieds de page répétés
+Lignes présentes en haut ou en bas de nombreuses pages (titre courant,
+numéro de page...) retirées du texte avant la synthèse
+"""
+
+import re
+from collections import Counter
+
+# Suites de chiffres (numéros de page, dates) : "Page 12" et "Page 13" se
+# comparent comme "page #"
+_DIGITS = re.compile(r'\d+')
+_SPACES = re.compile(r'\s+')
+
+def normalize_line(line):
+    """
+    Forme comparable d'une ligne (chiffres remplacés, espaces et casse
+    uniformisés)
+    
+    Args:
+        line (str): Ligne de texte brut
+    
+    Returns:
+        str: Ligne normalisée ("" pour une ligne vide)
+    """
+    return _SPACES.sub(' ', _DIGITS.sub('#', line)).strip().lower()
+    
+def _edge_keys(text, edge_lines):
+    """
+    Lignes normalisées du haut et du bas d'une page
+    
+    Args:
+        text (str): Texte brut de la page
+        edge_lines (int): Nombre de lignes non vides examinées à chaque bord
+    
+    Returns:
+        tuple: (ensemble des lignes du haut, ensemble des lignes du bas)
+    """
+    keys = [key for key in map(normalize_line, text.split('\n')) if key]
+    return set(keys[:edge_lines]), set(keys[-edge_lines:])
+    
+class BoilerplateFilter:
+    """Retire d'une page les lignes répétitives de ses bords"""
+    
+    def __init__(self, top=(), bottom=(), edge_lines=3):
+        """
+        Initialisation
+        
+        Args:
+            top (iterable): Lignes normalisées à retirer en haut de page
+            bottom (iterable): Lignes normalisées à retirer en bas de page
+            edge_lines (int): Nombre maximal de lignes retirées à chaque bord
+        """
+        self.top = frozenset(top)
+        self.bottom = frozenset(bottom)
+        self.edge_lines = edge_lines
+        
+    def __bool__(self):
+        """Vrai si au moins une ligne répétitive a été trouvée"""
+        return bool(self.top or self.bottom)
+        
+    def strip(self, text):
+        """
+        Retire les lignes répétitives du haut et du bas d'une page
+        
+        Seules les lignes consécutives à partir de chaque bord sont retirées
+        (les lignes vides intercalées sont ignorées) : une ligne identique au
+        milieu du texte est conservée.
+        
+        Args:
+            text (str): Texte brut de la page
+        
+        Returns:
+            str: Texte sans en-tête ni pied de page
+        """
+        if not self or not text:
+            return text
+            
+        lines = text.split('\n')
+        first, last = 0, len(lines)
+        
+        removed = 0
+        position = first
+        while position < last and removed < self.edge_lines:
+            key = normalize_line(lines[position])
+            if key:
+                if key not in self.top:
+                    break
+                removed += 1
+                first = position + 1
+            position += 1
+            
+        removed = 0
+        position = last - 1
+        while position >= first and removed < self.edge_lines:
+            key = normalize_line(lines[position])
+            if key:
+                if key not in self.bottom:
+                    break
+                removed += 1
+                last = position
+            position -= 1
+            
+        if first == 0 and last == len(lines):
+            return text
+        return '\n'.join(lines[first:last])
+        
+def sample_pages(total_pages, sample_size=30):
+    """
+    Pages examinées pour la détection, réparties sur tout le document
+    
+    Args:
+        total_pages (int): Nombre de pages du document
+        sample_size (int): Nombre maximal de pages examinées
+    
+    Returns:
+        list: Numéros de pages croissants (1-indexed)
+    """
+    if total_pages <= sample_size:
+        return list(range(1, total_pages + 1))
+    step = total_pages / sample_size
+    return sorted({int(index * step) + 1 for index in range(sample_size)})
+    
+def detect_boilerplate(page_texts, edge_lines=3, min_ratio=0.4, min_pages=4):
+    """
+    Trouve les lignes répétées aux bords des pages
+    
+    Une table de fréquence par bord compte, pour chaque ligne normalisée,
+    le nombre de pages où elle apparaît parmi les premières (ou dernières)
+    lignes. Les lignes présentes sur au moins `min_ratio` des pages sont
+    considérées comme des en-têtes ou pieds de page. Le seuil tolère les
+    titres courants alternés des pages paires et impaires.
+    
+    Args:
+        page_texts (list): Textes bruts d'un échantillon de pages
+        edge_lines (int): Nombre de lignes examinées à chaque bord
+        min_ratio (float): Proportion minimale de pages
+        min_pages (int): En dessous de ce nombre de pages, rien n'est détecté
+    
+    Returns:
+        BoilerplateFilter: Filtre du document (vide si rien n'est détecté)
+    """
+    pages = [text for text in page_texts if text and text.strip()]
+    if len(pages) < min_pages:
+        return BoilerplateFilter(edge_lines=edge_lines)
+        
+    top_counts = Counter()
+    bottom_counts = Counter()
+    for text in pages:
+        top, bottom = _edge_keys(text, edge_lines)
+        top_counts.update(top)
+        bottom_counts.update(bottom)
+        
+    threshold = max(2, min_ratio * len(pages))
+    return BoilerplateFilter(
+        (key for key, count in top_counts.items() if count >= threshold),
+        (key for key, count in bottom_counts.items() if count >= threshold),
+        edge_lines
+    )
\ No newline at end of file
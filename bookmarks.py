@@ -0,0 +1,103 @@
+"""
+Marque-pages de lecture
+Dernière position lue de chaque document, conservée d'une session à l'autre
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from app_paths import user_data_dir
+
+class BookmarkStore:
+    """Positions de lecture par document (fichier JSON, clé : empreinte du contenu)"""
+    
+    def __init__(self, path=None, max_entries=500):
+        """
+        Initialisation du stockage des marque-pages
+        
+        Args:
+            path (str, optional): Fichier JSON des marque-pages
+                (par défaut dans le dossier de données utilisateur)
+            max_entries (int): Nombre maximal de documents conservés (les
+                plus anciens sont oubliés)
+        """
+        if path is None:
+            path = os.path.join(user_data_dir(), "bookmarks.json")
+            
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._bookmarks = self._load()
+        
+    def get(self, content_hash):
+        """
+        Obtient la position enregistrée d'un document
+        
+        Args:
+            content_hash (str): Empreinte du contenu du PDF
+        
+        Returns:
+            dict: Position ('page', 'offset', 'name', 'updated'), ou None
+        """
+        with self._lock:
+            bookmark = self._bookmarks.get(content_hash)
+            return dict(bookmark) if bookmark else None
+            
+    def save(self, content_hash, page, offset, name=None):
+        """
+        Enregistre la position de lecture d'un document
+        
+        Args:
+            content_hash (str): Empreinte du contenu du PDF
+            page (int): Page de la dernière phrase lue (1-indexed)
+            offset (int): Début de cette phrase dans le texte de la page
+            name (str, optional): Nom du fichier (affichage)
+        """
+        with self._lock:
+            self._bookmarks.pop(content_hash, None)
+            self._bookmarks[content_hash] = {
+                'page': page,
+                'offset': offset,
+                'name': name,
+                'updated': time.time()
+            }
+            
+            # Les documents les plus anciens sont oubliés
+            while len(self._bookmarks) > self.max_entries:
+                del self._bookmarks[next(iter(self._bookmarks))]
+                
+            self._write()
+            
+    def remove(self, content_hash):
+        """
+        Supprime le marque-page d'un document
+        
+        Args:
+            content_hash (str): Empreinte du contenu du PDF
+        """
+        with self._lock:
+            if self._bookmarks.pop(content_hash, None) is not None:
+                self._write()
+                
+    def _load(self):
+        """Lecture du fichier des marque-pages (du plus ancien au plus récent)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                bookmarks = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(bookmarks, dict):
+            return {}
+        return dict(sorted(bookmarks.items(), key=lambda item: item[1].get('updated', 0)))
+        
+    def _write(self):
+        """Écriture atomique du fichier des marque-pages"""
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(self.path) or '.', suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(self._bookmarks, file, indent=2, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"⚠ Marque-page non enregistré: {e}")
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+Index des chapitres d'un PDF
+Construit à partir du sommaire (signets) du document : titre, niveau et
+plage de pages de chaque entrée
+"""
+
+from collections import namedtuple
+
+# Entrée du sommaire : numéro ("7", "7.2"), titre, niveau (0 : chapitre),
+# première et dernière page (1-indexed)
+Chapter = namedtuple('Chapter', ['number', 'title', 'level', 'start_page', 'end_page'])
+
+def build_chapters(reader):
+    """
+    Construit l'index des chapitres d'un document
+    
+    Les pages des destinations sont résolues par une table (identifiant de
+    l'objet page -> numéro) construite en un seul parcours des pages, sans
+    recherche dans la liste des pages pour chaque entrée.
+    
+    Args:
+        reader (PyPDF2.PdfReader): Document ouvert
+    
+    Returns:
+        list: Chapitres (Chapter) dans l'ordre du sommaire ; les entrées
+            sans page résolue sont ignorées
+    """
+    total_pages = len(reader.pages)
+    page_numbers = {}
+    for index, page in enumerate(reader.pages):
+        reference = page.indirect_reference
+        if reference is not None:
+            page_numbers[reference.idnum] = index + 1
+            
+    entries = []
+    _flatten(reader.outline, "", 0, page_numbers, total_pages, entries)
+    
+    # Fin d'une entrée : veille de l'entrée suivante de même niveau ou de
+    # niveau supérieur (pile des entrées encore ouvertes)
+    ends = [total_pages] * len(entries)
+    open_entries = []
+    for index, (_, _, level, start) in enumerate(entries):
+        while open_entries and entries[open_entries[-1]][2] >= level:
+            previous = open_entries.pop()
+            ends[previous] = max(entries[previous][3], start - 1)
+        open_entries.append(index)
+        
+    return [
+        Chapter(number, title, level, start, end)
+        for (number, title, level, start), end in zip(entries, ends)
+    ]
+    
+def _flatten(outline, prefix, level, page_numbers, total_pages, entries):
+    """
+    Parcourt le sommaire (liste de destinations ; une liste imbriquée
+    contient les sous-entrées de la destination qui la précède)
+    
+    Args:
+        outline (list): Niveau du sommaire
+        prefix (str): Numéro de l'entrée parente ("" au premier niveau)
+        level (int): Profondeur
+        page_numbers (dict): Identifiant d'objet page -> numéro de page
+        total_pages (int): Nombre de pages du document
+        entries (list): Entrées (numéro, titre, niveau, page) complétées
+    """
+    position = 0
+    number = prefix
+    for item in outline:
+        if isinstance(item, list):
+            _flatten(item, number, level + 1, page_numbers, total_pages, entries)
+            continue
+            
+        position += 1
+        number = f"{prefix}.{position}" if prefix else str(position)
+        page = _destination_page(item, page_numbers, total_pages)
+        if page is not None:
+            title = str(item.get('/Title', '') or '').strip() or f"Chapitre {number}"
+            entries.append((number, title, level, page))
+            
+def _destination_page(destination, page_numbers, total_pages):
+    """
+    Page d'une destination du sommaire
+    
+    Returns:
+        int: Numéro de page (1-indexed), ou None si non résolue
+    """
+    try:
+        target = destination.page
+    except Exception:
+        return None
+    if isinstance(target, int):
+        # Certains producteurs indiquent directement l'index de la page
+        return target + 1 if 0 <= target < total_pages else None
+    idnum = getattr(target, 'idnum', None)
+    return page_numbers.get(idnum)
+    
+def find_chapter(chapters, number):
+    """
+    Trouve un chapitre par son numéro
+    
+    Args:
+        chapters (list): Chapitres (voir build_chapters)
+        number (str): Numéro ("7", "7.2")
+    
+    Returns:
+        Chapter: Chapitre trouvé
+    """
+    number = str(number).strip()
+    for chapter in chapters:
+        if chapter.number == number:
+            return chapter
+    raise Exception(f"Erreur: chapitre '{number}' introuvable dans le sommaire")
\ No newline at end of file
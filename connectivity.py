@@ -0,0 +1,88 @@
+"""
+Détection de la connexion Internet
+Sonde réseau exécutée hors du thread de l'interface, résultat mis en cache
+"""
+
+import socket
+import threading
+import time
+
+class ConnectivityProbe:
+    """Sonde de connexion Internet avec cache à durée de validité"""
+    
+    def __init__(self, host="8.8.8.8", port=53, timeout=2, ttl=300):
+        """
+        Initialisation de la sonde
+        
+        Args:
+            host (str): Hôte contacté (DNS Google par défaut)
+            port (int): Port contacté
+            timeout (float): Délai maximal de connexion (secondes)
+            ttl (float): Durée de validité du dernier résultat (secondes)
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.ttl = ttl
+        
+        self.last_result = None
+        self.last_check = 0.0
+        
+        self._lock = threading.Lock()
+        self._refreshing = False
+        
+    def is_fresh(self):
+        """
+        Indique si le dernier résultat est encore valide
+        
+        Returns:
+            bool: True si un résultat de moins de `ttl` secondes existe
+        """
+        return (self.last_result is not None
+                and time.monotonic() - self.last_check < self.ttl)
+        
+    def check(self):
+        """
+        Vérifie la connexion (bloquant si le résultat en cache a expiré)
+        
+        Returns:
+            bool: True si connecté, False sinon
+        """
+        with self._lock:
+            if self.is_fresh():
+                return self.last_result
+            return self._probe()
+            
+    def check_async(self, callback=None):
+        """
+        Rafraîchit le résultat dans un thread d'arrière-plan
+        
+        Args:
+            callback (callable, optional): Appelée avec le résultat (bool),
+                depuis le thread d'arrière-plan
+        """
+        def run():
+            result = self.check()
+            self._refreshing = False
+            if callback:
+                callback(result)
+                
+        # Sans rappel, inutile de lancer une seconde sonde en parallèle
+        if self._refreshing and callback is None:
+            return
+        self._refreshing = True
+        threading.Thread(target=run, daemon=True).start()
+        
+    def _probe(self):
+        """Test de connexion (appelé avec le verrou)"""
+        try:
+            # Test de connexion à Google DNS
+            connection = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            connection.close()
+            result = True
+        except OSError:
+            result = False
+            
+        self.last_result = result
+        self.last_check = time.monotonic()
+        return result
\ No newline at end of file
@@ -0,0 +1,313 @@
+"""
+Cache des documents PDF ouverts
+Un seul PdfReader analysé par document, partagé entre les appels
+"""
+
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+import PyPDF2
+from chapter_index import build_chapters
+from boilerplate import detect_boilerplate, sample_pages
+
+# Taille (octets) à partir de laquelle un PDF est projeté en mémoire (mmap)
+# plutôt que lu par un fichier tamponné. Risque : lire une projection dont le
+# fichier a été tronqué ou réécrit provoque SIGBUS (arrêt du processus) là
+# où une lecture tamponnée lève une exception. Le fichier est donc comparé à
+# son état d'ouverture avant chaque accès (voir DocumentHandle.check_file) ;
+# une modification pendant l'extraction d'une page reste possible
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+class DocumentHandle:
+    """Document PDF ouvert et analysé une seule fois"""
+    
+    def __init__(self, path, mtime, size, mmap_threshold=MMAP_THRESHOLD):
+        """
+        Ouvre et analyse le document
+        
+        Args:
+            path (str): Chemin absolu du fichier PDF
+            mtime (int): Date de modification (ns) lors de l'ouverture
+            size (int): Taille du fichier en octets
+            mmap_threshold (int): Taille à partir de laquelle le fichier est
+                projeté en mémoire (None : jamais)
+        """
+        self.path = path
+        self.mtime = mtime
+        self.size = size
+        
+        # PyPDF2 lit les objets à la demande : le fichier reste ouvert
+        self.file = open(path, 'rb')
+        self.mapping = None
+        try:
+            if mmap_threshold is not None and 0 < size and mmap_threshold <= size:
+                # Projection en lecture seule : les accès de PyPDF2 (nombreux
+                # déplacements, petites lectures) deviennent des lectures en
+                # mémoire, sans appel système ni tampon intermédiaire
+                self.mapping = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.reader = PyPDF2.PdfReader(self.mapping if self.mapping is not None else self.file)
+            self.page_count = len(self.reader.pages)
+        except Exception:
+            self.close()
+            raise
+            
+        # Le flux est partagé : un seul accès aux pages à la fois
+        self.lock = threading.RLock()
+        
+        # Nombre d'utilisateurs en cours (le handle n'est fermé qu'à 0)
+        self.users = 0
+        self.evicted = False
+        
+        # Index des chapitres, construit au premier besoin (voir get_chapters)
+        self.chapters = None
+        
+        # En-têtes et pieds de page (voir get_boilerplate) ; texte brut des
+        # pages examinées et durée de leur extraction, gardés pour leur
+        # extraction suivante
+        self.boilerplate = None
+        self._sampled_pages = {}
+        
+    def matches(self, mtime, size):
+        """
+        Vérifie que le fichier n'a pas changé depuis l'ouverture
+        
+        Args:
+            mtime (int): Date de modification actuelle (ns)
+            size (int): Taille actuelle
+        
+        Returns:
+            bool: True si le handle est toujours valide
+        """
+        return self.mtime == mtime and self.size == size
+        
+    def check_file(self):
+        """
+        Vérifie, pour un document projeté en mémoire, que le fichier n'a pas
+        changé depuis l'ouverture (lire la projection d'un fichier tronqué
+        arrêterait le processus)
+        """
+        if self.mapping is None:
+            return
+        try:
+            stat = os.stat(self.path)
+        except OSError as e:
+            raise Exception(f"Erreur: fichier PDF devenu inaccessible: {str(e)}")
+        if not self.matches(stat.st_mtime_ns, stat.st_size):
+            raise Exception("Erreur: le fichier PDF a été modifié pendant son utilisation")
+            
+    def extract_page_text(self, page_index):
+        """
+        Extrait le texte brut d'une page
+        
+        Args:
+            page_index (int): Index de la page (0-indexed)
+        
+        Returns:
+            str: Texte brut de la page
+        """
+        return self.extract_page(page_index)[0]
+        
+    def extract_page(self, page_index):
+        """
+        Extrait le texte brut d'une page et mesure la durée de l'extraction
+        
+        Args:
+            page_index (int): Index de la page (0-indexed)
+        
+        Returns:
+            tuple: (texte brut, durée de l'extraction PyPDF2 en secondes ;
+                pour une page déjà examinée par get_boilerplate, durée de
+                cette extraction)
+        """
+        with self.lock:
+            sampled = self._sampled_pages.pop(page_index, None)
+            if sampled is not None:
+                return sampled
+            self.check_file()
+            started = time.perf_counter()
+            text = self.reader.pages[page_index].extract_text()
+            return text, time.perf_counter() - started
+            
+    def get_boilerplate(self):
+        """
+        Obtient le filtre des en-têtes et pieds de page du document, appris
+        sur un échantillon de pages réparties dans tout le document
+        
+        Returns:
+            BoilerplateFilter: Filtre (vide si rien n'est répété)
+        """
+        with self.lock:
+            if self.boilerplate is None:
+                for page in sample_pages(self.page_count):
+                    self.check_file()
+                    started = time.perf_counter()
+                    text = self.reader.pages[page - 1].extract_text() or ''
+                    self._sampled_pages[page - 1] = (text, time.perf_counter() - started)
+                self.boilerplate = detect_boilerplate(
+                    text for text, _ in self._sampled_pages.values()
+                )
+            return self.boilerplate
+            
+    def get_chapters(self):
+        """
+        Obtient l'index des chapitres (sommaire) du document
+        
+        Returns:
+            list: Chapitres (voir chapter_index.build_chapters)
+        """
+        with self.lock:
+            if self.chapters is None:
+                self.check_file()
+                self.chapters = build_chapters(self.reader)
+            return self.chapters
+            
+    def close(self):
+        """Ferme la projection en mémoire et le fichier sous-jacent"""
+        for resource in (self.mapping, self.file):
+            if resource is None:
+                continue
+            try:
+                resource.close()
+            except Exception:
+                pass
+            
+class DocumentCache:
+    """Cache LRU des documents ouverts, borné en nombre et en mémoire"""
+    
+    def __init__(self, max_documents=4, max_bytes=256 * 1024 * 1024,
+                 mmap_threshold=MMAP_THRESHOLD):
+        """
+        Initialisation du cache
+        
+        Args:
+            max_documents (int): Nombre maximal de documents ouverts
+            max_bytes (int): Taille cumulée maximale des documents (octets),
+                utilisée comme estimation de la mémoire des lecteurs analysés
+            mmap_threshold (int): Taille à partir de laquelle un document est
+                projeté en mémoire (None : jamais). La projection appartient
+                au document ouvert : toutes les extractions du document la
+                partagent tant qu'il reste dans le cache
+        """
+        self.max_documents = max_documents
+        self.max_bytes = max_bytes
+        self.mmap_threshold = mmap_threshold
+        
+        self._handles = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        
+    @contextmanager
+    def acquire(self, pdf_path):
+        """
+        Fournit le document ouvert pour la durée d'un bloc `with`
+        
+        Le document ne peut pas être fermé par l'éviction tant qu'il est
+        utilisé.
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+        
+        Yields:
+            DocumentHandle: Document ouvert et analysé
+        """
+        handle = self._get(pdf_path)
+        try:
+            yield handle
+        finally:
+            self._release(handle)
+            
+    def get_page_count(self, pdf_path):
+        """
+        Obtient le nombre de pages d'un document (sans nouvelle analyse)
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+        
+        Returns:
+            int: Nombre de pages
+        """
+        with self.acquire(pdf_path) as handle:
+            return handle.page_count
+            
+    def invalidate(self, pdf_path):
+        """
+        Retire un document du cache
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+        """
+        key = os.path.abspath(pdf_path)
+        with self._lock:
+            handle = self._handles.pop(key, None)
+            if handle:
+                self._discard(handle)
+                
+    def clear(self):
+        """Ferme tous les documents du cache"""
+        with self._lock:
+            while self._handles:
+                _, handle = self._handles.popitem(last=False)
+                self._discard(handle)
+                
+    def _get(self, pdf_path):
+        """Obtient (ou ouvre) le document et le marque comme utilisé"""
+        key = os.path.abspath(pdf_path)
+        stat = os.stat(key)
+        
+        with self._lock:
+            handle = self._handles.get(key)
+            if handle is not None:
+                if handle.matches(stat.st_mtime_ns, stat.st_size):
+                    self._handles.move_to_end(key)
+                    handle.users += 1
+                    return handle
+                # Fichier modifié depuis l'ouverture
+                del self._handles[key]
+                self._discard(handle)
+                
+        # Analyse hors du verrou global (peut être longue)
+        handle = DocumentHandle(key, stat.st_mtime_ns, stat.st_size, self.mmap_threshold)
+        
+        with self._lock:
+            current = self._handles.get(key)
+            if current is not None and current.matches(handle.mtime, handle.size):
+                # Ouvert entre-temps par un autre thread
+                handle.close()
+                handle = current
+                self._handles.move_to_end(key)
+            else:
+                if current is not None:
+                    del self._handles[key]
+                    self._discard(current)
+                self._handles[key] = handle
+                self._total_bytes += handle.size
+                self._evict()
+            handle.users += 1
+            return handle
+            
+    def _release(self, handle):
+        """Libère un document obtenu avec _get"""
+        with self._lock:
+            handle.users -= 1
+            if handle.evicted and handle.users == 0:
+                handle.close()
+                
+    def _evict(self):
+        """Évince les documents les moins récemment utilisés"""
+        while len(self._handles) > 1 and (
+            len(self._handles) > self.max_documents
+            or self._total_bytes > self.max_bytes
+        ):
+            _, handle = self._handles.popitem(last=False)
+            self._discard(handle)
+            
+    def _discard(self, handle):
+        """Retire un document (fermé dès qu'il n'est plus utilisé)"""
+        if not handle.evicted:
+            handle.evicted = True
+            self._total_bytes -= handle.size
+        if handle.users == 0:
+            handle.close()
\ No newline at end of file
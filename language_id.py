@@ -0,0 +1,302 @@
+"""
+Identification de la langue d'un texte
+Profils de trigrammes de caractères, décision par phrase mémorisée
+"""
+
+import math
+import re
+import threading
+from array import array
+from collections import Counter
+from functools import lru_cache
+
+# Textes d'apprentissage des profils (prose courante, codes de langue gTTS)
+TRAINING_TEXTS = {
+    'fr': (
+        "Le rapport annuel présente les résultats de la société et les perspectives "
+        "pour les années à venir. Dans un contexte économique difficile, les équipes "
+        "ont su maintenir la qualité du service tout en réduisant les coûts. Il est "
+        "important de noter que la croissance du chiffre d'affaires provient surtout "
+        "des nouveaux marchés. Nous avons également investi dans la formation des "
+        "salariés, car c'est une priorité pour l'entreprise. Les clients qui nous font "
+        "confiance depuis longtemps attendent des produits plus simples et moins chers. "
+        "Cette année, le conseil d'administration a décidé de poursuivre la stratégie "
+        "engagée, avec une attention particulière portée à l'environnement. Chaque "
+        "chapitre de ce document décrit une partie de l'activité, ses enjeux et les "
+        "mesures prises pour atteindre nos objectifs. Vous trouverez à la fin une "
+        "synthèse des chiffres clés ainsi que les comptes détaillés de l'exercice."
+    ),
+    'en': (
+        "The annual report presents the results of the company and the outlook for "
+        "the coming years. In a difficult economic context, the teams were able to "
+        "maintain the quality of service while reducing costs. It is important to note "
+        "that the growth in revenue comes mainly from new markets. We have also invested "
+        "in the training of our employees, because this is a priority for the business. "
+        "Customers who have trusted us for a long time expect simpler and cheaper "
+        "products. This year, the board of directors decided to pursue the strategy that "
+        "was already under way, with particular attention paid to the environment. Each "
+        "chapter of this document describes one part of the activity, what is at stake "
+        "and the measures taken to reach our goals. At the end you will find a summary "
+        "of the key figures together with the detailed accounts for the year."
+    ),
+    'de': (
+        "Der Jahresbericht stellt die Ergebnisse des Unternehmens und die Aussichten "
+        "für die kommenden Jahre vor. In einem schwierigen wirtschaftlichen Umfeld ist "
+        "es den Teams gelungen, die Qualität der Dienstleistungen zu erhalten und "
+        "gleichzeitig die Kosten zu senken. Es ist wichtig zu beachten, dass das "
+        "Wachstum des Umsatzes vor allem aus neuen Märkten stammt. Wir haben auch in "
+        "die Ausbildung der Mitarbeiter investiert, weil dies für das Unternehmen eine "
+        "Priorität ist. Kunden, die uns seit langer Zeit vertrauen, erwarten einfachere "
+        "und günstigere Produkte. In diesem Jahr hat der Vorstand beschlossen, die "
+        "begonnene Strategie fortzusetzen, mit besonderer Aufmerksamkeit für die Umwelt. "
+        "Jedes Kapitel dieses Dokuments beschreibt einen Teil der Tätigkeit, die damit "
+        "verbundenen Herausforderungen und die Maßnahmen, die wir ergriffen haben. Am "
+        "Ende finden Sie eine Zusammenfassung der wichtigsten Zahlen."
+    ),
+    'es': (
+        "El informe anual presenta los resultados de la empresa y las perspectivas "
+        "para los próximos años. En un contexto económico difícil, los equipos han "
+        "sabido mantener la calidad del servicio y al mismo tiempo reducir los costes. "
+        "Es importante señalar que el crecimiento de las ventas procede sobre todo de "
+        "los nuevos mercados. También hemos invertido en la formación de los "
+        "empleados, porque es una prioridad para la compañía. Los clientes que confían "
+        "en nosotros desde hace mucho tiempo esperan productos más sencillos y más "
+        "baratos. Este año, el consejo de administración decidió continuar con la "
+        "estrategia iniciada, con una atención especial al medio ambiente. Cada "
+        "capítulo de este documento describe una parte de la actividad, sus retos y "
+        "las medidas adoptadas para alcanzar nuestros objetivos. Al final encontrará "
+        "un resumen de las cifras clave y las cuentas detalladas del ejercicio."
+    ),
+    'it': (
+        "La relazione annuale presenta i risultati della società e le prospettive per "
+        "gli anni a venire. In un contesto economico difficile, le squadre sono "
+        "riuscite a mantenere la qualità del servizio riducendo allo stesso tempo i "
+        "costi. È importante notare che la crescita del fatturato proviene soprattutto "
+        "dai nuovi mercati. Abbiamo anche investito nella formazione dei dipendenti, "
+        "perché questa è una priorità per l'azienda. I clienti che ci danno fiducia da "
+        "molto tempo si aspettano prodotti più semplici e meno cari. Quest'anno il "
+        "consiglio di amministrazione ha deciso di proseguire la strategia avviata, con "
+        "un'attenzione particolare all'ambiente. Ogni capitolo di questo documento "
+        "descrive una parte dell'attività, le sue sfide e le misure adottate per "
+        "raggiungere i nostri obiettivi. Alla fine troverete una sintesi dei dati "
+        "principali e i conti dettagliati dell'esercizio."
+    ),
+    'pt': (
+        "O relatório anual apresenta os resultados da empresa e as perspetivas para os "
+        "próximos anos. Num contexto económico difícil, as equipas conseguiram manter a "
+        "qualidade do serviço e ao mesmo tempo reduzir os custos. É importante notar "
+        "que o crescimento das vendas vem sobretudo dos novos mercados. Também "
+        "investimos na formação dos trabalhadores, porque esta é uma prioridade para a "
+        "empresa. Os clientes que confiam em nós há muito tempo esperam produtos mais "
+        "simples e mais baratos. Este ano, o conselho de administração decidiu "
+        "continuar a estratégia iniciada, com uma atenção especial ao ambiente. Cada "
+        "capítulo deste documento descreve uma parte da atividade, os seus desafios e "
+        "as medidas tomadas para atingir os nossos objetivos. No final encontrará um "
+        "resumo dos números principais e as contas detalhadas do exercício."
+    ),
+    'nl': (
+        "Het jaarverslag presenteert de resultaten van het bedrijf en de vooruitzichten "
+        "voor de komende jaren. In een moeilijke economische situatie zijn de teams erin "
+        "geslaagd de kwaliteit van de dienstverlening te behouden en tegelijk de kosten "
+        "te verlagen. Het is belangrijk om op te merken dat de groei van de omzet vooral "
+        "uit nieuwe markten komt. We hebben ook geïnvesteerd in de opleiding van de "
+        "medewerkers, omdat dit een prioriteit is voor de onderneming. Klanten die ons "
+        "al lang vertrouwen, verwachten eenvoudigere en goedkopere producten. Dit jaar "
+        "heeft de raad van bestuur besloten de ingezette strategie voort te zetten, met "
+        "bijzondere aandacht voor het milieu. Elk hoofdstuk van dit document beschrijft "
+        "een deel van de activiteit, de uitdagingen en de maatregelen die zijn genomen "
+        "om onze doelen te bereiken. Aan het einde vindt u een samenvatting van de "
+        "belangrijkste cijfers en de gedetailleerde rekeningen van het jaar."
+    )
+}
+
+# Tout ce qui n'est pas une lettre sépare les mots
+_NON_LETTERS = re.compile(r"[\W\d_]+")
+
+def _trigrams(text):
+    """
+    Trigrammes de caractères d'un texte normalisé (minuscules, lettres seules)
+    
+    Args:
+        text (str): Texte
+    
+    Returns:
+        list: Trigrammes, espaces de début et de fin de mot compris
+    """
+    normalized = f" {_NON_LETTERS.sub(' ', text.lower()).strip()} "
+    return [normalized[i:i + 3] for i in range(len(normalized) - 2)]
+    
+class LanguageIdentifier:
+    """Identification de la langue par profils de trigrammes (Bayes naïf)"""
+    
+    def __init__(self, training_texts=None, min_letters=20, max_chars=4000,
+                 cache_size=4096, sentence_min_letters=8, switch_penalty=3.0):
+        """
+        Initialisation et calcul des profils
+        
+        Args:
+            training_texts (dict, optional): Code de langue -> texte
+                d'apprentissage (par défaut TRAINING_TEXTS)
+            min_letters (int): En dessous de ce nombre de lettres, la langue
+                est jugée indéterminée
+            max_chars (int): Seul le début des longs textes est analysé
+            cache_size (int): Nombre de décisions mémorisées
+            sentence_min_letters (int): En dessous de ce nombre de lettres,
+                une phrase prend la langue de la phrase précédente
+            switch_penalty (float): Écart de log-vraisemblance exigé d'une
+                phrase pour quitter la langue de la précédente
+        """
+        training_texts = training_texts or TRAINING_TEXTS
+        self.languages = list(training_texts)
+        self.min_letters = min_letters
+        self.max_chars = max_chars
+        self.sentence_min_letters = sentence_min_letters
+        self.switch_penalty = switch_penalty
+        self._slots = {lang: i for i, lang in enumerate(self.languages)}
+        
+        # Vocabulaire commun : trigramme -> indice ; le dernier indice
+        # représente tous les trigrammes inconnus
+        counts = {lang: Counter(_trigrams(text)) for lang, text in training_texts.items()}
+        vocabulary = sorted(set().union(*counts.values()))
+        self._index = {trigram: i for i, trigram in enumerate(vocabulary)}
+        unseen = len(vocabulary)
+        
+        # Profil de chaque langue : log-probabilités lissées (Laplace),
+        # dans un tableau indexé comme le vocabulaire
+        self._profiles = []
+        for lang in self.languages:
+            total = sum(counts[lang].values()) + unseen + 1
+            profile = array('d', [math.log(1 / total)]) * (unseen + 1)
+            for trigram, count in counts[lang].items():
+                profile[self._index[trigram]] = math.log((count + 1) / total)
+            self._profiles.append(profile)
+            
+        self._detect_cached = lru_cache(maxsize=cache_size)(self._detect)
+        self._sentence_scores = lru_cache(maxsize=cache_size)(self._totals)
+        
+    def scores(self, text):
+        """
+        Calcule le score de chaque langue
+        
+        Args:
+            text (str): Texte à analyser
+        
+        Returns:
+            dict: Code de langue -> log-vraisemblance moyenne par trigramme
+        """
+        indices = self._indices(text)
+        if not indices:
+            return {}
+        # Somme des log-probabilités : un parcours en C par langue
+        return {
+            lang: sum(map(profile.__getitem__, indices)) / len(indices)
+            for lang, profile in zip(self.languages, self._profiles)
+        }
+        
+    def _indices(self, text):
+        """Indices des trigrammes d'un texte dans le vocabulaire"""
+        unseen = len(self._index)
+        return [self._index.get(trigram, unseen) for trigram in _trigrams(text[:self.max_chars])]
+        
+    def _totals(self, sentence):
+        """
+        Log-vraisemblance totale d'une phrase pour chaque langue (calculée
+        une fois par phrase distincte)
+        
+        Returns:
+            tuple: Un total par langue (ordre de `languages`), ou None si la
+                phrase est trop courte
+        """
+        letters = sum(1 for char in sentence if char.isalpha())
+        if letters < self.sentence_min_letters:
+            return None
+        indices = self._indices(sentence)
+        return tuple(sum(map(profile.__getitem__, indices)) for profile in self._profiles)
+        
+    def detect(self, text, default=None):
+        """
+        Détecte la langue d'un texte (décision mémorisée)
+        
+        Args:
+            text (str): Texte à analyser
+            default (str, optional): Langue rendue si le texte est trop court
+        
+        Returns:
+            str: Code de langue ('fr', 'en', 'de', ...) ou `default`
+        """
+        lang = self._detect_cached(text[:self.max_chars])
+        return lang if lang is not None else default
+        
+    def _detect(self, text):
+        """Décision pour un texte (appelée une fois par texte distinct)"""
+        letters = sum(1 for char in text if char.isalpha())
+        if letters < self.min_letters:
+            return None
+        scores = self.scores(text)
+        return max(scores, key=scores.get) if scores else None
+        
+    def sentence_languages(self, sentences, default=None, context=None):
+        """
+        Détecte la langue de chaque phrase d'un texte
+        
+        Chaque phrase est jugée seule (scores mémorisés), mais ne quitte la
+        langue de la phrase précédente que si une autre langue l'emporte
+        nettement (`switch_penalty`) : une phrase anglaise au milieu d'une
+        page française est reconnue, une phrase courte et ambiguë garde la
+        langue du contexte. Une phrase trop courte pour être identifiée
+        (titre, numéro) prend la langue de la précédente, ou à défaut celle
+        de la première phrase identifiée.
+        
+        Args:
+            sentences (iterable): Phrases, dans l'ordre du texte
+            default (str, optional): Langue si rien n'est identifiable
+            context (str, optional): Langue précédant la première phrase
+                (dernière phrase de la page précédente)
+        
+        Returns:
+            list: Code de langue de chaque phrase
+        """
+        languages = []
+        for sentence in sentences:
+            totals = self._sentence_scores(sentence[:self.max_chars])
+            if totals is not None:
+                best = max(range(len(totals)), key=totals.__getitem__)
+                current = self._slots.get(context)
+                if current is None or totals[best] - totals[current] > self.switch_penalty:
+                    context = self.languages[best]
+            languages.append(context)
+            
+        # Phrases trop courtes en tête : langue de la première identifiée
+        first = next((lang for lang in languages if lang is not None), default)
+        return [lang if lang is not None else first for lang in languages]
+        
+    def cache_info(self):
+        """
+        Statistiques de la mémorisation des décisions
+        
+        Returns:
+            dict: Succès, échecs et nombre de décisions mémorisées
+        """
+        infos = (self._detect_cached.cache_info(), self._sentence_scores.cache_info())
+        return {
+            'hits': sum(info.hits for info in infos),
+            'misses': sum(info.misses for info in infos),
+            'size': sum(info.currsize for info in infos)
+        }
+        
+# Instance partagée (profils calculés à la première utilisation)
+_shared_identifier = None
+_shared_lock = threading.Lock()
+
+def get_identifier():
+    """
+    Obtient l'identificateur de langue partagé
+    
+    Returns:
+        LanguageIdentifier: Instance commune à toute l'application
+    """
+    global _shared_identifier
+    with _shared_lock:
+        if _shared_identifier is None:
+            _shared_identifier = LanguageIdentifier()
+        return _shared_identifier
\ No newline at end of file
@@ -4,11 +4,26 @@ Application principale
 Auteur: Assistant Claude
 """
 
-import customtkinter as ctk
-from pdf_reader_gui import PDFReaderGUI
+import os
+import sys
 
 def main():
     """Point d'entrée principal de l'application"""
+    # Mode profilage : --profile (ou --profile=DOSSIER), transmis aux
+    # processus fils par la variable d'environnement (voir profiling.py)
+    for argument in list(sys.argv[1:]):
+        if argument == "--profile" or argument.startswith("--profile="):
+            sys.argv.remove(argument)
+            os.environ["PDF_READER_PROFILE"] = argument.partition("=")[2] or "1"
+            
+    # Mode en lot, sans interface graphique : python main.py batch ...
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from batch_renderer import main as batch_main
+        sys.exit(batch_main(sys.argv[2:]))
+        
+    import customtkinter as ctk
+    from pdf_reader_gui import PDFReaderGUI
+    
     # Configuration du thème
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("blue")
@@ -16,6 +31,6 @@ def main():
     # Création et lancement de l'application
     app = PDFReaderGUI()
     app.mainloop()
-
+    
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,401 @@
+"""
+Mesures de performance de la chaîne de lecture
+Compteurs, jauges et histogrammes à faible coût, exportés en JSON ou au
+format texte de Prometheus
+"""
+
+import json
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+
+# Bornes des histogrammes de durées (s) : de 1 ms à 30 s
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Nombre de valeurs récentes conservées par histogramme (centiles)
+RECENT_VALUES = 512
+
+def _series_name(name, labels):
+    """
+    Nom d'une série ("nom" ou "nom{cle=\"valeur\"}")
+    
+    Args:
+        name (str): Nom de la mesure
+        labels (tuple): Couples (clé, valeur) triés
+    
+    Returns:
+        str: Nom de la série, au format Prometheus
+    """
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+    
+class Counter:
+    """Compteur croissant (événements, octets...)"""
+    
+    kind = "counter"
+    
+    def __init__(self):
+        """Initialisation à zéro"""
+        self.value = 0
+        self._lock = threading.Lock()
+        
+    def reset(self):
+        """Remise à zéro"""
+        with self._lock:
+            self.value = 0
+            
+    def inc(self, amount=1):
+        """
+        Incrémente le compteur
+        
+        Args:
+            amount (int): Valeur ajoutée
+        """
+        with self._lock:
+            self.value += amount
+            
+    def snapshot(self):
+        """Valeur courante"""
+        return self.value
+        
+class Gauge:
+    """Valeur instantanée (profondeur d'une file...)"""
+    
+    kind = "gauge"
+    
+    def __init__(self):
+        """Initialisation à zéro"""
+        self.value = 0
+        
+    def reset(self):
+        """Remise à zéro"""
+        self.value = 0
+        
+    def set(self, value):
+        """
+        Fixe la valeur
+        
+        Args:
+            value (float): Nouvelle valeur
+        """
+        self.value = value
+        
+    def snapshot(self):
+        """Valeur courante"""
+        return self.value
+        
+class Histogram:
+    """
+    Distribution de valeurs (durées) : nombre, somme, extrêmes, effectifs
+    cumulés par borne et valeurs récentes pour les centiles
+    """
+    
+    kind = "histogram"
+    
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        Initialisation
+        
+        Args:
+            buckets (tuple): Bornes supérieures croissantes des classes
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+        
+    def reset(self):
+        """Oublie toutes les valeurs"""
+        with self._lock:
+            self.counts = [0] * (len(self.buckets) + 1)
+            self.count = 0
+            self.sum = 0.0
+            self.max = 0.0
+            self.recent = deque(maxlen=RECENT_VALUES)
+            
+    def observe(self, value):
+        """
+        Enregistre une valeur
+        
+        Args:
+            value (float): Valeur observée
+        """
+        with self._lock:
+            self.counts[bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+            self.recent.append(value)
+            
+    def time(self):
+        """
+        Mesure la durée d'un bloc `with`
+        
+        Returns:
+            _Timer: Gestionnaire de contexte
+        """
+        return _Timer(self)
+        
+    def snapshot(self):
+        """
+        Résumé de la distribution
+        
+        Returns:
+            dict: Nombre, somme, moyenne, maximum et centiles (50, 95) des
+                valeurs récentes
+        """
+        with self._lock:
+            recent = sorted(self.recent)
+            count, total, maximum = self.count, self.sum, self.max
+            
+        def percentile(rank):
+            if not recent:
+                return 0.0
+            return recent[min(len(recent) - 1, math.ceil(rank * len(recent)) - 1)]
+            
+        return {
+            'count': count,
+            'sum': total,
+            'mean': total / count if count else 0.0,
+            'max': maximum,
+            'p50': percentile(0.5),
+            'p95': percentile(0.95)
+        }
+        
+    def cumulative_counts(self):
+        """Effectifs cumulés par borne (dernière : +Inf)"""
+        with self._lock:
+            counts = list(self.counts)
+        total = 0
+        cumulative = []
+        for count in counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+        
+class _Timer:
+    """Mesure d'une durée dans un histogramme"""
+    
+    def __init__(self, histogram):
+        """
+        Initialisation
+        
+        Args:
+            histogram (Histogram): Histogramme recevant la durée
+        """
+        self.histogram = histogram
+        self.started = None
+        
+    def __enter__(self):
+        """Début de la mesure"""
+        self.started = time.perf_counter()
+        return self
+        
+    def __exit__(self, *exc_info):
+        """Fin de la mesure (y compris sur exception)"""
+        self.histogram.observe(time.perf_counter() - self.started)
+        return False
+        
+class MetricsRegistry:
+    """Ensemble des mesures d'un processus, par nom et étiquettes"""
+    
+    def __init__(self):
+        """Initialisation d'un registre vide"""
+        # (nom, étiquettes) -> mesure ; nom -> (type, description)
+        self._metrics = {}
+        self._help = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+        
+    def _get(self, factory, name, help_text, labels):
+        """Obtient (ou crée) une série"""
+        key = (name, tuple(sorted((labels or {}).items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = factory()
+                    self._metrics[key] = metric
+                    self._help.setdefault(name, (metric.kind, help_text))
+        return metric
+        
+    def counter(self, name, help_text="", labels=None):
+        """
+        Obtient un compteur
+        
+        Args:
+            name (str): Nom de la mesure (unités en suffixe : _total, _seconds)
+            help_text (str): Description
+            labels (dict, optional): Étiquettes de la série
+        
+        Returns:
+            Counter: Compteur (le même pour un même nom et mêmes étiquettes)
+        """
+        return self._get(Counter, name, help_text, labels)
+        
+    def gauge(self, name, help_text="", labels=None):
+        """
+        Obtient une jauge (voir counter)
+        
+        Returns:
+            Gauge: Jauge
+        """
+        return self._get(Gauge, name, help_text, labels)
+        
+    def histogram(self, name, help_text="", labels=None, buckets=DEFAULT_BUCKETS):
+        """
+        Obtient un histogramme (voir counter)
+        
+        Args:
+            buckets (tuple): Bornes des classes (à la création de la série)
+        
+        Returns:
+            Histogram: Histogramme
+        """
+        return self._get(lambda: Histogram(buckets), name, help_text, labels)
+        
+    def snapshot(self, prefix=""):
+        """
+        Valeurs de toutes les séries
+        
+        Args:
+            prefix (str): Ne garde que les mesures dont le nom commence ainsi
+        
+        Returns:
+            dict: Nom de série -> valeur (ou résumé d'histogramme)
+        """
+        with self._lock:
+            items = sorted(self._metrics.items())
+        return {
+            _series_name(name, labels): metric.snapshot()
+            for (name, labels), metric in items
+            if name.startswith(prefix)
+        }
+        
+    def reset(self):
+        """
+        Remet toutes les séries à zéro (nouvelle session de mesure) ; les
+        séries gardées par les modules instrumentés restent valides
+        """
+        with self._lock:
+            for metric in self._metrics.values():
+                metric.reset()
+            self.started = time.time()
+            
+    def to_json(self):
+        """
+        Export JSON
+        
+        Returns:
+            str: Document JSON (début de la mesure et séries)
+        """
+        return json.dumps({
+            'started': time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            'uptime_seconds': time.time() - self.started,
+            'metrics': self.snapshot()
+        }, indent=2, ensure_ascii=False)
+        
+    def to_prometheus(self):
+        """
+        Export au format texte de Prometheus
+        
+        Returns:
+            str: Une ligne par série (histogrammes : classes, somme, nombre)
+        """
+        with self._lock:
+            items = sorted(self._metrics.items())
+            descriptions = dict(self._help)
+            
+        lines = []
+        described = set()
+        for (name, labels), metric in items:
+            if name not in described:
+                described.add(name)
+                kind, help_text = descriptions[name]
+                if help_text:
+                    lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                
+            if metric.kind != "histogram":
+                lines.append(f"{_series_name(name, labels)} {metric.snapshot()}")
+                continue
+                
+            bounds = [repr(bound) for bound in metric.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, metric.cumulative_counts()):
+                series = _series_name(f"{name}_bucket", labels + (('le', bound),))
+                lines.append(f"{series} {count}")
+            summary = metric.snapshot()
+            lines.append(f"{_series_name(name + '_sum', labels)} {summary['sum']}")
+            lines.append(f"{_series_name(name + '_count', labels)} {summary['count']}")
+        return "\n".join(lines) + "\n"
+        
+    def dump(self, path):
+        """
+        Écrit les mesures dans un fichier (Prometheus pour .prom et .txt,
+        JSON sinon)
+        
+        Args:
+            path (str): Fichier à écrire
+        """
+        prometheus = path.endswith(('.prom', '.txt'))
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(self.to_prometheus() if prometheus else self.to_json())
+            
+# Registre partagé par les modules du processus
+_shared_registry = None
+_shared_lock = threading.Lock()
+
+def get_registry():
+    """
+    Obtient le registre de mesures partagé
+    
+    Returns:
+        MetricsRegistry: Registre du processus
+    """
+    global _shared_registry
+    with _shared_lock:
+        if _shared_registry is None:
+            _shared_registry = MetricsRegistry()
+        return _shared_registry
+        
+def summarize(snapshot, name):
+    """
+    Résumé d'un histogramme dans un relevé, toutes étiquettes confondues
+    
+    Args:
+        snapshot (dict): Relevé (voir MetricsRegistry.snapshot)
+        name (str): Nom de l'histogramme
+    
+    Returns:
+        dict: Nombre, moyenne, 95e centile et maximum (None si absent)
+    """
+    series = [value for key, value in snapshot.items()
+              if key == name or key.startswith(name + "{")]
+    if not series:
+        return None
+    count = sum(value['count'] for value in series)
+    return {
+        'count': count,
+        'mean': sum(value['sum'] for value in series) / count if count else 0.0,
+        'p95': max(value['p95'] for value in series),
+        'max': max(value['max'] for value in series)
+    }
+    
+def total(snapshot, name):
+    """
+    Somme d'un compteur dans un relevé, toutes étiquettes confondues
+    
+    Args:
+        snapshot (dict): Relevé (voir MetricsRegistry.snapshot)
+        name (str): Nom du compteur
+    
+    Returns:
+        float: Somme des séries (0 si absent)
+    """
+    return sum(value for key, value in snapshot.items()
+               if key == name or key.startswith(name + "{"))
\ No newline at end of file
@@ -0,0 +1,355 @@
+"""
+Affichage paginé du texte d'un document
+Seule une fenêtre de pages autour de la zone visible est placée dans la zone
+de texte : la mémoire et le coût d'affichage ne dépendent pas de la taille
+du document
+"""
+
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+
+# Séparateur des pages dans le texte affiché (comme PDFProcessor.extract_text)
+PAGE_SEPARATOR = "\n\n"
+
+class PagedTextView:
+    """Fenêtre glissante de pages dans une zone de texte (CTkTextbox)"""
+    
+    def __init__(self, textbox, window_pages=12, margin=0.15, poll_interval=150,
+                 store_pages=256):
+        """
+        Initialisation de l'affichage paginé
+        
+        Les positions manipulées (`offset`) sont celles du texte complet du
+        document, comme si toutes les pages étaient affichées.
+        
+        Args:
+            textbox (CTkTextbox): Zone de texte
+            window_pages (int): Nombre maximal de pages dans la zone de texte
+            margin (float): Part de la zone (en haut ou en bas) dont
+                l'affichage déclenche le chargement des pages voisines
+            poll_interval (int): Intervalle de surveillance du défilement (ms)
+            store_pages (int): Nombre de pages dont le texte est gardé en
+                mémoire (dernières pages ajoutées ou relues)
+        """
+        self.textbox = textbox
+        self.window_pages = max(2, window_pages)
+        self.margin = margin
+        self.poll_interval = poll_interval
+        self.store_pages = max(2 * self.window_pages, store_pages)
+        self._watching = False
+        self._generation = 0
+        self.reset()
+        
+    def reset(self, page_loader=None):
+        """
+        Vide l'affichage pour un nouveau document
+        
+        Args:
+            page_loader (callable): (première page, dernière page, rappel) ->
+                relit en arrière-plan les pages quittées absentes de la
+                mémoire, puis appelle le rappel avec les couples (numéro de
+                page, texte) dans le thread de l'interface
+        """
+        self.page_loader = page_loader
+        self._generation += 1
+        self._requested = None
+        self._retry = None
+        
+        # Une entrée par page : numéro, début dans le texte complet, longueur
+        self.page_numbers = array('i')
+        self.starts = array('q')
+        self.lengths = array('i')
+        
+        # Texte des pages récentes (indice -> texte), le plus ancien en tête
+        self._texts = OrderedDict()
+        
+        # Pages affichées : [first, last[ (indices dans les tableaux)
+        self.first = 0
+        self.last = 0
+        self.textbox.delete("1.0", "end")
+        
+        # Page affichée seule avant le chargement des précédentes (voir preview)
+        self.preview_page = None
+        self.preview_text = None
+        
+    @property
+    def length(self):
+        """Longueur du texte complet des pages enregistrées"""
+        if not self.starts:
+            return 0
+        return self.starts[-1] + self.lengths[-1]
+        
+    def add_page(self, page_number, text):
+        """
+        Enregistre la page suivante du document
+        
+        Le texte n'est placé dans la zone que si la fenêtre est en fin de
+        document et n'est pas pleine ; sinon seule sa position est conservée.
+        
+        Args:
+            page_number (int): Numéro de page (1-indexed)
+            text (str): Texte de la page
+        
+        Returns:
+            int: Début de la page dans le texte complet
+        """
+        start = self.length + len(PAGE_SEPARATOR) if self.starts else 0
+        slot = len(self.starts)
+        self.page_numbers.append(page_number)
+        self.starts.append(start)
+        self.lengths.append(len(text))
+        self._remember(slot, text)
+        
+        if self.preview_page is None and self.last == slot and self.last - self.first < self.window_pages:
+            if self.last > self.first:
+                self.textbox.insert("end", PAGE_SEPARATOR)
+            self.textbox.insert("end", text)
+            self.last += 1
+        return start
+        
+    def preview(self, page_number, text):
+        """
+        Affiche une page seule, avant que les pages qui la précèdent soient
+        chargées (reprise d'un marque-page loin dans le document)
+        
+        Les pages ajoutées entre-temps ne sont pas affichées ; le premier
+        appel à show remplace l'aperçu par la fenêtre de pages normale.
+        
+        Args:
+            page_number (int): Numéro de page (1-indexed)
+            text (str): Texte de la page
+        """
+        self.preview_page = page_number
+        self.preview_text = text
+        self.first = self.last = 0
+        self.textbox.delete("1.0", "end")
+        self.textbox.insert("end", text)
+        
+    def preview_position(self, index):
+        """
+        Position dans la page en aperçu d'un index de la zone de texte
+        
+        Args:
+            index (str): Index Tk (par exemple "insert")
+        
+        Returns:
+            tuple: (numéro de page, décalage dans la page), ou None hors aperçu
+        """
+        if self.preview_page is None:
+            return None
+        return self.preview_page, len(self.textbox.get("1.0", index))
+        
+    def index(self, offset):
+        """
+        Index de la zone de texte d'une position du texte complet
+        
+        Args:
+            offset (int): Position dans le texte complet (affichée : voir show)
+        
+        Returns:
+            str: Index Tk ("1.0+Nc")
+        """
+        base = self.starts[self.first] if self.last > self.first else 0
+        return f"1.0+{max(0, offset - base)}c"
+        
+    def offset(self, index):
+        """
+        Position dans le texte complet d'un index de la zone de texte
+        
+        Args:
+            index (str): Index Tk (par exemple "insert")
+        
+        Returns:
+            int: Position dans le texte complet
+        """
+        base = self.starts[self.first] if self.last > self.first else 0
+        return base + len(self.textbox.get("1.0", index))
+        
+    def show(self, offset, callback=None):
+        """
+        Affiche la page contenant une position (la fenêtre est recentrée si
+        la page n'est pas déjà affichée)
+        
+        Si des pages de la nouvelle fenêtre ne sont plus en mémoire, elles
+        sont relues en arrière-plan et la fenêtre n'est rechargée qu'à leur
+        arrivée : `callback` est alors appelé plus tard.
+        
+        Args:
+            offset (int): Position dans le texte complet
+            callback (callable, optional): Appelé sans argument une fois la
+                page affichée (surlignage, curseur)
+        
+        Returns:
+            bool: True si la fenêtre a été rechargée (surlignages perdus)
+        """
+        if not self.starts:
+            return False
+        slot = max(0, bisect_right(self.starts, offset) - 1)
+        if self.preview_page is None and self.first <= slot < self.last:
+            if callback:
+                callback()
+            return False
+            
+        first = max(0, slot - self.window_pages // 2)
+        last = min(len(self.starts), first + self.window_pages)
+        first = max(0, last - self.window_pages)
+        
+        text = self._window_text(first, last, lambda: self.show(offset, callback))
+        if text is None:
+            return False
+        self.preview_page = self.preview_text = None
+        self.textbox.delete("1.0", "end")
+        self.textbox.insert("end", text)
+        self.first, self.last = first, last
+        if callback:
+            callback()
+        return True
+        
+    def start_watching(self):
+        """Surveille le défilement pour charger les pages voisines"""
+        if not self._watching:
+            self._watching = True
+            self.textbox.after(self.poll_interval, self._watch)
+            
+    def stop_watching(self):
+        """Arrête la surveillance du défilement"""
+        self._watching = False
+        
+    def _watch(self):
+        """Vérification périodique du défilement"""
+        if not self._watching:
+            return
+        try:
+            self._check_scroll()
+        finally:
+            self.textbox.after(self.poll_interval, self._watch)
+            
+    def _check_scroll(self):
+        """Fait glisser la fenêtre si la zone visible approche de l'un de ses bords"""
+        if self.last <= self.first:
+            return
+        top, bottom = self.textbox.yview()
+        step = max(1, self.window_pages // 3)
+        
+        if bottom >= 1.0 - self.margin and self.last < len(self.starts):
+            last = min(len(self.starts), self.last + step)
+            self._slide(max(self.first, last - self.window_pages), last)
+        elif top <= self.margin and self.first > 0:
+            first = max(0, self.first - step)
+            self._slide(first, min(self.last, first + self.window_pages))
+            
+    def _slide(self, first, last):
+        """
+        Déplace la fenêtre de pages sans faire bouger le texte visible
+        
+        Args:
+            first (int): Première page affichée (indice)
+            last (int): Fin de la fenêtre (indice exclu)
+        """
+        # Pages à ajouter : glissement reporté si elles sont encore à relire
+        # (la surveillance du défilement le retente)
+        after = self._window_text(self.last, last) if last > self.last else ""
+        before = self._window_text(first, self.first) if first < self.first else ""
+        if after is None or before is None:
+            return
+            
+        anchor = self.offset("@0,0")
+        
+        # Pages ajoutées à la fin, puis au début
+        if after:
+            self.textbox.insert("end", PAGE_SEPARATOR + after)
+        if before:
+            self.textbox.insert("1.0", before + PAGE_SEPARATOR)
+            
+        # Pages retirées au début, puis à la fin
+        window_start = self.starts[min(first, self.first)]
+        if first > self.first:
+            self.textbox.delete("1.0", f"1.0+{self.starts[first] - window_start}c")
+            window_start = self.starts[first]
+        if last < self.last:
+            end = self.starts[last - 1] + self.lengths[last - 1] - window_start
+            self.textbox.delete(f"1.0+{end}c", "end")
+            
+        self.first, self.last = first, last
+        self.textbox.yview(self.index(anchor))
+        
+    def _window_text(self, first, last, retry=None):
+        """
+        Texte d'une suite de pages, pris dans la mémoire des pages
+        
+        Les pages absentes ne sont jamais relues dans le thread de
+        l'interface : elles sont demandées à `page_loader` et None est rendu.
+        
+        Args:
+            first (int): Première page (indice)
+            last (int): Fin de la suite (indice exclu)
+            retry (callable, optional): Rappelé une fois les pages relues
+        
+        Returns:
+            str: Texte des pages, séparées comme dans le texte complet, ou
+                None si des pages sont en cours de relecture
+        """
+        missing = [slot for slot in range(first, last) if slot not in self._texts]
+        if missing:
+            self._request(missing[0], missing[-1] + 1, retry)
+            return None
+            
+        parts = []
+        for slot in range(first, last):
+            self._texts.move_to_end(slot)
+            parts.append(self._texts[slot])
+        return PAGE_SEPARATOR.join(parts)
+        
+    def _remember(self, slot, text):
+        """
+        Garde le texte d'une page en mémoire (les plus anciennes sont oubliées)
+        
+        Args:
+            slot (int): Indice de la page
+            text (str): Texte de la page
+        """
+        # Page devenue illisible : le texte garde sa longueur (positions)
+        length = self.lengths[slot]
+        self._texts[slot] = text if len(text) == length else text.ljust(length)[:length]
+        self._texts.move_to_end(slot)
+        while len(self._texts) > self.store_pages:
+            self._texts.popitem(last=False)
+            
+    def _request(self, first, last, retry=None):
+        """
+        Demande la relecture de pages en arrière-plan (une seule demande en
+        cours : une nouvelle demande remplace la précédente)
+        
+        Args:
+            first (int): Première page (indice)
+            last (int): Fin de la suite (indice exclu)
+            retry (callable, optional): Rappelé une fois les pages relues
+        """
+        if self.page_loader is None:
+            return
+        if self._requested == (first, last):
+            self._retry = retry or self._retry
+            return
+        self._requested = (first, last)
+        self._retry = retry
+        generation = self._generation
+        slots = {self.page_numbers[slot]: slot for slot in range(first, last)}
+        
+        def deliver(pages):
+            if generation != self._generation:
+                return
+            retry = self._retry
+            self._requested = self._retry = None
+            for page_number, text in pages:
+                slot = slots.get(page_number)
+                if slot is not None:
+                    self._remember(slot, text)
+            # Pages illisibles : texte vide (de la longueur enregistrée)
+            for slot in slots.values():
+                if slot not in self._texts:
+                    self._remember(slot, "")
+            if retry:
+                retry()
+                
+        self.page_loader(self.page_numbers[first], self.page_numbers[last - 1], deliver)
\ No newline at end of file
@@ -3,15 +3,155 @@ Module de traitement des fichiers PDF
 Extraction et traitement du texte
 """
 
-import PyPDF2
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import PyPDF2
+from document_cache import DocumentCache
+from text_cache import PageTextCache, hash_file
+from chapter_index import Chapter, find_chapter
+from language_id import get_identifier
+from metrics import get_registry, summarize, total
+from profiling import get_profiler
+
+# Version du nettoyage du texte : à incrémenter à chaque modification de
+# _clean_text pour invalider le texte conservé dans le cache persistant
+CLEANER_VERSION = 2
 
+# Suite de caractères de mot (\w), pour le nettoyage du texte
+_WORD_CHARS = re.compile(r'\w*')
+
+def _is_word_char(char):
+    """Caractère de mot au sens de \\w (lettre, chiffre ou '_')"""
+    return char.isalnum() or char == '_'
+    
+def _join_hyphenated_words(text):
+    """
+    Recolle les mots coupés en fin de ligne ('exem-\\nple' -> 'exemple')
+    
+    Résultat identique à re.sub(r'(\\w+)-\\n(\\w+)', r'\\1\\2', text), y
+    compris pour les coupures en chaîne ('a-\\nb-\\nc' -> 'ab-\\nc' : le mot
+    rattaché à une coupure n'en recolle pas une autre), mais seules les
+    occurrences de '-\\n' sont examinées au lieu de chaque position du texte.
+    
+    Args:
+        text (str): Texte brut
+        
+    Returns:
+        str: Texte sans coupures de mots
+    """
+    parts = []
+    last = 0
+    joined_word = -1
+    
+    position = text.find('-\n')
+    while position != -1:
+        if (position and _is_word_char(text[position - 1])
+                and _is_word_char(text[position + 2:position + 3])
+                and not (joined_word >= 0 and _WORD_CHARS.fullmatch(text, joined_word, position))):
+            parts.append(text[last:position])
+            last = position + 2
+            joined_word = last
+        position = text.find('-\n', position + 2)
+        
+    if not parts:
+        return text
+    parts.append(text[last:])
+    return ''.join(parts)
+    
+def _extract_page_range(pdf_path, first_page, last_page, boilerplate=None):
+    """
+    Extrait et nettoie une plage de pages (exécuté dans un processus fils)
+    
+    Chaque processus ouvre le fichier lui-même : seuls le chemin et le
+    texte nettoyé transitent entre les processus.
+    
+    Args:
+        pdf_path (str): Chemin vers le fichier PDF
+        first_page (int): Première page (1-indexed)
+        last_page (int): Dernière page incluse (1-indexed)
+        boilerplate (BoilerplateFilter, optional): En-têtes et pieds de
+            page à retirer (appris par le processus principal)
+        
+    Returns:
+        list: (numéro de page, texte nettoyé, durée de l'extraction, durée
+            du nettoyage) ; les durées sont enregistrées par le processus
+            principal
+    """
+    processor = PDFProcessor(use_text_cache=False)
+    result = []
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page in range(first_page, last_page + 1):
+            started = time.perf_counter()
+            page_text = pdf_reader.pages[page - 1].extract_text()
+            extracted = time.perf_counter()
+            text = processor._clean_page(page_text, boilerplate)
+            result.append((page, text, extracted - started, time.perf_counter() - extracted))
+    return result
+    
 class PDFProcessor:
     """Classe pour le traitement des fichiers PDF"""
     
-    def __init__(self):
-        """Initialisation du processeur PDF"""
-        pass
+    def __init__(self, document_cache=None, text_cache=None, use_text_cache=True,
+                 parallel=False, max_workers=None, parallel_min_pages=24,
+                 strip_boilerplate=True, metrics=None):
+        """
+        Initialisation du processeur PDF
+        
+        Args:
+            document_cache (DocumentCache, optional): Cache des documents
+                ouverts (partagé entre plusieurs processeurs si fourni)
+            text_cache (PageTextCache, optional): Cache persistant du texte
+                des pages (créé dans le dossier de cache utilisateur si absent)
+            use_text_cache (bool): Active le cache persistant du texte
+            parallel (bool): Répartit l'extraction sur plusieurs processus
+            max_workers (int, optional): Nombre de processus (par défaut
+                le nombre de cœurs)
+            parallel_min_pages (int): En dessous de ce nombre de pages à
+                extraire, l'extraction reste séquentielle (le démarrage des
+                processus coûterait plus cher que l'extraction elle-même)
+            strip_boilerplate (bool): Retire les en-têtes, pieds de page et
+                numéros de page répétés (voir boilerplate)
+            metrics (MetricsRegistry, optional): Registre des mesures (par
+                défaut celui du processus)
+        """
+        # Chaque document n'est analysé qu'une fois par session
+        self.document_cache = document_cache or DocumentCache()
+        
+        # Texte nettoyé conservé d'une session à l'autre
+        self.text_cache = None
+        self._owns_text_cache = False
+        if use_text_cache:
+            try:
+                self.text_cache = text_cache or PageTextCache(metrics=metrics)
+                self._owns_text_cache = text_cache is None
+            except Exception as e:
+                print(f"⚠ Cache de texte indisponible: {e}")
+                
+        # Extraction parallèle (optionnelle)
+        self.parallel = parallel
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel_min_pages = parallel_min_pages
+        self._executor = None
+        
+        # En-têtes et pieds de page retirés avant la lecture
+        self.strip_boilerplate = strip_boilerplate
+        
+        # Mesures : durées par page (efficacité du cache de texte : compteurs
+        # tenus par PageTextCache dans le même registre)
+        self.metrics = metrics or get_registry()
+        self._extract_seconds = self.metrics.histogram(
+            'pdf_extract_seconds', "Extraction du texte d'une page (PyPDF2)")
+        self._clean_seconds = self.metrics.histogram(
+            'pdf_clean_seconds', "Nettoyage du texte d'une page")
+        self._boilerplate_seconds = self.metrics.histogram(
+            'pdf_boilerplate_seconds', "Détection des en-têtes et pieds de page d'un document")
+            
+        # Durées de chaque page (mode profilage uniquement, voir profiling)
+        self.profiler = get_profiler()
         
     def extract_text(self, pdf_path, start_page=None, end_page=None):
         """
@@ -25,37 +165,104 @@ class PDFProcessor:
         Returns:
             str: Texte extrait du PDF
         """
+        pages = self.iter_pages(pdf_path, start_page, end_page)
+        return "\n\n".join(text for _, text in pages).strip()
+        
+    def iter_pages(self, pdf_path, start_page=None, end_page=None):
+        """
+        Extrait le texte d'un PDF page par page, à la demande
+        
+        Chaque page est extraite (ou lue dans le cache) au moment où elle est
+        demandée : la lecture peut commencer avant la fin de l'extraction.
+        Les pages sans texte sont ignorées.
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+            start_page (int, optional): Page de début (1-indexed)
+            end_page (int, optional): Page de fin (1-indexed)
+            
+        Yields:
+            tuple: (numéro de page, texte nettoyé)
+        """
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                total_pages = len(pdf_reader.pages)
+            doc_key = self._get_document_key(pdf_path)
+            total_pages = self._get_page_count(pdf_path, doc_key)
+            start_page, end_page = self._clamp_page_range(
+                total_pages, start_page, end_page
+            )
+            
+            # Fenêtre de pages consultées dans le cache puis extraites ensemble
+            if self.parallel and self.max_workers > 1:
+                window = max(2 * self.parallel_min_pages, 8 * self.max_workers)
+            else:
+                window = 16
                 
-                # Gestion des pages par défaut
-                if start_page is None:
-                    start_page = 1
-                if end_page is None:
-                    end_page = total_pages
-                    
-                # Validation des numéros de pages
-                start_page = max(1, min(start_page, total_pages))
-                end_page = max(start_page, min(end_page, total_pages))
+            for first in range(start_page, end_page + 1, window):
+                window_pages = range(first, min(first + window - 1, end_page) + 1)
                 
-                # Extraction du texte
-                text = ""
-                for page_num in range(start_page - 1, end_page):
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
+                # Pages déjà extraites lors d'une session précédente
+                cached = {}
+                if doc_key:
+                    cached = self.text_cache.get_pages(doc_key, window_pages)
                     
-                    if page_text:
-                        # Nettoyage du texte
-                        cleaned_text = self._clean_text(page_text)
-                        text += cleaned_text + "\n\n"
+                # Extraction des pages manquantes uniquement
+                missing = [page for page in window_pages if page not in cached]
+                fresh = self._iter_extracted(pdf_path, missing)
+                extracted = {}
+                try:
+                    for page in window_pages:
+                        if page in cached:
+                            text = cached[page]
+                        else:
+                            _, text = next(fresh)
+                            extracted[page] = text
+                        if text:
+                            yield page, text
+                finally:
+                    fresh.close()
+                    if doc_key and extracted:
+                        self.text_cache.put_pages(doc_key, total_pages, extracted)
                         
-                return text.strip()
-                
         except Exception as e:
             raise Exception(f"Erreur lors de l'extraction du PDF: {str(e)}")
             
+    def get_page_range(self, pdf_path, start_page=None, end_page=None):
+        """
+        Valide une plage de pages pour un document
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+            start_page (int, optional): Page de début (1-indexed)
+            end_page (int, optional): Page de fin (1-indexed)
+            
+        Returns:
+            tuple: (page de début, page de fin) bornées au document
+        """
+        return self._clamp_page_range(self.get_page_count(pdf_path), start_page, end_page)
+        
+    def _clamp_page_range(self, total_pages, start_page, end_page):
+        """
+        Applique les valeurs par défaut et borne une plage de pages
+        
+        Args:
+            total_pages (int): Nombre de pages du document
+            start_page (int): Page de début (ou None)
+            end_page (int): Page de fin (ou None)
+            
+        Returns:
+            tuple: (page de début, page de fin)
+        """
+        # Gestion des pages par défaut
+        if start_page is None:
+            start_page = 1
+        if end_page is None:
+            end_page = total_pages
+            
+        # Validation des numéros de pages
+        start_page = max(1, min(start_page, total_pages))
+        end_page = max(start_page, min(end_page, total_pages))
+        return start_page, end_page
+        
     def get_page_count(self, pdf_path):
         """
         Obtient le nombre total de pages d'un PDF
@@ -67,65 +274,344 @@ class PDFProcessor:
             int: Nombre de pages
         """
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                return len(pdf_reader.pages)
+            return self._get_page_count(pdf_path, self._get_document_key(pdf_path))
         except Exception as e:
             raise Exception(f"Erreur lors de la lecture du PDF: {str(e)}")
             
+    def get_chapters(self, pdf_path):
+        """
+        Obtient l'index des chapitres d'un PDF, construit à partir de son
+        sommaire (conservé dans le cache persistant : le document n'est pas
+        analysé à nouveau)
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+            
+        Returns:
+            list: Chapitres (Chapter), vide si le document n'a pas de sommaire
+        """
+        try:
+            content_hash = None
+            if self.text_cache is not None:
+                content_hash = self.text_cache.content_hash(pdf_path)
+                cached = self.text_cache.get_chapters(content_hash)
+                if cached is not None:
+                    return [Chapter(*fields) for fields in cached]
+                    
+            with self.document_cache.acquire(pdf_path) as document:
+                chapters = document.get_chapters()
+                
+            if content_hash is not None:
+                self.text_cache.put_chapters(content_hash, chapters)
+            return chapters
+        except Exception as e:
+            raise Exception(f"Erreur lors de la lecture du sommaire: {str(e)}")
+            
+    def get_chapter_range(self, pdf_path, number):
+        """
+        Obtient la plage de pages d'un chapitre
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+            number (str): Numéro du chapitre ("7", "7.2")
+            
+        Returns:
+            tuple: (page de début, page de fin) du chapitre
+        """
+        chapter = find_chapter(self.get_chapters(pdf_path), number)
+        return self._clamp_page_range(self.get_page_count(pdf_path),
+                                      chapter.start_page, chapter.end_page)
+        
+    def close(self):
+        """
+        Arrête les processus d'extraction, ferme les documents ouverts et
+        le cache de texte créé par le processeur (un cache fourni à
+        l'initialisation reste ouvert)
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.document_cache.clear()
+        if self._owns_text_cache:
+            self.text_cache.close()
+            self.text_cache = None
+            self._owns_text_cache = False
+        
+    def _iter_extracted(self, pdf_path, pages):
+        """
+        Extrait et nettoie une liste de pages, dans l'ordre
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+            pages (list): Numéros de pages croissants (1-indexed)
+            
+        Yields:
+            tuple: (numéro de page, texte nettoyé)
+        """
+        if not pages:
+            return
+            
+        if (self.parallel and self.max_workers > 1
+                and len(pages) >= self.parallel_min_pages):
+            try:
+                yield from self._iter_extracted_parallel(pdf_path, pages)
+                return
+            except BrokenProcessPool as e:
+                print(f"⚠ Extraction parallèle interrompue: {e}, passage en séquentiel")
+                self._executor = None
+                
+        with self.document_cache.acquire(pdf_path) as document:
+            boilerplate = self._get_boilerplate(document) if self.strip_boilerplate else None
+            for page in pages:
+                page_text, extract_seconds = document.extract_page(page - 1)
+                # Nettoyage du texte
+                started = time.perf_counter()
+                text = self._clean_page(page_text, boilerplate)
+                clean_seconds = time.perf_counter() - started
+                self._extract_seconds.observe(extract_seconds)
+                self._clean_seconds.observe(clean_seconds)
+                if self.profiler is not None:
+                    self.profiler.record_page(pdf_path, page, extract_seconds, clean_seconds)
+                yield page, text
+                
+    def _iter_extracted_parallel(self, pdf_path, pages):
+        """
+        Extrait les pages en répartissant des plages sur un pool de processus
+        
+        Toutes les plages sont soumises immédiatement ; les résultats sont
+        rendus dans l'ordre des pages dès que chaque plage est prête.
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+            pages (list): Numéros de pages croissants (1-indexed)
+            
+        Yields:
+            tuple: (numéro de page, texte nettoyé)
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            
+        # Filtre appris une seule fois, transmis à chaque processus
+        boilerplate = None
+        if self.strip_boilerplate:
+            with self.document_cache.acquire(pdf_path) as document:
+                boilerplate = self._get_boilerplate(document)
+            
+        # Plusieurs plages par processus pour équilibrer la charge
+        shard_size = max(1, -(-len(pages) // (self.max_workers * 4)))
+        
+        futures = []
+        for first, last in self._page_runs(pages, shard_size):
+            futures.append(self._executor.submit(
+                _extract_page_range, os.path.abspath(pdf_path), first, last, boilerplate
+            ))
+            
+        # Réassemblage dans l'ordre des pages
+        try:
+            for future in futures:
+                for page, text, extract_seconds, clean_seconds in future.result():
+                    self._extract_seconds.observe(extract_seconds)
+                    self._clean_seconds.observe(clean_seconds)
+                    if self.profiler is not None:
+                        self.profiler.record_page(pdf_path, page, extract_seconds, clean_seconds)
+                    yield page, text
+        finally:
+            for future in futures:
+                future.cancel()
+        
+    def _get_boilerplate(self, document):
+        """
+        Filtre des en-têtes et pieds de page d'un document ouvert (la
+        détection, qui extrait un échantillon de pages, est mesurée)
+        
+        Args:
+            document (DocumentHandle): Document ouvert
+            
+        Returns:
+            BoilerplateFilter: Filtre du document
+        """
+        if document.boilerplate is not None:
+            return document.boilerplate
+        with self._boilerplate_seconds.time():
+            return document.get_boilerplate()
+            
+    def _page_runs(self, pages, max_length):
+        """
+        Découpe une liste de pages en plages contiguës de taille bornée
+        
+        Args:
+            pages (list): Numéros de pages croissants
+            max_length (int): Longueur maximale d'une plage
+            
+        Returns:
+            list: Couples (première page, dernière page)
+        """
+        runs = []
+        first = last = pages[0]
+        for page in pages[1:]:
+            if page == last + 1 and page - first < max_length:
+                last = page
+            else:
+                runs.append((first, last))
+                first = last = page
+        runs.append((first, last))
+        return runs
+        
+    def get_cache_stats(self):
+        """
+        Obtient les statistiques du cache persistant du texte
+        
+        Returns:
+            dict: Statistiques du cache (vide si le cache est désactivé)
+        """
+        if self.text_cache is None:
+            return {}
+        return self.text_cache.stats()
+        
+    def get_stats(self):
+        """
+        Obtient les mesures de l'extraction (tous les documents du processus)
+        
+        Returns:
+            dict: Durées par page de l'extraction et du nettoyage, durée de
+                la détection des en-têtes par document (nombre, moyenne,
+                95e centile, maximum ; None avant la première mesure) et
+                taux de succès du cache de texte
+        """
+        snapshot = self.metrics.snapshot('pdf_')
+        hits = total(snapshot, 'pdf_text_cache_lookups_total{result="hit"}')
+        lookups = total(snapshot, 'pdf_text_cache_lookups_total')
+        return {
+            'extract_seconds': summarize(snapshot, 'pdf_extract_seconds'),
+            'clean_seconds': summarize(snapshot, 'pdf_clean_seconds'),
+            'boilerplate_seconds': summarize(snapshot, 'pdf_boilerplate_seconds'),
+            'text_cache_hit_ratio': hits / lookups if lookups else 0.0
+        }
+        
+    def get_content_hash(self, pdf_path):
+        """
+        Obtient l'empreinte du contenu d'un PDF (identifiant du document,
+        indépendant de son chemin)
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+            
+        Returns:
+            str: Empreinte SHA-256 hexadécimale
+        """
+        if self.text_cache is not None:
+            return self.text_cache.content_hash(pdf_path)
+        return hash_file(pdf_path)
+        
+    def get_document_id(self, pdf_path):
+        """
+        Obtient l'identifiant du document pour les marque-pages
+        
+        Les positions enregistrées sont des décalages dans le texte nettoyé :
+        elles dépendent du retrait des en-têtes et pieds de page, ajouté à
+        l'empreinte comme dans la clé du cache de texte.
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+            
+        Returns:
+            str: Empreinte du contenu, suivie de "-full" si les en-têtes et
+                pieds de page sont conservés
+        """
+        variant = "" if self.strip_boilerplate else "-full"
+        return f"{self.get_content_hash(pdf_path)}{variant}"
+        
+    def _get_document_key(self, pdf_path):
+        """
+        Obtient la clé du document dans le cache persistant
+        
+        La clé combine l'empreinte du contenu, la version du nettoyage et le
+        retrait (ou non) des en-têtes et pieds de page.
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+            
+        Returns:
+            str: Clé du document, ou None si le cache est désactivé
+        """
+        if self.text_cache is None:
+            return None
+        variant = "" if self.strip_boilerplate else "-full"
+        return f"{self.text_cache.content_hash(pdf_path)}:{CLEANER_VERSION}{variant}"
+        
+    def _get_page_count(self, pdf_path, doc_key):
+        """
+        Nombre de pages, sans analyser le PDF s'il est déjà en cache
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+            doc_key (str): Clé du document dans le cache (ou None)
+            
+        Returns:
+            int: Nombre de pages
+        """
+        if doc_key:
+            page_count = self.text_cache.get_page_count(doc_key)
+            if page_count is not None:
+                return page_count
+        return self.document_cache.get_page_count(pdf_path)
+            
+    def _clean_page(self, text, boilerplate=None):
+        """
+        Nettoie le texte brut d'une page
+        
+        Args:
+            text (str): Texte brut (ou None)
+            boilerplate (BoilerplateFilter, optional): En-têtes et pieds de
+                page à retirer avant le nettoyage
+            
+        Returns:
+            str: Texte nettoyé ('' pour une page sans texte)
+        """
+        if boilerplate:
+            text = boilerplate.strip(text)
+        return self._clean_text(text) if text else ''
+        
     def _clean_text(self, text):
         """
         Nettoie le texte extrait du PDF
         
+        Les sauts de ligne simples sont remplacés par des espaces, sauf
+        après une ponctuation de fin de phrase ou avant une majuscule
+        (nouveau paragraphe) ; les lignes vides disparaissent.
+        
         Args:
             text (str): Texte brut
             
         Returns:
             str: Texte nettoyé
         """
-        # Suppression des sauts de ligne excessifs
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        
         # Correction des mots coupés en fin de ligne
-        text = re.sub(r'(\w+)-\n(\w+)', r'\1\2', text)
-        
-        # Remplacement des sauts de ligne simples par des espaces
-        # sauf s'ils sont suivis d'une majuscule (nouveau paragraphe)
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                cleaned_lines.append('')
-                continue
-                
-            # Si la ligne se termine par un signe de ponctuation
-            # et la suivante commence par une majuscule, on garde le saut
-            if i < len(lines) - 1:
-                next_line = lines[i + 1].strip()
-                if line and next_line:
-                    # Fin de phrase détectée
-                    if line[-1] in '.!?:' or next_line[0].isupper():
-                        cleaned_lines.append(line)
-                    else:
-                        # Concaténation avec la ligne suivante
-                        cleaned_lines.append(line + ' ')
-                else:
-                    cleaned_lines.append(line)
-            else:
-                cleaned_lines.append(line)
-                
-        text = ''.join(cleaned_lines)
+        text = _join_hyphenated_words(text)
         
-        # Nettoyage des espaces multiples
-        text = re.sub(r' {2,}', ' ', text)
+        # Nettoyage des espaces multiples (ils ne peuvent pas chevaucher
+        # deux lignes : le faire avant le découpage est équivalent)
+        while '  ' in text:
+            text = text.replace('  ', ' ')
+            
+        # Chaque ligne n'est nettoyée qu'une fois
+        lines = [line.strip() for line in text.split('\n')]
         
-        return text
+        # Une ligne est suivie d'un espace si la suivante la prolonge
+        parts = []
+        append = parts.append
+        for line, next_line in zip(lines, lines[1:]):
+            if line:
+                append(line)
+                if next_line and line[-1] not in '.!?:' and not next_line[0].isupper():
+                    append(' ')
+        append(lines[-1])
+        
+        return ''.join(parts)
         
     def detect_language(self, text):
         """
-        Détecte la langue du texte (fonction basique)
+        Détecte la langue du texte (profils de trigrammes, voir language_id)
         
         Args:
             text (str): Texte à analyser
@@ -133,24 +619,4 @@ class PDFProcessor:
         Returns:
             str: Code de langue ('fr', 'en', etc.)
         """
-        # Détection simple basée sur des mots courants
-        text_lower = text.lower()
-        
-        # Mots français courants
-        french_words = ['le', 'la', 'les', 'de', 'des', 'un', 'une', 'et', 
-                        'est', 'dans', 'pour', 'que', 'qui', 'par']
-        # Mots anglais courants
-        english_words = ['the', 'and', 'of', 'to', 'in', 'is', 'that', 
-                         'for', 'it', 'with', 'as', 'was', 'on']
-        
-        # Comptage des occurrences
-        french_count = sum(1 for word in french_words if f' {word} ' in text_lower)
-        english_count = sum(1 for word in english_words if f' {word} ' in text_lower)
-        
-        # Retour de la langue dominante
-        if french_count > english_count:
-            return 'fr'
-        elif english_count > french_count:
-            return 'en'
-        else:
-            return 'fr'  # Par défaut
\ No newline at end of file
+        return get_identifier().detect(text, default='fr')
\ No newline at end of file
@@ -3,11 +3,23 @@ Interface graphique du lecteur PDF
 Gestion de l'UI avec CustomTkinter
 """
 
+import os
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 import threading
+from bisect import bisect_right
 from pdf_processor import PDFProcessor
 from voice_engine import VoiceEngine
+from sentence_index import SentenceIndex, split_sentences
+from bookmarks import BookmarkStore
+from page_view import PagedTextView
+from background_jobs import JobRunner
+from ui_updates import UIUpdateBus
+from metrics import get_registry, summarize
+from profiling import profile_session
+
+# Choix du chapitre : document entier
+ALL_PAGES = "Toutes les pages"
 
 class PDFReaderGUI(ctk.CTk):
     """Classe principale de l'interface graphique"""
@@ -41,8 +53,35 @@ class PDFReaderGUI(ctk.CTk):
         self.is_reading = False
         self.reading_thread = None
         
+        # Index des phrases du texte affiché (lecture depuis le curseur)
+        self.sentence_index = SentenceIndex()
+        
+        # Marque-pages : dernière phrase lue de chaque document
+        try:
+            self.bookmarks = BookmarkStore()
+        except Exception as e:
+            print(f"⚠ Marque-pages indisponibles: {e}")
+            self.bookmarks = None
+        self.document_id = None
+        self.last_position = None
+        self.resume_position = None
+        
+        # Tâches en arrière-plan (chargement du texte affiché), rappels
+        # exécutés dans le thread de l'interface
+        self.jobs = JobRunner(lambda callback: self.after(0, callback))
+        
+        # Progression, statut et surlignage : au plus une mise à jour par
+        # image ; réglages du moteur envoyés une fois le curseur stabilisé
+        self.ui_bus = UIUpdateBus(self)
+        
         # Construction de l'interface
         self._build_ui()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # Détection du mode (en ligne / hors ligne) sans bloquer l'affichage
+        self.voice_engine.initialize_async(
+            lambda status: self.after(0, self._update_engine_status, status)
+        )
         
     def _build_ui(self):
         """Construction de l'interface utilisateur"""
@@ -64,7 +103,7 @@ class PDFReaderGUI(ctk.CTk):
         """Création du panneau latéral de contrôle"""
         sidebar = ctk.CTkFrame(self, width=300, corner_radius=0)
         sidebar.grid(row=0, column=0, rowspan=2, sticky="nsew", padx=0, pady=0)
-        sidebar.grid_rowconfigure(10, weight=1)
+        sidebar.grid_rowconfigure(12, weight=1)
         
         # Titre
         title_label = ctk.CTkLabel(
@@ -108,9 +147,19 @@ class PDFReaderGUI(ctk.CTk):
         )
         page_label.grid(row=4, column=0, padx=20, pady=(10, 5))
         
+        # Chapitre (sommaire du document) : remplit les pages de début et de fin
+        self.chapter_choices = {}
+        self.menu_chapter = ctk.CTkOptionMenu(
+            sidebar,
+            values=[ALL_PAGES],
+            command=self._select_chapter,
+            state="disabled"
+        )
+        self.menu_chapter.grid(row=5, column=0, padx=20, pady=5, sticky="ew")
+        
         # Page de début
         start_page_frame = ctk.CTkFrame(sidebar, fg_color="transparent")
-        start_page_frame.grid(row=5, column=0, padx=20, pady=5, sticky="ew")
+        start_page_frame.grid(row=6, column=0, padx=20, pady=5, sticky="ew")
         
         ctk.CTkLabel(
             start_page_frame,
@@ -128,7 +177,7 @@ class PDFReaderGUI(ctk.CTk):
         
         # Page de fin (optionnelle)
         end_page_frame = ctk.CTkFrame(sidebar, fg_color="transparent")
-        end_page_frame.grid(row=6, column=0, padx=20, pady=5, sticky="ew")
+        end_page_frame.grid(row=7, column=0, padx=20, pady=5, sticky="ew")
         
         ctk.CTkLabel(
             end_page_frame,
@@ -145,7 +194,7 @@ class PDFReaderGUI(ctk.CTk):
         
         # Vitesse de lecture
         speed_frame = ctk.CTkFrame(sidebar, fg_color="transparent")
-        speed_frame.grid(row=7, column=0, padx=20, pady=10, sticky="ew")
+        speed_frame.grid(row=8, column=0, padx=20, pady=10, sticky="ew")
         
         ctk.CTkLabel(
             speed_frame,
@@ -168,7 +217,7 @@ class PDFReaderGUI(ctk.CTk):
         
         # Volume
         volume_frame = ctk.CTkFrame(sidebar, fg_color="transparent")
-        volume_frame.grid(row=8, column=0, padx=20, pady=10, sticky="ew")
+        volume_frame.grid(row=9, column=0, padx=20, pady=10, sticky="ew")
         
         ctk.CTkLabel(
             volume_frame,
@@ -189,13 +238,24 @@ class PDFReaderGUI(ctk.CTk):
         self.lbl_volume = ctk.CTkLabel(volume_frame, text="80%", width=40)
         self.lbl_volume.pack(side="left", padx=(5, 0))
         
+        # En-têtes et pieds de page répétés (ignorés par défaut)
+        self.switch_boilerplate = ctk.CTkSwitch(
+            sidebar,
+            text="Ignorer en-têtes et pieds de page",
+            font=ctk.CTkFont(size=12),
+            command=self._toggle_boilerplate
+        )
+        self.switch_boilerplate.grid(row=10, column=0, padx=20, pady=5, sticky="w")
+        if self.pdf_processor.strip_boilerplate:
+            self.switch_boilerplate.select()
+        
         # Séparateur
         separator2 = ctk.CTkFrame(sidebar, height=2, fg_color="gray30")
-        separator2.grid(row=9, column=0, sticky="ew", padx=20, pady=15)
+        separator2.grid(row=11, column=0, sticky="ew", padx=20, pady=15)
         
         # Boutons de contrôle
         control_frame = ctk.CTkFrame(sidebar, fg_color="transparent")
-        control_frame.grid(row=11, column=0, padx=20, pady=(0, 20))
+        control_frame.grid(row=13, column=0, padx=20, pady=(0, 20))
         
         self.btn_play = ctk.CTkButton(
             control_frame,
@@ -235,6 +295,29 @@ class PDFReaderGUI(ctk.CTk):
         )
         self.btn_stop.grid(row=1, column=0, columnspan=2, padx=5, pady=5)
         
+        self.btn_play_from_cursor = ctk.CTkButton(
+            control_frame,
+            text="⏯️ Lire depuis le curseur",
+            command=lambda: self._start_reading(from_cursor=True),
+            height=35,
+            font=ctk.CTkFont(size=12),
+            fg_color=self.colors["accent"],
+            hover_color=self.colors["highlight"]
+        )
+        self.btn_play_from_cursor.grid(row=2, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        
+        self.btn_resume = ctk.CTkButton(
+            control_frame,
+            text="🔖 Reprendre",
+            command=lambda: self._start_reading(resume=True),
+            height=35,
+            font=ctk.CTkFont(size=12),
+            fg_color=self.colors["accent"],
+            hover_color=self.colors["highlight"],
+            state="disabled"
+        )
+        self.btn_resume.grid(row=3, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        
     def _create_main_panel(self):
         """Création du panneau principal d'affichage"""
         main_frame = ctk.CTkFrame(self, corner_radius=10)
@@ -259,6 +342,15 @@ class PDFReaderGUI(ctk.CTk):
         )
         self.text_display.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="nsew")
         
+        # Surlignage des phrases en cours de lecture ; double-clic : lecture
+        # à partir de la phrase cliquée
+        self.text_display.tag_config("sentence", background=self.colors["highlight"])
+        self.text_display.bind("<Double-Button-1>", self._read_from_click)
+        
+        # Seule une fenêtre de pages autour de la zone visible est affichée
+        self.page_view = PagedTextView(self.text_display)
+        self.page_view.start_watching()
+        
     def _create_status_bar(self):
         """Création de la barre de statut"""
         status_frame = ctk.CTkFrame(self, height=40, corner_radius=0)
@@ -276,6 +368,34 @@ class PDFReaderGUI(ctk.CTk):
         self.progress_bar.pack(side="right", padx=20, pady=10)
         self.progress_bar.set(0)
         
+        self.lbl_engine = ctk.CTkLabel(
+            status_frame,
+            text="Détection du mode...",
+            font=ctk.CTkFont(size=11),
+            text_color="gray"
+        )
+        self.lbl_engine.pack(side="right", padx=10, pady=10)
+        
+        # Panneau des mesures de performance (ouvert à la demande)
+        self.btn_metrics = ctk.CTkButton(
+            status_frame,
+            text="📊 Mesures",
+            width=90,
+            height=26,
+            font=ctk.CTkFont(size=11),
+            command=self._show_metrics
+        )
+        self.btn_metrics.pack(side="right", padx=(10, 0), pady=10)
+        self.metrics_window = None
+        
+    def _update_engine_status(self, status):
+        """Affichage du mode de lecture (en ligne / hors ligne)"""
+        mode = "🌐 En ligne" if status['engine'] == "online" else "📴 Hors ligne"
+        self.lbl_engine.configure(
+            text=f"{mode} - Qualité: {status['quality']}",
+            text_color=self.colors["text"]
+        )
+        
     def _select_pdf_file(self):
         """Sélection d'un fichier PDF"""
         filename = filedialog.askopenfilename(
@@ -294,61 +414,299 @@ class PDFReaderGUI(ctk.CTk):
             self._load_pdf()
             
     def _load_pdf(self):
-        """Chargement et affichage du contenu PDF"""
+        """
+        Chargement et affichage du contenu PDF
+        
+        Le texte est extrait et affiché page par page par une tâche en
+        arrière-plan, annulée si un autre PDF est ouvert entre-temps. Si le
+        document a un marque-page, la lecture peut reprendre aussitôt :
+        seules les pages à lire sont extraites, le reste s'affiche en
+        arrière-plan.
+        """
         if not self.current_pdf_path:
             return
             
-        try:
-            self.lbl_status.configure(text="Chargement du PDF...")
-            self.text_display.delete("1.0", "end")
+        pdf_path = self.current_pdf_path
+        self.lbl_status.configure(text="Chargement du PDF...")
+        self.page_view.reset(
+            lambda first, last, deliver: self._reload_view_pages(pdf_path, first, last, deliver)
+        )
+        self.sentence_index = SentenceIndex()
+        self.last_position = None
+        self.document_id = None
+        self._set_resume_position(None)
+        self._chapters_ready([])
+        
+        self.jobs.submit(
+            "load",
+            lambda job: self._load_pages_job(job, pdf_path),
+            on_progress=self._append_page,
+            on_done=self._pages_loaded,
+            on_error=self._pages_failed
+        )
+        
+    def _reload_view_pages(self, pdf_path, first_page, last_page, deliver):
+        """
+        Relit en arrière-plan des pages quittées par l'affichage (absentes
+        de sa mémoire), sans bloquer l'interface
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+            first_page (int): Première page (1-indexed)
+            last_page (int): Dernière page (1-indexed)
+            deliver (callable): Reçoit les couples (numéro de page, texte)
+                dans le thread de l'interface
+        """
+        def read(job):
+            pages = self.pdf_processor.iter_pages(pdf_path, first_page, last_page)
+            texts = []
+            try:
+                for page in pages:
+                    job.check()
+                    texts.append(page)
+            finally:
+                pages.close()
+            return texts
             
-            # Extraction du texte
-            text = self.pdf_processor.extract_text(self.current_pdf_path)
+        def failed(error):
+            print(f"⚠ Relecture des pages {first_page}-{last_page}: {error}")
+            deliver([])
             
-            if text:
-                self.text_display.insert("1.0", text)
-                total_pages = self.pdf_processor.get_page_count(self.current_pdf_path)
-                self.lbl_status.configure(
-                    text=f"PDF chargé - {total_pages} page(s)"
-                )
-            else:
-                messagebox.showwarning(
-                    "Avertissement",
-                    "Aucun texte n'a pu être extrait de ce PDF."
-                )
-                self.lbl_status.configure(text="Échec du chargement")
+        self.jobs.submit("view", read, on_done=deliver, on_error=failed)
+        
+    def _load_pages_job(self, job, pdf_path):
+        """
+        Extraction du texte affiché (exécutée en arrière-plan)
+        
+        Args:
+            job (BackgroundJob): Tâche (progression, annulation)
+            pdf_path (str): Chemin vers le fichier PDF
+            
+        Returns:
+            int: Nombre de pages du document
+        """
+        with profile_session("chargement", pdf_path):
+            return self._load_pages(job, pdf_path)
+            
+    def _load_pages(self, job, pdf_path):
+        """Corps de _load_pages_job (profilé en mode profilage)"""
+        # Identification du document et position enregistrée
+        document_id = self.pdf_processor.get_document_id(pdf_path)
+        bookmark = self.bookmarks.get(document_id) if self.bookmarks else None
+        job.call(self._document_identified, document_id, bookmark)
+        
+        # Page du marque-page affichée aussitôt, sans attendre le chargement
+        # des pages qui la précèdent
+        if bookmark and bookmark['page'] > 1:
+            try:
+                for page_number, text in self.pdf_processor.iter_pages(
+                        pdf_path, bookmark['page'], bookmark['page']):
+                    job.call(self._preview_bookmark, page_number, text, bookmark['offset'])
+            except Exception as e:
+                print(f"⚠ {e}")
                 
+        # Sommaire (facultatif : un document sans sommaire se lit par pages)
+        try:
+            chapters = self.pdf_processor.get_chapters(pdf_path)
         except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors du chargement: {str(e)}")
-            self.lbl_status.configure(text="Erreur")
+            print(f"⚠ {e}")
+            chapters = []
+        job.call(self._chapters_ready, chapters)
+        
+        total_pages = self.pdf_processor.get_page_count(pdf_path)
+        pages = self.pdf_processor.iter_pages(pdf_path)
+        try:
+            for page_number, text in pages:
+                job.report(page_number, text, total_pages)
+        finally:
+            pages.close()
+        return total_pages
+        
+    def _document_identified(self, document_id, bookmark):
+        """Empreinte du document connue : proposition de reprise"""
+        self.document_id = document_id
+        if bookmark:
+            self._set_resume_position((bookmark['page'], bookmark['offset']))
+            self.entry_start_page.delete(0, "end")
+            self.entry_start_page.insert(0, str(bookmark['page']))
+            
+    def _preview_bookmark(self, page_number, text, page_offset):
+        """
+        Affiche la page du marque-page, curseur sur la phrase de reprise,
+        avant que les pages précédentes soient chargées
+        """
+        if self._reading_active() or self.sentence_index.page_offset(page_number) is not None:
+            return
+        self.page_view.preview(page_number, text)
+        self.text_display.mark_set("insert", f"1.0+{page_offset}c")
+        self.text_display.see("insert")
+        
+    def _chapters_ready(self, chapters):
+        """
+        Remplit le choix du chapitre (chapitres et sections de premier niveau)
+        
+        Args:
+            chapters (list): Chapitres du document (voir chapter_index)
+        """
+        self.chapter_choices = {
+            f"{chapter.number} {chapter.title} (p. {chapter.start_page}-{chapter.end_page})": chapter
+            for chapter in chapters
+            if chapter.level <= 1
+        }
+        self.menu_chapter.configure(
+            values=[ALL_PAGES] + list(self.chapter_choices),
+            state="normal" if self.chapter_choices else "disabled"
+        )
+        self.menu_chapter.set(ALL_PAGES)
+        
+    def _toggle_boilerplate(self):
+        """Retrait des en-têtes et pieds de page : le document est rechargé"""
+        if self._reading_active():
+            # Le texte lu et le texte affiché doivent rester identiques
+            if self.pdf_processor.strip_boilerplate:
+                self.switch_boilerplate.select()
+            else:
+                self.switch_boilerplate.deselect()
+            self.lbl_status.configure(text="Arrêtez la lecture pour changer ce réglage")
+            return
+        self.pdf_processor.strip_boilerplate = bool(self.switch_boilerplate.get())
+        if self.current_pdf_path:
+            self._load_pdf()
             
-    def _start_reading(self):
-        """Démarrage de la lecture vocale"""
+    def _select_chapter(self, choice):
+        """Choix d'un chapitre : sa plage de pages devient la plage lue"""
+        chapter = self.chapter_choices.get(choice)
+        start_page, end_page = (chapter.start_page, str(chapter.end_page)) if chapter else (1, "")
+        self.entry_start_page.delete(0, "end")
+        self.entry_start_page.insert(0, str(start_page))
+        self.entry_end_page.delete(0, "end")
+        self.entry_end_page.insert(0, end_page)
+        if chapter:
+            self._move_cursor(chapter.start_page, 0)
+            
+    def _append_page(self, page_number, text, total_pages):
+        """
+        Ajoute une page au texte du document et indexe ses phrases
+        (même texte que PDFProcessor.extract_text)
+        """
+        offset = self.page_view.add_page(page_number, text)
+        self.sentence_index.add_page(page_number, text, offset)
+        
+        # Progression du chargement (la barre sert à la lecture si elle a commencé)
+        if not self._reading_active():
+            self.ui_bus.post(
+                "status", self.lbl_status.configure,
+                text=f"Chargement du PDF... page {page_number}/{total_pages}"
+            )
+            self.ui_bus.post("progress", self.progress_bar.set, page_number / total_pages)
+            
+        # Page du marque-page chargée : la fenêtre de pages remplace l'aperçu,
+        # curseur sur la phrase de reprise
+        if self.resume_position and self.resume_position[0] == page_number and not self._reading_active():
+            self.page_view.show(offset)
+            self._move_cursor(*self.resume_position)
+            
+    def _pages_loaded(self, total_pages):
+        """Fin de l'extraction du texte affiché"""
+        if self._reading_active():
+            return
+        self.ui_bus.cancel("status", "progress")
+        self.progress_bar.set(0)
+        if self.page_view.length:
+            self.lbl_status.configure(text=f"PDF chargé - {total_pages} page(s)")
+        else:
+            messagebox.showwarning(
+                "Avertissement",
+                "Aucun texte n'a pu être extrait de ce PDF."
+            )
+            self.lbl_status.configure(text="Échec du chargement")
+            
+    def _pages_failed(self, error):
+        """Échec de l'extraction du texte affiché"""
+        messagebox.showerror("Erreur", f"Erreur lors du chargement: {str(error)}")
+        self.lbl_status.configure(text="Erreur")
+        
+    def _reading_active(self):
+        """Indique si une lecture est en cours (éventuellement en pause)"""
+        return self.reading_thread is not None and self.reading_thread.is_alive()
+        
+    def _move_cursor(self, page_number, page_offset):
+        """Place le curseur sur une phrase (si sa page est affichée)"""
+        sentence_id = self.sentence_index.find(page_number, page_offset)
+        if sentence_id is None:
+            return
+        _, _, start, _ = self.sentence_index.location(sentence_id)
+        
+        def place():
+            self.text_display.mark_set("insert", self.page_view.index(start))
+            self.text_display.see("insert")
+        self.page_view.show(start, place)
+        
+    def _set_resume_position(self, position):
+        """
+        Met à jour la position de reprise et le bouton « Reprendre »
+        
+        Args:
+            position (tuple): (page, décalage dans la page), ou None
+        """
+        self.resume_position = position
+        if position:
+            self.btn_resume.configure(text=f"🔖 Reprendre (page {position[0]})", state="normal")
+        else:
+            self.btn_resume.configure(text="🔖 Reprendre", state="disabled")
+            
+    def _save_bookmark(self):
+        """Enregistre la dernière phrase lue du document"""
+        if not self.last_position or not self.document_id:
+            return
+        self._set_resume_position(self.last_position)
+        if self.bookmarks:
+            name = os.path.basename(self.current_pdf_path)
+            self.bookmarks.save(self.document_id, *self.last_position, name=name)
+            
+    def _start_reading(self, from_cursor=False, resume=False):
+        """
+        Démarrage de la lecture vocale
+        
+        Args:
+            from_cursor (bool): Commence à la phrase du curseur au lieu de la
+                page de début
+            resume (bool): Reprend à la position enregistrée (marque-page)
+        """
         if not self.current_pdf_path:
             messagebox.showwarning(
                 "Avertissement",
                 "Veuillez d'abord sélectionner un fichier PDF."
             )
             return
+        if self._reading_active():
+            # Lecture précédente pas encore terminée (arrêt en cours)
+            return
             
         try:
             start_page = int(self.entry_start_page.get() or 1)
             end_page_text = self.entry_end_page.get()
             end_page = int(end_page_text) if end_page_text else None
             
-            # Extraction du texte pour les pages spécifiées
-            text = self.pdf_processor.extract_text(
-                self.current_pdf_path,
-                start_page,
-                end_page
-            )
-            
-            if not text:
-                messagebox.showwarning(
-                    "Avertissement",
-                    "Aucun texte à lire dans les pages spécifiées."
-                )
-                return
+            # Reprise à la phrase du curseur : page et position dans la page
+            start_offset = 0
+            preview = self.page_view.preview_position("insert") if from_cursor else None
+            if preview is not None:
+                # Aperçu de la page du marque-page : phrase du curseur dans la page
+                start_page, cursor = preview
+                starts = [start for start, _, _ in split_sentences(self.page_view.preview_text)]
+                if starts:
+                    start_offset = starts[max(0, bisect_right(starts, cursor) - 1)]
+            elif from_cursor:
+                cursor = self.page_view.offset("insert")
+                sentence_id = self.sentence_index.sentence_at(cursor)
+                if sentence_id is not None:
+                    page, start_offset, _, _ = self.sentence_index.location(sentence_id)
+                    start_page = page
+            elif resume and self.resume_position:
+                start_page, start_offset = self.resume_position
+            if end_page is not None:
+                end_page = max(end_page, start_page)
                 
             # Mise à jour de l'interface
             self.is_reading = True
@@ -356,11 +714,13 @@ class PDFReaderGUI(ctk.CTk):
             self.btn_pause.configure(state="normal")
             self.btn_stop.configure(state="normal")
             self.btn_select_file.configure(state="disabled")
+            self.btn_play_from_cursor.configure(state="disabled")
+            self.btn_resume.configure(state="disabled")
             
             # Démarrage de la lecture dans un thread séparé
             self.reading_thread = threading.Thread(
-                target=self._read_text_thread,
-                args=(text,),
+                target=self._read_pages_thread,
+                args=(self.current_pdf_path, start_page, end_page, start_offset),
                 daemon=True
             )
             self.reading_thread.start()
@@ -372,27 +732,94 @@ class PDFReaderGUI(ctk.CTk):
                 "Erreur",
                 "Veuillez entrer des numéros de page valides."
             )
+        except Exception as e:
+            messagebox.showerror("Erreur", str(e))
             
-    def _read_text_thread(self, text):
+    def _read_pages_thread(self, pdf_path, start_page, end_page, start_offset=0):
         """Thread de lecture vocale"""
+        with profile_session("lecture", pdf_path):
+            self._read_pages(pdf_path, start_page, end_page, start_offset)
+            
+    def _read_pages(self, pdf_path, start_page, end_page, start_offset):
+        """Corps de _read_pages_thread (profilé en mode profilage)"""
         try:
-            self.voice_engine.read_text(
-                text,
+            start_page, end_page = self.pdf_processor.get_page_range(
+                pdf_path,
+                start_page,
+                end_page
+            )
+            
+            # Extraction page par page : la lecture commence dès la
+            # première page, sans attendre l'extraction des suivantes
+            pages = self.pdf_processor.iter_pages(pdf_path, start_page, end_page)
+            
+            sentence_count = self.voice_engine.read_pages(
+                pages,
+                start_page,
+                end_page,
                 speed=self.slider_speed.get(),
                 volume=self.slider_volume.get(),
-                progress_callback=self._update_progress
+                progress_callback=self._update_progress,
+                start_offset=start_offset,
+                sentence_callback=self._sentences_started
             )
+            if sentence_count == 0 and not self.voice_engine.should_stop:
+                self.after(0, lambda: messagebox.showwarning(
+                    "Avertissement",
+                    "Aucun texte à lire dans les pages spécifiées."
+                ))
         except Exception as e:
-            self.after(0, lambda: messagebox.showerror("Erreur", str(e)))
+            self.after(0, messagebox.showerror, "Erreur", str(e))
         finally:
+            self.after(0, self._update_engine_status, self.voice_engine.get_engine_status())
             self.after(0, self._reading_finished)
             
+    def _read_from_click(self, event):
+        """Lecture à partir de la phrase double-cliquée"""
+        if self.btn_play.cget("state") == "disabled":
+            return
+        self.text_display.mark_set("insert", f"@{event.x},{event.y}")
+        self._start_reading(from_cursor=True)
+        
+    def _sentences_started(self, units):
+        """Phrases dont la lecture commence (appelé depuis le thread de lecture)"""
+        first, last = units[0], units[-1]
+        if first.page is None:
+            return
+        self.last_position = (first.page, first.offset)
+        self.ui_bus.post(
+            "highlight", self._highlight_sentences,
+            first.page, first.offset, last.page, last.offset
+        )
+        
+    def _highlight_sentences(self, first_page, first_offset, last_page, last_offset):
+        """Surligne les phrases en cours de lecture et les fait défiler à l'écran"""
+        first = self.sentence_index.find(first_page, first_offset)
+        last = self.sentence_index.find(last_page, last_offset)
+        if first is None or last is None:
+            return
+        _, _, start, _ = self.sentence_index.location(first)
+        _, _, last_start, length = self.sentence_index.location(last)
+        
+        def highlight():
+            self.text_display.tag_remove("sentence", "1.0", "end")
+            self.text_display.tag_add(
+                "sentence",
+                self.page_view.index(start),
+                self.page_view.index(last_start + length)
+            )
+            self.text_display.see(self.page_view.index(start))
+        # Pages à relire : surlignage à leur arrivée
+        self.page_view.show(start, highlight)
+        
     def _pause_reading(self):
         """Pause de la lecture"""
         if self.is_reading:
             self.voice_engine.pause()
             self.btn_pause.configure(text="▶️ Reprendre")
             self.lbl_status.configure(text="En pause")
+            self._save_bookmark()
+            self.btn_resume.configure(state="disabled")
         else:
             self.voice_engine.resume()
             self.btn_pause.configure(text="⏸️ Pause")
@@ -401,32 +828,154 @@ class PDFReaderGUI(ctk.CTk):
         self.is_reading = not self.is_reading
         
     def _stop_reading(self):
-        """Arrêt de la lecture"""
+        """
+        Arrêt de la lecture
+        
+        Les boutons ne sont rendus qu'à la fin du thread de lecture (voir
+        _reading_finished) : une nouvelle lecture ne démarre pas tant que
+        l'ancienne utilise encore le moteur vocal.
+        """
         self.voice_engine.stop()
-        self._reading_finished()
+        self.btn_pause.configure(state="disabled", text="⏸️ Pause")
+        self.btn_stop.configure(state="disabled")
+        self.lbl_status.configure(text="Arrêt de la lecture...")
+        
+    def _show_metrics(self):
+        """Ouvre (ou ramène au premier plan) le panneau des mesures"""
+        if self.metrics_window is not None and self.metrics_window.winfo_exists():
+            self.metrics_window.focus()
+            return
+            
+        window = ctk.CTkToplevel(self)
+        window.title("Mesures de performance")
+        window.geometry("620x360")
+        window.grid_columnconfigure(0, weight=1)
+        window.grid_rowconfigure(0, weight=1)
+        
+        self.metrics_text = ctk.CTkTextbox(
+            window,
+            font=ctk.CTkFont(family="Courier", size=12),
+            wrap="none"
+        )
+        self.metrics_text.grid(row=0, column=0, columnspan=3, padx=10, pady=10, sticky="nsew")
+        
+        ctk.CTkButton(
+            window, text="Exporter (JSON)", command=lambda: self._export_metrics("json")
+        ).grid(row=1, column=0, padx=10, pady=(0, 10), sticky="w")
+        ctk.CTkButton(
+            window, text="Exporter (Prometheus)", command=lambda: self._export_metrics("prom")
+        ).grid(row=1, column=1, padx=10, pady=(0, 10))
+        ctk.CTkButton(
+            window, text="Remettre à zéro", command=get_registry().reset
+        ).grid(row=1, column=2, padx=10, pady=(0, 10), sticky="e")
+        
+        self.metrics_window = window
+        self._refresh_metrics()
+        
+    def _refresh_metrics(self):
+        """Met à jour le panneau des mesures (chaque seconde tant qu'il est ouvert)"""
+        if self.metrics_window is None or not self.metrics_window.winfo_exists():
+            self.metrics_window = None
+            return
+            
+        pdf = self.pdf_processor.get_stats()
+        tts = self.voice_engine.get_stats()
+        ui = summarize(get_registry().snapshot('ui_'), 'ui_flush_seconds')
+        
+        def timing(label, summary):
+            if not summary or not summary['count']:
+                return f"{label:<26} -"
+            return (f"{label:<26} {summary['mean'] * 1000:8.1f} ms   "
+                    f"p95 {summary['p95'] * 1000:8.1f} ms   "
+                    f"max {summary['max'] * 1000:8.1f} ms   (n={summary['count']})")
+                    
+        fallbacks = ", ".join(f"{kind}: {count}" for kind, count in sorted(tts['fallbacks'].items()))
+        lines = [
+            "PDF (PyPDF2)",
+            timing("  Extraction / page", pdf['extract_seconds']),
+            timing("  Nettoyage / page", pdf['clean_seconds']),
+            timing("  En-têtes / document", pdf['boilerplate_seconds']),
+            f"  {'Cache de texte':<24} {pdf['text_cache_hit_ratio']:.0%} de succès",
+            "",
+            "Synthèse vocale",
+            timing("  Synthèse / phrase", tts['synthesis_seconds']),
+            timing("  Silence entre audios", tts['gap_seconds']),
+            f"  {'File de synthèse':<24} {tts['queue_depth']} bloc(s)",
+            f"  {'Phrases lues':<24} {tts['sentences']}",
+            f"  {'Cache audio':<24} {tts['audio_cache_hit_ratio']:.0%} de succès",
+            f"  {'Basculements':<24} {fallbacks or 'aucun'}",
+            "",
+            "Interface",
+            timing("  Mise à jour", ui),
+        ]
+        
+        self.metrics_text.configure(state="normal")
+        self.metrics_text.delete("1.0", "end")
+        self.metrics_text.insert("1.0", "\n".join(lines))
+        self.metrics_text.configure(state="disabled")
+        self.metrics_window.after(1000, self._refresh_metrics)
+        
+    def _export_metrics(self, export_format):
+        """
+        Enregistre les mesures dans un fichier
+        
+        Args:
+            export_format (str): 'json' ou 'prom' (format texte de Prometheus)
+        """
+        filename = filedialog.asksaveasfilename(
+            parent=self.metrics_window,
+            title="Exporter les mesures",
+            defaultextension=f".{export_format}",
+            initialfile=f"mesures.{export_format}",
+            filetypes=[("JSON", "*.json")] if export_format == "json" else [("Prometheus", "*.prom")]
+        )
+        if not filename:
+            return
+        try:
+            get_registry().dump(filename)
+            self.lbl_status.configure(text=f"Mesures exportées : {os.path.basename(filename)}")
+        except OSError as e:
+            messagebox.showerror("Erreur", f"Erreur lors de l'export des mesures: {str(e)}")
+            
+    def _on_close(self):
+        """Fermeture de la fenêtre : la position de lecture est enregistrée"""
+        self.jobs.cancel_all()
+        self.voice_engine.stop()
+        self._save_bookmark()
+        self.pdf_processor.close()
+        self.destroy()
         
     def _reading_finished(self):
         """Appelé lorsque la lecture est terminée"""
+        self.ui_bus.cancel("progress", "highlight", "status")
         self.is_reading = False
         self.btn_play.configure(state="normal")
         self.btn_pause.configure(state="disabled", text="⏸️ Pause")
         self.btn_stop.configure(state="disabled")
         self.btn_select_file.configure(state="normal")
+        self.btn_play_from_cursor.configure(state="normal")
         self.lbl_status.configure(text="Lecture terminée")
+        
+        # Curseur sur la dernière phrase lue : « Lire depuis le curseur » reprend là
+        self.text_display.tag_remove("sentence", "1.0", "end")
+        if self.last_position:
+            self._move_cursor(*self.last_position)
+        self._save_bookmark()
+        self._set_resume_position(self.resume_position)
         self.progress_bar.set(0)
         
     def _update_progress(self, progress):
         """Mise à jour de la barre de progression"""
-        self.after(0, lambda: self.progress_bar.set(progress))
+        self.ui_bus.post("progress", self.progress_bar.set, progress)
         
     def _update_speed(self, value):
         """Mise à jour de la vitesse de lecture"""
         self.lbl_speed.configure(text=f"{value:.1f}x")
         if self.is_reading:
-            self.voice_engine.set_speed(value)
+            self.ui_bus.debounce("speed", self.voice_engine.set_speed, value)
             
     def _update_volume(self, value):
         """Mise à jour du volume"""
         self.lbl_volume.configure(text=f"{int(value * 100)}%")
         if self.is_reading:
-            self.voice_engine.set_volume(value)
\ No newline at end of file
+            self.ui_bus.debounce("volume", self.voice_engine.set_volume, value)
\ No newline at end of file
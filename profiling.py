@@ -0,0 +1,355 @@
+"""
+Mode profilage (diagnostic des documents lents)
+Chargements et lectures enregistrés avec cProfile et tracemalloc, durées
+d'extraction de chaque page, rapport autonome écrit sur disque
+
+Activation : variable d'environnement PDF_READER_PROFILE (1, ou dossier du
+rapport) ou option --profile de main.py. Désactivé, le mode ne coûte
+qu'un test par chargement ou lecture : ni cProfile ni tracemalloc ne
+sont importés.
+"""
+
+import heapq
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+# Variable d'environnement d'activation ("1" : dossier par défaut)
+PROFILE_ENV = "PDF_READER_PROFILE"
+
+# Taille des classements du rapport
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+TOP_PAGES = 30
+
+# Lignes de pages.csv gardées en mémoire avant d'être ajoutées au fichier
+PAGE_ROWS_BUFFER = 256
+
+# Contexte sans effet (mode désactivé), réutilisable
+_NO_SESSION = nullcontext()
+
+class Profiler:
+    """Enregistre les sessions profilées et écrit le rapport"""
+    
+    def __init__(self, output_dir):
+        """
+        Initialisation (le dossier du rapport n'est créé qu'à la première
+        session terminée)
+        
+        Args:
+            output_dir (str): Dossier où créer le rapport
+        """
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.path = os.path.join(output_dir, f"profil_{stamp}_{os.getpid()}")
+        self.started = time.time()
+        self.sessions = []
+        
+        # Pages extraites : seules les TOP_PAGES plus lentes restent en
+        # mémoire (tas), toutes sont ajoutées au fur et à mesure à pages.csv
+        self.page_count = 0
+        self._slowest_pages = []
+        self._page_rows = []
+        self._csv_started = False
+        
+        self._active = 0
+        self._owns_tracing = False
+        self._profiling = False
+        self._lock = threading.Lock()
+        
+    def session(self, name, detail=""):
+        """
+        Profile un bloc `with` (thread courant : cProfile ; mémoire de tout
+        le processus : tracemalloc)
+        
+        Args:
+            name (str): Nature de la session ('chargement', 'lecture'...)
+            detail (str): Précision (document)
+        
+        Returns:
+            _Session: Gestionnaire de contexte
+        """
+        return _Session(self, name, detail)
+        
+    def record_page(self, pdf_path, page, extract_seconds, clean_seconds):
+        """
+        Enregistre les durées d'une page extraite
+        
+        Args:
+            pdf_path (str): Document
+            page (int): Numéro de page (1-indexed)
+            extract_seconds (float): Durée de l'extraction PyPDF2
+            clean_seconds (float): Durée du nettoyage
+        """
+        entry = (os.path.basename(pdf_path), page, extract_seconds, clean_seconds)
+        with self._lock:
+            self.page_count += 1
+            ranked = (extract_seconds + clean_seconds, self.page_count, entry)
+            if len(self._slowest_pages) < TOP_PAGES:
+                heapq.heappush(self._slowest_pages, ranked)
+            else:
+                heapq.heappushpop(self._slowest_pages, ranked)
+            self._page_rows.append(entry)
+            if len(self._page_rows) >= PAGE_ROWS_BUFFER:
+                try:
+                    self._flush_pages()
+                except OSError as e:
+                    print(f"⚠ Rapport de profilage impossible: {e}")
+                    
+    def _flush_pages(self):
+        """
+        Ajoute les pages en attente à pages.csv (appelé sous self._lock)
+        
+        Le fichier est créé, avec son en-tête, au premier ajout.
+        """
+        import csv
+        
+        rows, self._page_rows = self._page_rows, []
+        os.makedirs(self.path, exist_ok=True)
+        mode = 'a' if self._csv_started else 'w'
+        with open(os.path.join(self.path, "pages.csv"), mode, encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            if not self._csv_started:
+                writer.writerow(("document", "page", "extraction_ms", "nettoyage_ms"))
+                self._csv_started = True
+            for document, page, extract_seconds, clean_seconds in rows:
+                writer.writerow((document, page, f"{extract_seconds * 1000:.3f}",
+                                 f"{clean_seconds * 1000:.3f}"))
+                
+    def _start_tracing(self):
+        """Démarre tracemalloc pour la première session active"""
+        import tracemalloc
+        
+        with self._lock:
+            self._active += 1
+            if self._active == 1 and not tracemalloc.is_tracing():
+                tracemalloc.start(10)
+                self._owns_tracing = True
+        return tracemalloc.take_snapshot()
+        
+    def _stop_tracing(self):
+        """
+        Arrête tracemalloc après la dernière session active (s'il a été
+        démarré ici et non par `python -X tracemalloc`)
+        """
+        import tracemalloc
+        
+        with self._lock:
+            self._active -= 1
+            if self._active == 0 and self._owns_tracing:
+                tracemalloc.stop()
+                self._owns_tracing = False
+                
+    def _claim_profiling(self):
+        """
+        Réserve cProfile pour une session (un seul profileur actif à la fois
+        dans le processus : Python 3.12 refuse un second profileur)
+        
+        Returns:
+            bool: False si une autre session profile déjà
+        """
+        with self._lock:
+            if self._profiling:
+                return False
+            self._profiling = True
+            return True
+            
+    def _release_profiling(self):
+        """Libère cProfile (voir _claim_profiling)"""
+        with self._lock:
+            self._profiling = False
+            
+    def _finish(self, session):
+        """Enregistre une session terminée et réécrit le rapport"""
+        with self._lock:
+            number = len(self.sessions) + 1
+            session.number = number
+            self.sessions.append(session)
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            if session.profile is not None:
+                session.profile.dump_stats(os.path.join(self.path, f"session_{number}_{session.name}.pstats"))
+            self.write_report()
+        except Exception as e:
+            print(f"⚠ Rapport de profilage impossible: {e}")
+            
+    def write_report(self):
+        """
+        Écrit (ou réécrit) le rapport : report.html (lisible hors ligne,
+        sans ressource externe), pages.csv, metrics.json et un fichier
+        .pstats par session (pstats, snakeviz...)
+        """
+        import html
+        import platform
+        from metrics import get_registry
+        
+        with self._lock:
+            sessions = list(self.sessions)
+            page_count = self.page_count
+            slowest = [entry for _, _, entry in sorted(self._slowest_pages, reverse=True)]
+            self._flush_pages()
+            
+        metrics = get_registry().to_json()
+        with open(os.path.join(self.path, "metrics.json"), 'w', encoding='utf-8') as file:
+            file.write(metrics)
+            
+        rows = "".join(
+            f"<tr><td>{html.escape(document)}</td><td>{page}</td>"
+            f"<td>{extract_seconds * 1000:.1f}</td><td>{clean_seconds * 1000:.1f}</td></tr>"
+            for document, page, extract_seconds, clean_seconds in slowest
+        )
+        
+        parts = [
+            "<!DOCTYPE html><html lang='fr'><head><meta charset='utf-8'>",
+            "<title>Profil du lecteur PDF vocal</title><style>",
+            "body{font-family:sans-serif;margin:2em;max-width:70em}",
+            "pre{background:#f4f4f4;padding:1em;overflow-x:auto;font-size:12px}",
+            "table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:.2em .6em;text-align:right}",
+            "</style></head><body>",
+            "<h1>Profil du lecteur PDF vocal</h1>",
+            f"<p>Début : {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started))}"
+            f" — Python {platform.python_version()} — {html.escape(platform.platform())}"
+            f" — {os.cpu_count()} processeur(s)</p>",
+            "<h2>Sessions</h2><ul>",
+        ]
+        parts.extend(
+            f"<li><a href='#session-{session.number}'>{session.number}. {html.escape(session.name)}</a>"
+            f" — {html.escape(session.detail)} — {session.seconds:.2f} s</li>"
+            for session in sessions
+        )
+        parts.append("</ul>")
+        parts.append(f"<h2>Pages les plus lentes</h2><p>{page_count} page(s) extraite(s)"
+                     " (détail : pages.csv)</p>")
+        parts.append("<table><tr><th>Document</th><th>Page</th><th>Extraction (ms)</th>"
+                     f"<th>Nettoyage (ms)</th></tr>{rows}</table>")
+        
+        for session in sessions:
+            parts.append(f"<h2 id='session-{session.number}'>{session.number}. "
+                         f"{html.escape(session.name)} — {session.seconds:.2f} s</h2>")
+            stats_file = (f"session_{session.number}_{html.escape(session.name)}.pstats"
+                          if session.profile is not None else "sans fichier .pstats")
+            parts.append(f"<p>{html.escape(session.detail)} — mémoire : pic "
+                         f"{session.peak_bytes / 1048576:.1f} Mo (tracemalloc) — {stats_file}</p>")
+            parts.append("<h3>Fonctions (temps cumulé)</h3>")
+            parts.append(f"<pre>{html.escape(session.functions)}</pre>")
+            parts.append("<h3>Allocations pendant la session</h3>")
+            parts.append(f"<pre>{html.escape(session.allocations)}</pre>")
+            
+        parts.append(f"<h2>Mesures</h2><pre>{html.escape(metrics)}</pre></body></html>")
+        with open(os.path.join(self.path, "report.html"), 'w', encoding='utf-8') as file:
+            file.write("\n".join(parts))
+            
+class _Session:
+    """Session profilée (voir Profiler.session)"""
+    
+    def __init__(self, profiler, name, detail):
+        """
+        Initialisation
+        
+        Args:
+            profiler (Profiler): Profileur propriétaire
+            name (str): Nature de la session
+            detail (str): Précision (document)
+        """
+        self.profiler = profiler
+        self.name = name
+        self.detail = detail
+        self.number = None
+        self.profile = None
+        self.seconds = 0.0
+        self.peak_bytes = 0
+        self.functions = ""
+        self.allocations = ""
+        self._baseline = None
+        self._started = None
+        
+    def __enter__(self):
+        """
+        Démarre cProfile (thread courant) et tracemalloc
+        
+        Pendant une autre session (chargement et lecture simultanés), seules
+        la durée et la mémoire sont mesurées : cProfile reste à la première.
+        """
+        import cProfile
+        
+        self._baseline = self.profiler._start_tracing()
+        if self.profiler._claim_profiling():
+            self.profile = cProfile.Profile()
+            try:
+                self.profile.enable()
+            except ValueError:
+                # Profileur extérieur déjà actif (débogueur, autre outil)
+                self.profile = None
+                self.profiler._release_profiling()
+        if self.profile is None:
+            self.functions = "Fonctions non profilées : cProfile était occupé par une autre session."
+        self._started = time.perf_counter()
+        return self
+        
+    def __exit__(self, *exc_info):
+        """Arrête les mesures et met à jour le rapport"""
+        import io
+        import pstats
+        import tracemalloc
+        
+        if self.profile is not None:
+            self.profile.disable()
+            self.profiler._release_profiling()
+        self.seconds = time.perf_counter() - self._started
+        try:
+            snapshot = tracemalloc.take_snapshot()
+            _, self.peak_bytes = tracemalloc.get_traced_memory()
+            differences = snapshot.compare_to(self._baseline, 'lineno')[:TOP_ALLOCATIONS]
+            self.allocations = "\n".join(str(difference) for difference in differences)
+        finally:
+            self._baseline = None
+            self.profiler._stop_tracing()
+            
+        if self.profile is not None:
+            output = io.StringIO()
+            pstats.Stats(self.profile, stream=output).sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+            self.functions = output.getvalue()
+        self.profiler._finish(self)
+        return False
+        
+# Profileur du processus (False : mode désactivé, None : pas encore décidé)
+_profiler = None
+_profiler_lock = threading.Lock()
+
+def get_profiler():
+    """
+    Obtient le profileur du processus, d'après PDF_READER_PROFILE
+    
+    Returns:
+        Profiler: Profileur, ou None si le mode est désactivé
+    """
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                value = os.environ.get(PROFILE_ENV, "").strip()
+                if not value or value.lower() in ("0", "false", "no", "non"):
+                    _profiler = False
+                else:
+                    if value.lower() in ("1", "true", "yes", "oui"):
+                        from app_paths import user_data_dir
+                        value = user_data_dir("profiles")
+                    _profiler = Profiler(value)
+                    print(f"✓ Mode profilage activé, rapport dans {_profiler.path}")
+    return _profiler or None
+    
+def profile_session(name, detail=""):
+    """
+    Profile un bloc `with` si le mode est activé (sans effet sinon)
+    
+    Args:
+        name (str): Nature de la session ('chargement', 'lecture'...)
+        detail (str): Précision (document)
+    
+    Returns:
+        contextmanager: Session profilée, ou contexte sans effet
+    """
+    profiler = get_profiler()
+    if profiler is None:
+        return _NO_SESSION
+    return profiler.session(name, os.path.basename(detail) if detail else "")
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+Index des phrases d'un document
+Position de chaque phrase (page, décalage dans le texte affiché) pour la
+reprise et la lecture depuis le curseur
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+
+# Fin de phrase : points, points d'exclamation et d'interrogation
+_SENTENCE_END = re.compile(r'[.!?]+')
+
+def split_sentences(text):
+    """
+    Découpe un texte en phrases, avec leur position
+    
+    Mêmes phrases que VoiceEngine._split_into_sentences : fragment sans les
+    blancs qui l'entourent, suivi de sa ponctuation finale (un fragment
+    final sans ponctuation est ignoré, voir split_page).
+    
+    Args:
+        text (str): Texte à découper
+    
+    Returns:
+        list: Triplets (début, fin, phrase) ; `début` et `fin` délimitent la
+            phrase dans le texte
+    """
+    return split_page(text)[0]
+    
+def split_page(text):
+    """
+    Découpe le texte d'une page en phrases, et isole son fragment final
+    sans ponctuation (début d'une phrase qui continue page suivante, ou
+    titre, légende, tableau)
+    
+    Args:
+        text (str): Texte de la page
+    
+    Returns:
+        tuple: (phrases : triplets (début, fin, phrase) comme
+            split_sentences ; fragment final : couple (début, texte), ou None)
+    """
+    result = []
+    position = 0
+    for match in _SENTENCE_END.finditer(text):
+        fragment = text[position:match.start()]
+        stripped = fragment.strip()
+        if stripped:
+            start = position + len(fragment) - len(fragment.lstrip())
+            result.append((start, match.end(), stripped + match.group()))
+        position = match.end()
+        
+    fragment = text[position:]
+    stripped = fragment.strip()
+    if not stripped:
+        return result, None
+    return result, (position + len(fragment) - len(fragment.lstrip()), stripped)
+    
+class SentenceIndex:
+    """Index compact des phrases (tableaux parallèles)"""
+    
+    def __init__(self):
+        """Initialisation d'un index vide"""
+        # Une entrée par page indexée : numéro et début dans le texte affiché
+        self.page_numbers = array('i')
+        self.page_starts = array('q')
+        self._page_slots = {}
+        
+        # Une entrée par phrase : page, début (texte affiché), longueur
+        self.pages = array('i')
+        self.starts = array('q')
+        self.lengths = array('i')
+        self._page_first_sentence = array('i')
+        
+    def __len__(self):
+        """Nombre de phrases indexées"""
+        return len(self.starts)
+        
+    def add_page(self, page_number, text, display_offset):
+        """
+        Indexe les phrases d'une page
+        
+        Les pages doivent être ajoutées dans l'ordre du texte affiché.
+        
+        Args:
+            page_number (int): Numéro de page (1-indexed)
+            text (str): Texte de la page
+            display_offset (int): Début de la page dans le texte affiché
+        """
+        self._page_slots[page_number] = len(self.page_numbers)
+        self.page_numbers.append(page_number)
+        self.page_starts.append(display_offset)
+        self._page_first_sentence.append(len(self.starts))
+        
+        spans, tail = split_page(text)
+        for start, end, _ in spans:
+            self.pages.append(page_number)
+            self.starts.append(display_offset + start)
+            self.lengths.append(end - start)
+            
+        # Fragment final : phrase lue avec la suite de la page suivante (ou
+        # seule en fin de plage), repérée par son début dans cette page
+        if tail is not None:
+            start, fragment = tail
+            self.pages.append(page_number)
+            self.starts.append(display_offset + start)
+            self.lengths.append(len(fragment))
+            
+    def sentence_at(self, offset):
+        """
+        Trouve la phrase contenant une position du texte affiché
+        
+        Args:
+            offset (int): Position dans le texte affiché
+        
+        Returns:
+            int: Identifiant de la phrase (la précédente si la position est
+                entre deux phrases), ou None si l'index est vide
+        """
+        if not self.starts:
+            return None
+        return max(0, bisect_right(self.starts, offset) - 1)
+        
+    def location(self, sentence_id):
+        """
+        Position d'une phrase
+        
+        Args:
+            sentence_id (int): Identifiant de la phrase
+        
+        Returns:
+            tuple: (numéro de page, décalage dans le texte de la page,
+                début dans le texte affiché, longueur)
+        """
+        page = self.pages[sentence_id]
+        start = self.starts[sentence_id]
+        page_start = self.page_starts[self._page_slots[page]]
+        return page, start - page_start, start, self.lengths[sentence_id]
+        
+    def find(self, page_number, page_offset):
+        """
+        Trouve une phrase à partir de sa position dans sa page
+        
+        Args:
+            page_number (int): Numéro de page
+            page_offset (int): Début de la phrase dans le texte de la page
+        
+        Returns:
+            int: Identifiant de la phrase, ou None si la page n'est pas indexée
+        """
+        slot = self._page_slots.get(page_number)
+        if slot is None:
+            return None
+        first = self._page_first_sentence[slot]
+        if slot + 1 < len(self._page_first_sentence):
+            last = self._page_first_sentence[slot + 1]
+        else:
+            last = len(self.starts)
+        if first == last:
+            return None
+        offset = self.page_starts[slot] + page_offset
+        return max(first, bisect_right(self.starts, offset, first, last) - 1)
+        
+    def page_offset(self, page_number):
+        """
+        Début d'une page dans le texte affiché
+        
+        Args:
+            page_number (int): Numéro de page
+        
+        Returns:
+            int: Position, ou None si la page n'est pas indexée
+        """
+        slot = self._page_slots.get(page_number)
+        return None if slot is None else self.page_starts[slot]
\ No newline at end of file
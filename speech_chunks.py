@@ -0,0 +1,58 @@
+"""
+Regroupement des phrases en blocs de synthèse
+Moins d'appels au moteur vocal, sans couper une phrase ni mélanger les langues
+"""
+
+from collections import namedtuple
+
+# Bloc de synthèse : texte des phrases regroupées, langue, unités d'origine
+SpeechChunk = namedtuple('SpeechChunk', ['text', 'lang', 'units'])
+
+# Longueur maximale d'une requête gTTS (au-delà, gTTS la découpe lui-même)
+GTTS_MAX_CHARS = 100
+
+def plan_chunks(units, max_chars, language_of=None, default_lang=None):
+    """
+    Regroupe les phrases consécutives courtes en blocs de synthèse
+    
+    Les phrases sont réunies tant que le bloc reste sous `max_chars`
+    caractères ; une phrase plus longue forme un bloc à elle seule. Un
+    changement de langue ferme toujours le bloc en cours ; une phrase de
+    langue indéterminée (None) rejoint le bloc courant.
+    
+    Args:
+        units (iterable): Unités de lecture (avec un attribut `text`)
+        max_chars (int): Taille maximale d'un bloc (0 : une phrase par bloc)
+        language_of (callable, optional): Unité -> code de langue ou None
+        default_lang (str, optional): Langue d'un bloc sans langue détectée
+    
+    Yields:
+        SpeechChunk: Blocs, dans l'ordre des unités
+    """
+    pending = []
+    length = 0
+    lang = None
+    
+    for unit in units:
+        unit_lang = language_of(unit) if language_of else None
+        
+        if pending:
+            language_change = unit_lang is not None and lang is not None and unit_lang != lang
+            if language_change or length + 1 + len(unit.text) > max_chars:
+                yield _make_chunk(pending, lang or default_lang)
+                pending = []
+                
+        if pending:
+            length += 1 + len(unit.text)
+        else:
+            length = len(unit.text)
+            lang = None
+        lang = lang or unit_lang
+        pending.append(unit)
+        
+    if pending:
+        yield _make_chunk(pending, lang or default_lang)
+        
+def _make_chunk(units, lang):
+    """Construit un bloc à partir de ses unités"""
+    return SpeechChunk(" ".join(unit.text for unit in units), lang, tuple(units))
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""
+Synthèse vocale anticipée
+Les phrases suivantes sont synthétisées pendant la lecture de la phrase courante
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+
+class SynthesisCancelled(Exception):
+    """Synthèse abandonnée (arrêt de la lecture)"""
+    
+class SynthesisError(Exception):
+    """Échec de synthèse d'une phrase"""
+    
+    def __init__(self, error, pending_units):
+        """
+        Initialisation de l'erreur
+        
+        Args:
+            error (Exception): Erreur d'origine
+            pending_units (list): Unités non lues, à partir de celle en échec
+        """
+        super().__init__(str(error))
+        self.error = error
+        self.pending_units = pending_units
+        
+class SynthesisPipeline:
+    """File bornée de phrases pré-synthétisées (producteurs / consommateur)"""
+    
+    def __init__(self, synthesize, lookahead=3, max_workers=2, discard=None):
+        """
+        Initialisation du pipeline
+        
+        Args:
+            synthesize (callable): Fonction unité -> audio, appelée dans
+                les threads de synthèse
+            lookahead (int): Nombre de phrases synthétisées à l'avance
+            max_workers (int): Nombre de threads de synthèse
+            discard (callable, optional): Libère un audio synthétisé mais
+                jamais lu (fichier temporaire, etc.)
+        """
+        self.synthesize = synthesize
+        self.lookahead = max(1, lookahead)
+        self.discard = discard
+        
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers),
+            thread_name_prefix="tts-synthesis"
+        )
+        self._window = deque()
+        
+        # Production suspendue pendant la pause, interrompue à l'arrêt
+        self._running = threading.Event()
+        self._running.set()
+        self._cancelled = False
+        
+    @property
+    def queue_depth(self):
+        """Nombre de phrases en attente (synthétisées ou en cours)"""
+        return len(self._window)
+        
+    def run(self, units):
+        """
+        Synthétise les unités à l'avance et les rend dans l'ordre
+        
+        Args:
+            units (iterator): Unités de lecture (consommées au fil de l'eau)
+        
+        Yields:
+            tuple: (unité, audio synthétisé)
+        
+        Raises:
+            SynthesisError: Échec de synthèse (contient les unités non lues)
+        """
+        units = iter(units)
+        exhausted = False
+        
+        while not self._cancelled:
+            # Remplissage de la file jusqu'à `lookahead` phrases d'avance
+            while not exhausted and len(self._window) < self.lookahead:
+                unit = next(units, None)
+                if unit is None:
+                    exhausted = True
+                    break
+                self._window.append((unit, self._executor.submit(self._produce, unit)))
+                
+            if not self._window:
+                return
+                
+            unit, future = self._window[0]
+            try:
+                audio = future.result()
+            except (SynthesisCancelled, CancelledError):
+                return
+            except Exception as e:
+                raise SynthesisError(e, self.take_pending())
+                
+            self._window.popleft()
+            yield unit, audio
+            
+    def _produce(self, unit):
+        """Synthèse d'une unité dans un thread de synthèse"""
+        # Gel de la production pendant la pause
+        self._running.wait()
+        if self._cancelled:
+            raise SynthesisCancelled()
+        return self.synthesize(unit)
+        
+    def pause(self):
+        """Suspend la synthèse des phrases suivantes"""
+        self._running.clear()
+        
+    def resume(self):
+        """Reprend la synthèse"""
+        self._running.set()
+        
+    def cancel(self):
+        """Interrompt la synthèse et abandonne les phrases en attente"""
+        self._cancelled = True
+        self._running.set()
+        
+    def take_pending(self):
+        """
+        Abandonne les phrases en attente et les rend pour une autre lecture
+        
+        Returns:
+            list: Unités en attente, dans l'ordre
+        """
+        pending = []
+        while self._window:
+            unit, future = self._window.popleft()
+            pending.append(unit)
+            if not future.cancel() and self.discard:
+                future.add_done_callback(self._discard_result)
+        return pending
+        
+    def close(self):
+        """Libère les threads et les audios jamais lus"""
+        self.cancel()
+        self.take_pending()
+        self._executor.shutdown(wait=False)
+        
+    def _discard_result(self, future):
+        """Libère le résultat d'une synthèse abandonnée"""
+        if future.cancelled() or future.exception() is not None:
+            return
+        try:
+            self.discard(future.result())
+        except Exception:
+            pass
\ No newline at end of file
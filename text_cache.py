@@ -0,0 +1,341 @@
+"""
+Cache persistant du texte extrait des PDF
+Stockage SQLite du texte nettoyé, page par page
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from app_paths import user_cache_dir
+from metrics import get_registry
+
+# Version du schéma de la base (une nouvelle version repart d'une base vide)
+CACHE_SCHEMA_VERSION = 1
+
+def hash_file(path):
+    """
+    Calcule l'empreinte SHA-256 d'un fichier par blocs
+    
+    Args:
+        path (str): Chemin du fichier
+    
+    Returns:
+        str: Empreinte hexadécimale
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+    
+class PageTextCache:
+    """Cache disque du texte nettoyé de chaque page d'un document"""
+    
+    def __init__(self, db_path=None, max_bytes=200 * 1024 * 1024, metrics=None):
+        """
+        Initialisation du cache
+        
+        Args:
+            db_path (str, optional): Chemin de la base SQLite
+                (par défaut dans le dossier de cache utilisateur)
+            max_bytes (int): Taille maximale du texte conservé (octets)
+            metrics (MetricsRegistry, optional): Registre des mesures (par
+                défaut celui du processus)
+        """
+        if db_path is None:
+            db_path = os.path.join(user_cache_dir(), "page_text.sqlite3")
+            
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        
+        # Statistiques (en pages) : compteurs du registre des mesures,
+        # également lus par PDFProcessor.get_stats
+        metrics = metrics or get_registry()
+        self._hits = metrics.counter(
+            'pdf_text_cache_lookups_total', "Pages cherchées dans le cache de texte",
+            {'result': 'hit'})
+        self._misses = metrics.counter(
+            'pdf_text_cache_lookups_total', "Pages cherchées dans le cache de texte",
+            {'result': 'miss'})
+        
+        # Empreintes déjà calculées : (chemin, mtime, taille) -> empreinte
+        self._hashes = {}
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=5, check_same_thread=False)
+        self._init_schema()
+        
+    def _init_schema(self):
+        """Création (ou réinitialisation) du schéma de la base"""
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != CACHE_SCHEMA_VERSION:
+                self._conn.executescript("""
+                    DROP TABLE IF EXISTS files;
+                    DROP TABLE IF EXISTS documents;
+                    DROP TABLE IF EXISTS pages;
+                    DROP TABLE IF EXISTS outlines;
+                """)
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    mtime INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS documents (
+                    doc_key TEXT PRIMARY KEY,
+                    page_count INTEGER NOT NULL,
+                    total_bytes INTEGER NOT NULL DEFAULT 0,
+                    last_access REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS pages (
+                    doc_key TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    text TEXT NOT NULL,
+                    PRIMARY KEY (doc_key, page)
+                );
+                CREATE TABLE IF NOT EXISTS outlines (
+                    content_hash TEXT PRIMARY KEY,
+                    chapters TEXT NOT NULL
+                );
+            """)
+            self._conn.execute(f"PRAGMA user_version = {CACHE_SCHEMA_VERSION}")
+            
+    def content_hash(self, pdf_path):
+        """
+        Obtient l'empreinte SHA-256 du contenu d'un fichier
+        
+        L'empreinte n'est recalculée que si la date de modification ou la
+        taille du fichier ont changé ; les entrées de l'ancien contenu sont
+        alors supprimées.
+        
+        Args:
+            pdf_path (str): Chemin vers le fichier PDF
+        
+        Returns:
+            str: Empreinte hexadécimale
+        """
+        path = os.path.abspath(pdf_path)
+        stat = os.stat(path)
+        signature = (path, stat.st_mtime_ns, stat.st_size)
+        
+        content_hash = self._hashes.get(signature)
+        if content_hash:
+            return content_hash
+            
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime, size, content_hash FROM files WHERE path = ?",
+                (path,)
+            ).fetchone()
+            
+        if row and (row[0], row[1]) == signature[1:]:
+            content_hash = row[2]
+        else:
+            content_hash = self._hash_file(path)
+            with self._lock, self._conn:
+                if row and row[2] != content_hash:
+                    # Fichier modifié : l'ancien contenu n'est plus valide
+                    self._drop_content(row[2], path)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                    (path, stat.st_mtime_ns, stat.st_size, content_hash)
+                )
+                
+        self._hashes[signature] = content_hash
+        return content_hash
+        
+    def _hash_file(self, path):
+        """Calcule l'empreinte SHA-256 d'un fichier par blocs"""
+        return hash_file(path)
+        
+    def _drop_content(self, content_hash, path):
+        """Supprime les documents d'une empreinte plus référencée ailleurs"""
+        shared = self._conn.execute(
+            "SELECT 1 FROM files WHERE content_hash = ? AND path != ?",
+            (content_hash, path)
+        ).fetchone()
+        if shared:
+            return
+        prefix = content_hash + ':%'
+        self._conn.execute("DELETE FROM pages WHERE doc_key LIKE ?", (prefix,))
+        self._conn.execute("DELETE FROM documents WHERE doc_key LIKE ?", (prefix,))
+        self._conn.execute("DELETE FROM outlines WHERE content_hash = ?", (content_hash,))
+        
+    def get_page_count(self, doc_key):
+        """
+        Obtient le nombre de pages d'un document déjà vu
+        
+        Args:
+            doc_key (str): Clé du document
+        
+        Returns:
+            int: Nombre de pages, ou None si inconnu
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT page_count FROM documents WHERE doc_key = ?", (doc_key,)
+            ).fetchone()
+        return row[0] if row else None
+        
+    def get_pages(self, doc_key, pages):
+        """
+        Obtient le texte en cache d'une liste de pages
+        
+        Args:
+            doc_key (str): Clé du document
+            pages (list): Numéros de pages (1-indexed)
+        
+        Returns:
+            dict: Numéro de page -> texte nettoyé (pages trouvées uniquement)
+        """
+        pages = list(pages)
+        if not pages:
+            return {}
+            
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT page, text FROM pages "
+                "WHERE doc_key = ? AND page BETWEEN ? AND ?",
+                (doc_key, min(pages), max(pages))
+            ).fetchall()
+            if rows:
+                self._conn.execute(
+                    "UPDATE documents SET last_access = ? WHERE doc_key = ?",
+                    (time.time(), doc_key)
+                )
+                
+        wanted = set(pages)
+        found = {page: text for page, text in rows if page in wanted}
+        self._hits.inc(len(found))
+        self._misses.inc(len(wanted) - len(found))
+        return found
+        
+    def put_pages(self, doc_key, page_count, texts):
+        """
+        Enregistre le texte nettoyé de plusieurs pages
+        
+        Args:
+            doc_key (str): Clé du document
+            page_count (int): Nombre total de pages du document
+            texts (dict): Numéro de page -> texte nettoyé
+        """
+        if not texts:
+            return
+            
+        added_bytes = sum(len(text.encode('utf-8')) for text in texts.values())
+        
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO documents VALUES (?, ?, 0, ?)",
+                (doc_key, page_count, time.time())
+            )
+            # Les pages déjà présentes ne sont pas comptées deux fois
+            rows = self._conn.execute(
+                "SELECT page, LENGTH(CAST(text AS BLOB)) FROM pages "
+                "WHERE doc_key = ? AND page BETWEEN ? AND ?",
+                (doc_key, min(texts), max(texts))
+            ).fetchall()
+            existing = sum(size for page, size in rows if page in texts)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?)",
+                [(doc_key, page, text) for page, text in texts.items()]
+            )
+            self._conn.execute(
+                "UPDATE documents SET total_bytes = total_bytes + ?, "
+                "last_access = ? WHERE doc_key = ?",
+                (added_bytes - existing, time.time(), doc_key)
+            )
+            self._evict(keep=doc_key)
+            
+    def get_chapters(self, content_hash):
+        """
+        Obtient l'index des chapitres d'un document déjà analysé
+        
+        Args:
+            content_hash (str): Empreinte du contenu du PDF
+        
+        Returns:
+            list: Entrées (listes de champs, voir chapter_index.Chapter),
+                ou None si inconnu
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT chapters FROM outlines WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+        
+    def put_chapters(self, content_hash, chapters):
+        """
+        Enregistre l'index des chapitres d'un document
+        
+        Args:
+            content_hash (str): Empreinte du contenu du PDF
+            chapters (list): Entrées (tuples de champs)
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO outlines VALUES (?, ?)",
+                (content_hash, json.dumps([list(chapter) for chapter in chapters]))
+            )
+            
+    def _evict(self, keep=None):
+        """Supprime les documents les moins récemment lus au-delà de max_bytes"""
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(total_bytes), 0) FROM documents"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+            
+        rows = self._conn.execute(
+            "SELECT doc_key, total_bytes FROM documents ORDER BY last_access"
+        ).fetchall()
+        for doc_key, size in rows:
+            if total <= self.max_bytes:
+                break
+            if doc_key == keep:
+                continue
+            self._conn.execute("DELETE FROM pages WHERE doc_key = ?", (doc_key,))
+            self._conn.execute("DELETE FROM documents WHERE doc_key = ?", (doc_key,))
+            total -= size
+            
+    def clear(self):
+        """Vide complètement le cache"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM pages")
+            self._conn.execute("DELETE FROM documents")
+            self._conn.execute("DELETE FROM files")
+            self._conn.execute("DELETE FROM outlines")
+        self._hashes.clear()
+        
+    def stats(self):
+        """
+        Obtient les statistiques du cache
+        
+        Returns:
+            dict: Succès, échecs, taux de succès, taille et nombre de documents
+        """
+        with self._lock:
+            documents, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(total_bytes), 0) FROM documents"
+            ).fetchone()
+        hits = self._hits.snapshot()
+        misses = self._misses.snapshot()
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': hits / lookups if lookups else 0.0,
+            'bytes': total_bytes,
+            'max_bytes': self.max_bytes,
+            'documents': documents
+        }
+        
+    def close(self):
+        """Ferme la base"""
+        with self._lock:
+            self._conn.close()
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+Mises à jour de l'interface regroupées
+Progression, statut et surlignage appliqués au plus une fois par image,
+réglages du moteur transmis une fois le curseur relâché
+"""
+
+import threading
+import time
+from metrics import get_registry
+
+class UIUpdateBus:
+    """Regroupe les mises à jour de l'interface par clé (seule la dernière compte)"""
+    
+    def __init__(self, widget, max_rate=30, debounce_ms=150):
+        """
+        Initialisation
+        
+        Args:
+            widget (tkinter.Misc): Widget servant à planifier les mises à jour
+                (`after`) dans le thread de l'interface
+            max_rate (int): Nombre maximal d'applications par seconde
+            debounce_ms (int): Délai sans nouvelle valeur avant l'envoi d'un
+                réglage (voir debounce)
+        """
+        self.widget = widget
+        self.interval = 1.0 / max_rate
+        self.debounce_ms = debounce_ms
+        
+        # Mises à jour en attente : clé -> (fonction, arguments)
+        self._pending = {}
+        self._scheduled = False
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+        
+        # Réglages en attente (thread de l'interface uniquement) : clé -> id `after`
+        self._debounced = {}
+        
+        # Mesures : coût des mises à jour dans le thread de l'interface
+        metrics = get_registry()
+        self._flush_seconds = metrics.histogram(
+            'ui_flush_seconds', "Application d'un groupe de mises à jour de l'interface")
+        self._posted = metrics.counter('ui_updates_total', "Mises à jour demandées",
+                                       {'result': 'posted'})
+        self._applied = metrics.counter('ui_updates_total', "Mises à jour demandées",
+                                        {'result': 'applied'})
+        
+    def post(self, key, callback, *args, **kwargs):
+        """
+        Planifie une mise à jour (depuis n'importe quel thread)
+        
+        Une mise à jour de même clé encore en attente est remplacée : seule
+        la plus récente est appliquée, au plus `max_rate` fois par seconde.
+        
+        Args:
+            key (str): Nature de la mise à jour ('progress', 'status'...)
+            callback (callable): Fonction exécutée dans le thread de l'interface
+            *args, **kwargs: Arguments de la fonction
+        """
+        self._posted.inc()
+        with self._lock:
+            self._pending[key] = (callback, args, kwargs)
+            if self._scheduled:
+                return
+            self._scheduled = True
+            delay = self._last_flush + self.interval - time.monotonic()
+        self.widget.after(max(0, int(delay * 1000)), self._flush)
+        
+    def debounce(self, key, callback, *args):
+        """
+        Exécute une fonction une fois les valeurs stabilisées (thread de
+        l'interface uniquement)
+        
+        Chaque appel repousse l'exécution de `debounce_ms` ; seule la dernière
+        valeur est transmise (par exemple au relâchement d'un curseur).
+        
+        Args:
+            key (str): Nature du réglage ('speed', 'volume'...)
+            callback (callable): Fonction à exécuter
+            *args: Arguments de la fonction
+        """
+        pending = self._debounced.pop(key, None)
+        if pending is not None:
+            self.widget.after_cancel(pending)
+        self._debounced[key] = self.widget.after(
+            self.debounce_ms, self._run_debounced, key, callback, args
+        )
+        
+    def cancel(self, *keys):
+        """
+        Abandonne les mises à jour en attente (thread de l'interface)
+        
+        Args:
+            *keys (str): Clés à abandonner
+        """
+        with self._lock:
+            for key in keys:
+                self._pending.pop(key, None)
+        for key in keys:
+            pending = self._debounced.pop(key, None)
+            if pending is not None:
+                self.widget.after_cancel(pending)
+                
+    def _flush(self):
+        """Applique les mises à jour en attente (thread de l'interface)"""
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            self._scheduled = False
+            self._last_flush = time.monotonic()
+        with self._flush_seconds.time():
+            for callback, args, kwargs in pending.values():
+                callback(*args, **kwargs)
+        self._applied.inc(len(pending))
+            
+    def _run_debounced(self, key, callback, args):
+        """Exécute un réglage stabilisé"""
+        self._debounced.pop(key, None)
+        callback(*args)
\ No newline at end of file
@@ -3,71 +3,229 @@ Moteur de synthèse vocale hybride (en ligne et hors ligne)
 Détection automatique de la connexion Internet
 """
 
-import pyttsx3
-import re
 import time
 import os
 import tempfile
+import shutil
+import io
+import itertools
+import threading
+from collections import namedtuple
 from pathlib import Path
+from synthesis_pipeline import SynthesisPipeline, SynthesisError
+from audio_cache import AudioCache
+from connectivity import ConnectivityProbe
+from audio_format import audio_duration, AudioWriter
+from speech_chunks import plan_chunks, GTTS_MAX_CHARS
+from language_id import get_identifier
+from sentence_index import split_sentences, split_page
+from metrics import get_registry, summarize, total
 
+# Unité de lecture : une phrase, la progression atteinte une fois lue, sa
+# langue et sa position (page, décalage dans la page)
+SpeechUnit = namedtuple(
+    'SpeechUnit',
+    ['text', 'progress', 'lang', 'page', 'offset'],
+    defaults=(None, None, None)
+)
+
+class PlaybackControl:
+    """État de la lecture (pause / arrêt) partagé entre les threads"""
+    
+    def __init__(self):
+        """Initialisation de l'état"""
+        self._condition = threading.Condition()
+        self.paused = False
+        self.stopped = False
+        
+    def reset(self):
+        """Remise à zéro au début d'une lecture"""
+        with self._condition:
+            self.paused = False
+            self.stopped = False
+            self._condition.notify_all()
+            
+    def pause(self):
+        """Met en pause la lecture"""
+        with self._condition:
+            self.paused = True
+            self._condition.notify_all()
+            
+    def resume(self):
+        """Reprend la lecture"""
+        with self._condition:
+            self.paused = False
+            self._condition.notify_all()
+            
+    def stop(self):
+        """Arrête la lecture"""
+        with self._condition:
+            self.stopped = True
+            self.paused = False
+            self._condition.notify_all()
+            
+    def wait_while_paused(self):
+        """
+        Bloque tant que la lecture est en pause (sans consommer de CPU)
+        
+        Returns:
+            bool: False si la lecture a été arrêtée
+        """
+        with self._condition:
+            while self.paused and not self.stopped:
+                self._condition.wait()
+            return not self.stopped
+            
+    def wait(self, timeout):
+        """
+        Attend un changement d'état (pause, reprise, arrêt) ou la fin du délai
+        
+        Args:
+            timeout (float): Délai maximal (secondes)
+        """
+        with self._condition:
+            if not self.paused and not self.stopped:
+                self._condition.wait(timeout)
+                
 class VoiceEngine:
     """Classe pour la synthèse vocale hybride"""
     
-    def __init__(self):
-        """Initialisation du moteur de synthèse vocale"""
-        # Détection de la connexion Internet
-        self.is_online = self._check_internet_connection()
+    def __init__(self, engine_mode="auto", metrics=None):
+        """
+        Initialisation du moteur de synthèse vocale
+        
+        Aucune opération bloquante ici : la connexion est sondée en
+        arrière-plan (voir initialize_async) et les moteurs (gTTS, pygame,
+        pyttsx3) ne sont importés qu'à la première lecture.
+        
+        Args:
+            engine_mode (str): 'auto' (selon la connexion), 'online' ou 'offline'
+            metrics (MetricsRegistry, optional): Registre des mesures (par
+                défaut celui du processus)
+        """
+        self.engine_mode = engine_mode
+        
+        # Détection de la connexion Internet (résultat mis en cache)
+        self.connectivity = ConnectivityProbe()
+        self.is_online = None
         
         # Variables d'état
-        self.is_paused = False
-        self.should_stop = False
+        self.control = PlaybackControl()
+        self._sentence_callback = None
         self.current_engine = None
+        self.gtts_available = False
+        self._init_lock = threading.RLock()
         
-        # Initialisation des moteurs
-        if self.is_online:
-            self._init_online_engine()
-        else:
-            self._init_offline_engine()
+        # Synthèse anticipée (mode en ligne)
+        self.prefetch_sentences = 3
+        self.synthesis_workers = 2
+        self._pipeline = None
+        self._pipeline_lock = threading.Lock()
+        
+        # Phrases courtes regroupées en blocs de synthèse (0 : désactivé)
+        self.online_chunk_chars = GTTS_MAX_CHARS
+        self.offline_chunk_chars = 300
+        
+        # Rendu hors ligne par lots (un seul runAndWait par lot)
+        self.offline_batch_size = 16
+        self._engine_lock = threading.Lock()
+        
+        # Réglages pyttsx3 reçus pendant un rendu, appliqués à sa fin
+        self._pending_properties = {}
+        self._pending_lock = threading.Lock()
+        
+        # Audio transmis à pygame depuis la mémoire (sans fichier temporaire)
+        self.in_memory_audio = True
+        self._mixer_ready = None
+        self.speed = 1.0
+        self.volume = 0.8
+        
+        # Audio déjà synthétisé, conservé d'une session à l'autre
+        self.audio_cache = None
+        try:
+            self.audio_cache = AudioCache()
+        except Exception as e:
+            print(f"⚠ Cache audio indisponible: {e}")
             
-    def _check_internet_connection(self):
+        # Mesures : synthèse, silences entre deux audios, file d'attente,
+        # cache audio et basculements
+        self.metrics = metrics or get_registry()
+        self._synthesis_seconds = {
+            engine: self.metrics.histogram(
+                'tts_synthesis_seconds', "Synthèse d'une phrase (hors cache)",
+                {'engine': engine})
+            for engine in ("online", "offline")
+        }
+        self._gap_seconds = self.metrics.histogram(
+            'tts_gap_seconds', "Silence entre la fin d'un audio et le début du suivant")
+        self._queue_depth = self.metrics.gauge(
+            'tts_queue_depth', "Blocs synthétisés à l'avance (ou en cours)")
+        self._sentences = self.metrics.counter(
+            'tts_sentences_total', "Phrases transmises au moteur")
+        self._audio_cache_lookups = {
+            result: self.metrics.counter(
+                'tts_audio_cache_lookups_total', "Blocs cherchés dans le cache audio",
+                {'result': result})
+            for result in ("hit", "miss")
+        }
+        self._last_audio_end = None
+        
+    def initialize_async(self, callback=None):
         """
-        Vérifie si une connexion Internet est disponible
+        Sonde la connexion en arrière-plan pour annoncer le mode de lecture
         
-        Returns:
-            bool: True si connecté, False sinon
+        Args:
+            callback (callable, optional): Appelée avec le statut du moteur
+                (voir get_engine_status), depuis le thread d'arrière-plan
         """
-        try:
-            import socket
-            import urllib.request
-            
-            # Test de connexion à Google DNS
-            socket.create_connection(("8.8.8.8", 53), timeout=2)
-            
-            # Tentative de connexion à Google (backup)
-            try:
-                urllib.request.urlopen('http://www.google.com', timeout=2)
-                return True
-            except:
-                return True  # DNS fonctionne, considéré comme en ligne
+        def on_probe(online):
+            self.is_online = online
+            if callback:
+                callback(self.get_engine_status())
+                
+        self.connectivity.check_async(on_probe)
+        
+    def _ensure_engine(self):
+        """
+        Initialise le moteur adapté à la connexion, à la première lecture
+        
+        Un moteur hors ligne repasse en ligne si la connexion est revenue
+        (résultat de la sonde expiré puis rafraîchi).
+        """
+        with self._init_lock:
+            if self.engine_mode == "offline":
+                if self.current_engine != "offline":
+                    self._init_offline_engine()
+                return
+                
+            if self.engine_mode == "online":
+                self.is_online = True
+            elif self.connectivity.last_result is None:
+                # Première lecture avant la fin de la sonde : on l'attend
+                self.is_online = self.connectivity.check()
+            else:
+                self.is_online = self.connectivity.last_result
+                if not self.connectivity.is_fresh():
+                    self.connectivity.check_async()
+                    
+            if self.is_online and self.current_engine != "online":
+                self._init_online_engine()
+            elif self.current_engine is None:
+                self._init_offline_engine()
                 
-        except (socket.error, OSError):
-            return False
-            
     def _init_online_engine(self):
         """Initialisation du moteur en ligne (gTTS)"""
         try:
-            from gtts import gTTS
+            import gtts
             import pygame
             
-            # Test de fonctionnement
-            test_text = "test"
-            tts = gTTS(text=test_text, lang='fr', slow=False)
-            
             self.current_engine = "online"
             self.gtts_available = True
             
             # Initialisation de pygame pour la lecture audio
-            pygame.mixer.init()
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            self._mixer_ready = True
             
             print("✓ Moteur en ligne activé (gTTS)")
             
@@ -81,12 +239,16 @@ class VoiceEngine:
     def _init_offline_engine(self):
         """Initialisation du moteur hors ligne (pyttsx3)"""
         try:
+            import pyttsx3
+            
             self.engine = pyttsx3.init()
             self.current_engine = "offline"
             self.gtts_available = False
             
             # Configuration par défaut
             self._setup_default_voice()
+            self.set_speed(self.speed)
+            self.set_volume(self.volume)
             
             print("✓ Moteur hors ligne activé (pyttsx3)")
             
@@ -112,7 +274,8 @@ class VoiceEngine:
         self.engine.setProperty('rate', 150)  # Vitesse normale
         self.engine.setProperty('volume', 0.8)  # Volume à 80%
         
-    def read_text(self, text, speed=1.0, volume=0.8, progress_callback=None):
+    def read_text(self, text, speed=1.0, volume=0.8, progress_callback=None,
+                  sentence_callback=None):
         """
         Lit un texte à haute voix avec gestion de la ponctuation
         
@@ -121,126 +284,610 @@ class VoiceEngine:
             speed (float): Vitesse de lecture (0.5 à 2.0)
             volume (float): Volume (0.0 à 1.0)
             progress_callback (callable): Fonction de rappel pour la progression
+            sentence_callback (callable): Appelée avec les unités (SpeechUnit)
+                dont la lecture commence
+            
+        Returns:
+            int: Nombre de phrases lues
+        """
+        # Découpage du texte en phrases (fragment final sans ponctuation compris)
+        spans, tail = split_page(text)
+        if tail is not None:
+            start, fragment = tail
+            spans.append((start, start + len(fragment), fragment))
+        total_sentences = len(spans)
+        languages = get_identifier().sentence_languages(
+            (sentence for _, _, sentence in spans), default='fr')
+        
+        units = (
+            SpeechUnit(sentence, (i + 1) / total_sentences, lang, None, start)
+            for i, ((start, _, sentence), lang) in enumerate(zip(spans, languages))
+        )
+        return self._read_units(units, speed, volume, progress_callback, sentence_callback)
+        
+    def read_pages(self, pages, first_page, last_page, speed=1.0, volume=0.8,
+                   progress_callback=None, start_offset=0, sentence_callback=None):
+        """
+        Lit des pages au fur et à mesure de leur extraction
+        
+        La lecture de la première page commence sans attendre l'extraction
+        des suivantes (voir PDFProcessor.iter_pages).
+        
+        Args:
+            pages (iterable): Couples (numéro de page, texte)
+            first_page (int): Première page de la plage (1-indexed)
+            last_page (int): Dernière page de la plage (1-indexed)
+            speed (float): Vitesse de lecture (0.5 à 2.0)
+            volume (float): Volume (0.0 à 1.0)
+            progress_callback (callable): Fonction de rappel pour la progression
+            start_offset (int): Début de la lecture dans la première page
+                (les phrases qui commencent avant sont ignorées)
+            sentence_callback (callable): Appelée avec les unités (SpeechUnit)
+                dont la lecture commence
+            
+        Returns:
+            int: Nombre de phrases lues
+        """
+        units = self._page_units(pages, first_page, last_page, start_offset)
+        return self._read_units(units, speed, volume, progress_callback, sentence_callback)
+        
+    def _page_units(self, pages, first_page, last_page, start_offset=0):
+        """
+        Découpe des pages en unités de lecture
+        
+        Args:
+            pages (iterable): Couples (numéro de page, texte)
+            first_page (int): Première page de la plage (1-indexed)
+            last_page (int): Dernière page de la plage (1-indexed)
+            start_offset (int): Début de la lecture dans la première page
+            
+        Yields:
+            SpeechUnit: Phrases, avec la progression sur la plage et leur
+                position dans la page
+        """
+        total_pages = last_page - first_page + 1
+        identifier = get_identifier()
+        lang = None
+        
+        # Phrase commencée sur une page précédente, sans ponctuation finale :
+        # (page, début dans cette page, texte), complétée par la page suivante
+        pending = None
+        
+        for page_number, text in pages:
+            spans, tail = split_page(text)
+            sentences = [(page_number, start, sentence) for start, _, sentence in spans]
+            if pending is not None and sentences:
+                _, _, continuation = sentences[0]
+                sentences[0] = (pending[0], pending[1], f"{pending[2]} {continuation}")
+                pending = None
+            if tail is not None:
+                start, fragment = tail
+                if pending is None:
+                    pending = (page_number, start, fragment)
+                else:
+                    pending = (pending[0], pending[1], f"{pending[2]} {fragment}")
+                    
+            # Langue de chaque phrase, dans la continuité de la page précédente
+            languages = identifier.sentence_languages(
+                (sentence for _, _, sentence in sentences), default='fr', context=lang)
+            done = page_number - first_page
+            for i, ((page, start, sentence), lang) in enumerate(zip(sentences, languages)):
+                if page == first_page and start < start_offset:
+                    continue
+                progress = (done + (i + 1) / len(sentences)) / total_pages
+                yield SpeechUnit(sentence, progress, lang, page, start)
+                
+        # Fragment restant en fin de plage : lu seul
+        if pending is not None:
+            page, start, sentence = pending
+            if not (page == first_page and start < start_offset):
+                lang = identifier.sentence_languages([sentence], default='fr', context=lang)[0]
+                yield SpeechUnit(sentence, 1.0, lang, page, start)
+                
+    def render_pages(self, pages, first_page, last_page, output_base,
+                     progress_callback=None):
+        """
+        Enregistre la lecture de pages dans un fichier audio (sans les jouer)
+        
+        Args:
+            pages (iterable): Couples (numéro de page, texte)
+            first_page (int): Première page de la plage (1-indexed)
+            last_page (int): Dernière page de la plage (1-indexed)
+            output_base (str): Chemin du fichier sans extension
+                (.mp3 en ligne, .wav hors ligne)
+            progress_callback (callable): Fonction de rappel pour la progression
+            
+        Returns:
+            tuple: (chemin du fichier, durée de l'audio en secondes,
+                nombre de phrases)
+        """
+        self.control.reset()
+        self._ensure_engine()
+        
+        units = self._page_units(pages, first_page, last_page)
+        audio_format = "mp3" if self.current_engine == "online" else "wav"
+        output_path = f"{output_base}.{audio_format}"
+        
+        writer = AudioWriter(output_path, audio_format)
+        try:
+            if self.current_engine == "online":
+                self._render_online(units, writer, progress_callback)
+            else:
+                self._render_offline(units, writer, progress_callback)
+        except Exception as e:
+            raise Exception(f"Erreur lors du rendu audio: {str(e)}")
+        finally:
+            writer.close()
+            
+        return output_path, writer.duration, writer.segments
+        
+    def _render_online(self, units, writer, progress_callback):
+        """
+        Rendu avec gTTS (plusieurs phrases synthétisées en parallèle)
+        
+        Args:
+            units (iterable): Unités de lecture (SpeechUnit)
+            writer (AudioWriter): Fichier de sortie
+            progress_callback (callable): Fonction de rappel
+        """
+        pipeline = SynthesisPipeline(
+            self._synthesize_online,
+            lookahead=max(self.prefetch_sentences, 2 * self.synthesis_workers),
+            max_workers=self.synthesis_workers
+        )
+        self._attach_pipeline(pipeline)
+        try:
+            for chunk, audio in pipeline.run(self._online_chunks(units)):
+                if self.should_stop:
+                    break
+                writer.write(audio)
+                self._report_progress(chunk, progress_callback)
+        except SynthesisError as e:
+            raise e.error
+        finally:
+            pipeline.close()
+            self._release_pipeline(pipeline)
+            
+    def _render_offline(self, units, writer, progress_callback):
+        """
+        Rendu avec pyttsx3
+        
+        Args:
+            units (iterable): Unités de lecture (SpeechUnit)
+            writer (AudioWriter): Fichier de sortie
+            progress_callback (callable): Fonction de rappel
+        """
+        # Lots de phrases rendus chacun par un seul runAndWait
+        for batch in self._offline_batches(self._offline_chunks(units)):
+            if self.should_stop:
+                break
+            for chunk, audio in zip(batch, self._synthesize_offline_units(batch)):
+                if not audio:
+                    raise Exception("rendu pyttsx3 vide")
+                writer.write(audio)
+                self._report_progress(chunk, progress_callback)
+        
+    def _read_units(self, units, speed, volume, progress_callback, sentence_callback=None):
+        """
+        Lit une suite d'unités avec le moteur actif
+        
+        Args:
+            units (iterable): Unités de lecture (SpeechUnit)
+            speed (float): Vitesse de lecture (0.5 à 2.0)
+            volume (float): Volume (0.0 à 1.0)
+            progress_callback (callable): Fonction de rappel pour la progression
+            sentence_callback (callable): Appelée avec les unités dont la
+                lecture commence
+            
+        Returns:
+            int: Nombre de phrases lues
         """
-        self.should_stop = False
-        self.is_paused = False
+        self.control.reset()
+        self._sentence_callback = sentence_callback
+        
+        # Moteur initialisé à la première lecture (hors du thread de l'interface)
+        self._ensure_engine()
         
         # Application des paramètres
         self.set_speed(speed)
         self.set_volume(volume)
         
-        # Découpage du texte en phrases
-        sentences = self._split_into_sentences(text)
-        total_sentences = len(sentences)
+        # Comptage des phrases effectivement transmises au moteur
+        sentence_count = 0
+        
+        def counted(units):
+            nonlocal sentence_count
+            for unit in units:
+                sentence_count += 1
+                self._sentences.inc()
+                yield unit
+                
+        self._last_audio_end = None
         
         if self.current_engine == "online":
-            self._read_text_online(sentences, total_sentences, progress_callback)
+            self._read_text_online(counted(units), progress_callback)
         else:
-            self._read_text_offline(sentences, total_sentences, progress_callback)
+            self._read_text_offline(counted(units), progress_callback)
             
-    def _read_text_online(self, sentences, total_sentences, progress_callback):
+        return sentence_count
+        
+    def _read_text_online(self, units, progress_callback):
         """
         Lecture avec moteur en ligne (gTTS)
         
         Args:
-            sentences (list): Liste des phrases
-            total_sentences (int): Nombre total de phrases
+            units (iterable): Unités de lecture (SpeechUnit)
             progress_callback (callable): Fonction de rappel
         """
-        from gtts import gTTS
-        import pygame
-        
-        temp_dir = tempfile.gettempdir()
+        chunks = self._online_chunks(units)
         
-        for i, sentence in enumerate(sentences):
-            if self.should_stop:
-                break
-                
-            # Gestion de la pause
-            while self.is_paused and not self.should_stop:
-                time.sleep(0.1)
-                
-            if self.should_stop:
-                break
-                
-            try:
-                # Détection de la langue (simplifiée)
-                lang = self._detect_sentence_language(sentence)
+        # Les phrases suivantes sont synthétisées pendant la lecture
+        pipeline = SynthesisPipeline(
+            self._synthesize_online,
+            lookahead=self.prefetch_sentences,
+            max_workers=self.synthesis_workers
+        )
+        self._attach_pipeline(pipeline)
+        if self.is_paused:
+            pipeline.pause()
+            
+        try:
+            for chunk, audio in pipeline.run(chunks):
+                self._queue_depth.set(pipeline.queue_depth)
                 
-                # Génération audio avec gTTS
-                tts = gTTS(text=sentence, lang=lang, slow=False)
+                # Gestion de la pause (attente sans scrutation)
+                if not self.control.wait_while_paused():
+                    break
+                    
+                try:
+                    self._announce(chunk)
+                    self._play_audio(audio, "mp3")
+                except Exception as e:
+                    remaining = itertools.chain([chunk], pipeline.take_pending(), chunks)
+                    self._fallback_offline(e, self._chunk_units(remaining), progress_callback)
+                    break
+                    
+                # Mise à jour de la progression
+                self._report_progress(chunk, progress_callback)
                 
-                # Fichier temporaire
-                temp_file = os.path.join(temp_dir, f"tts_temp_{i}.mp3")
-                tts.save(temp_file)
+        except SynthesisError as e:
+            remaining = itertools.chain(e.pending_units, chunks)
+            self._fallback_offline(e.error, self._chunk_units(remaining), progress_callback)
+        finally:
+            pipeline.close()
+            self._release_pipeline(pipeline)
+            
+    def _online_chunks(self, units):
+        """
+        Regroupe les phrases en blocs d'une requête gTTS, de même langue
+        
+        Args:
+            units (iterable): Unités de lecture (SpeechUnit)
+            
+        Returns:
+            iterator: Blocs de synthèse (SpeechChunk)
+        """
+        return plan_chunks(
+            units,
+            self.online_chunk_chars,
+            lambda unit: unit.lang or self._detect_sentence_language(unit.text, default=None),
+            default_lang='fr'
+        )
+        
+    def _offline_chunks(self, units):
+        """
+        Regroupe les phrases en blocs pour pyttsx3 (voix unique)
+        
+        Args:
+            units (iterable): Unités de lecture (SpeechUnit)
+            
+        Returns:
+            iterator: Blocs de synthèse (SpeechChunk)
+        """
+        return plan_chunks(units, self.offline_chunk_chars)
+        
+    def _chunk_units(self, chunks):
+        """
+        Rend les unités de lecture des blocs (pour une nouvelle planification)
+        
+        Args:
+            chunks (iterable): Blocs de synthèse (SpeechChunk)
+            
+        Yields:
+            SpeechUnit: Unités, dans l'ordre
+        """
+        for chunk in chunks:
+            yield from chunk.units
+            
+    def _announce(self, chunk):
+        """
+        Signale le début de la lecture d'un bloc (surlignage des phrases)
+        
+        Args:
+            chunk (SpeechChunk): Bloc dont la lecture commence
+        """
+        # Silence depuis la fin de l'audio précédent (synthèse en retard)
+        if self._last_audio_end is not None:
+            self._gap_seconds.observe(time.perf_counter() - self._last_audio_end)
+            self._last_audio_end = None
+            
+        if self._sentence_callback:
+            self._sentence_callback(chunk.units)
+            
+    def _report_progress(self, chunk, progress_callback):
+        """
+        Signale la progression phrase par phrase après la lecture d'un bloc
+        
+        Args:
+            chunk (SpeechChunk): Bloc lu
+            progress_callback (callable): Fonction de rappel
+        """
+        self._last_audio_end = time.perf_counter()
+        if progress_callback:
+            for unit in chunk.units:
+                progress_callback(unit.progress)
                 
-                # Lecture du fichier audio
-                pygame.mixer.music.load(temp_file)
-                pygame.mixer.music.play()
+    def _synthesize_online(self, chunk):
+        """
+        Synthèse d'un bloc avec gTTS (appelée dans un thread de synthèse)
+        
+        Args:
+            chunk (SpeechChunk): Phrases à synthétiser
+            
+        Returns:
+            bytes: Audio MP3 du bloc
+        """
+        from gtts import gTTS
+        
+        lang = chunk.lang
+        
+        # Bloc déjà synthétisé (en-têtes, titres, relectures...)
+        key = None
+        if self.audio_cache:
+            key = self.audio_cache.make_key(chunk.text, lang, "gtts", None, "normal")
+            audio = self.audio_cache.get(key, "mp3")
+            self._audio_cache_lookups["hit" if audio else "miss"].inc()
+            if audio:
+                return audio
                 
-                # Attente de la fin de la lecture
-                while pygame.mixer.music.get_busy():
-                    if self.should_stop:
+        # Génération audio avec gTTS, directement en mémoire
+        with self._synthesis_seconds["online"].time():
+            tts = gTTS(text=chunk.text, lang=lang, slow=False)
+            buffer = io.BytesIO()
+            tts.write_to_fp(buffer)
+            audio = buffer.getvalue()
+        
+        if key:
+            self.audio_cache.put(key, "mp3", audio)
+        return audio
+        
+    def _play_audio(self, audio, audio_format):
+        """
+        Joue un audio avec pygame et attend la fin de la lecture
+        
+        Args:
+            audio (bytes): Audio à jouer
+            audio_format (str): Format de l'audio ('mp3', 'wav')
+        """
+        import pygame
+        
+        temp_file = None
+        try:
+            # Lecture de l'audio (en mémoire si possible)
+            temp_file = self._load_audio(audio, audio_format)
+            pygame.mixer.music.play()
+            
+            # Fin de lecture attendue d'après la durée de l'audio : le thread
+            # dort jusque-là et n'est réveillé que par pause / reprise / arrêt
+            duration = audio_duration(audio, audio_format)
+            deadline = time.monotonic() + duration if duration else None
+            
+            while True:
+                if self.control.stopped:
+                    pygame.mixer.music.stop()
+                    break
+                    
+                if self.control.paused:
+                    pygame.mixer.music.pause()
+                    paused_at = time.monotonic()
+                    if not self.control.wait_while_paused():
                         pygame.mixer.music.stop()
                         break
-                    while self.is_paused and not self.should_stop:
-                        pygame.mixer.music.pause()
-                        time.sleep(0.1)
-                        if not self.is_paused:
-                            pygame.mixer.music.unpause()
-                    time.sleep(0.1)
-                
-                # Suppression du fichier temporaire
-                try:
-                    os.remove(temp_file)
-                except:
-                    pass
+                    pygame.mixer.music.unpause()
+                    if deadline:
+                        deadline += time.monotonic() - paused_at
+                    continue
                     
-                # Mise à jour de la progression
-                if progress_callback:
-                    progress = (i + 1) / total_sentences
-                    progress_callback(progress)
+                remaining = deadline - time.monotonic() if deadline else 0
+                if remaining > 0:
+                    self.control.wait(remaining)
+                    continue
                     
-            except Exception as e:
-                print(f"Erreur lecture en ligne: {e}")
-                # Fallback vers le mode hors ligne
-                self._init_offline_engine()
-                remaining_sentences = sentences[i:]
-                self._read_text_offline(
-                    remaining_sentences, 
-                    len(remaining_sentences),
-                    progress_callback
-                )
-                break
+                # Durée écoulée (ou inconnue) : confirmation auprès de pygame
+                if not pygame.mixer.music.get_busy():
+                    break
+                self.control.wait(0.01 if deadline else 0.05)
+        finally:
+            if temp_file:
+                self._discard_audio_file(temp_file)
+        
+    def _load_audio(self, audio, audio_format):
+        """
+        Charge un audio dans le lecteur pygame
+        
+        L'audio est transmis depuis la mémoire ; un fichier temporaire
+        n'est utilisé que si la version de pygame ne le permet pas.
+        
+        Args:
+            audio (bytes): Audio à charger
+            audio_format (str): Format de l'audio ('mp3', 'wav')
+            
+        Returns:
+            str: Fichier temporaire à supprimer après lecture (ou None)
+        """
+        import pygame
+        
+        if self.in_memory_audio:
+            try:
+                try:
+                    pygame.mixer.music.load(io.BytesIO(audio), audio_format)
+                except TypeError:
+                    # pygame 1.x : pas d'indication de format
+                    pygame.mixer.music.load(io.BytesIO(audio))
+                return None
+            except pygame.error as e:
+                print(f"⚠ Lecture en mémoire indisponible ({e}), passage par fichier temporaire")
+                self._count_fallback("audio_file")
+                self.in_memory_audio = False
                 
-    def _read_text_offline(self, sentences, total_sentences, progress_callback):
+        fd, temp_file = tempfile.mkstemp(prefix="tts_temp_", suffix=f".{audio_format}")
+        with os.fdopen(fd, 'wb') as file:
+            file.write(audio)
+        pygame.mixer.music.load(temp_file)
+        return temp_file
+        
+    def _discard_audio_file(self, temp_file):
+        """
+        Supprime un fichier audio temporaire
+        
+        Args:
+            temp_file (str): Chemin du fichier
+        """
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+            
+    def _fallback_offline(self, error, units, progress_callback):
+        """
+        Bascule sur le moteur hors ligne et poursuit la lecture
+        
+        Args:
+            error (Exception): Erreur du moteur en ligne
+            units (iterable): Unités restant à lire
+            progress_callback (callable): Fonction de rappel
+        """
+        print(f"Erreur lecture en ligne: {error}")
+        self._count_fallback("offline")
+        # Fallback vers le mode hors ligne
+        self._init_offline_engine()
+        self._read_text_offline(units, progress_callback)
+        
+    def _read_text_offline(self, units, progress_callback):
         """
         Lecture avec moteur hors ligne (pyttsx3)
         
         Args:
-            sentences (list): Liste des phrases
-            total_sentences (int): Nombre total de phrases
+            units (iterable): Unités de lecture (SpeechUnit)
             progress_callback (callable): Fonction de rappel
         """
-        for i, sentence in enumerate(sentences):
-            if self.should_stop:
-                break
-                
-            # Gestion de la pause
-            while self.is_paused and not self.should_stop:
-                time.sleep(0.1)
-                
-            if self.should_stop:
+        chunks = self._offline_chunks(units)
+        
+        # Avec pygame : lecture des segments rendus par lots
+        if self._ensure_mixer():
+            self._read_text_offline_batched(chunks, progress_callback)
+            return
+            
+        for chunk in chunks:
+            # Gestion de la pause (attente sans scrutation)
+            if not self.control.wait_while_paused():
                 break
                 
-            # Lecture de la phrase
-            self._read_sentence_offline(sentence)
+            # Lecture du bloc de phrases
+            self._announce(chunk)
+            self._read_sentence_offline(chunk.text)
             
             # Mise à jour de la progression
-            if progress_callback:
-                progress = (i + 1) / total_sentences
-                progress_callback(progress)
+            self._report_progress(chunk, progress_callback)
                 
+    def _read_text_offline_batched(self, chunks, progress_callback):
+        """
+        Lecture hors ligne par lots : chaque lot de phrases est rendu en un
+        seul passage de pyttsx3 pendant la lecture du lot précédent
+        
+        Args:
+            chunks (iterable): Blocs de synthèse (SpeechChunk)
+            progress_callback (callable): Fonction de rappel
+        """
+        # Un seul thread de rendu : le moteur pyttsx3 n'est pas partagé
+        pipeline = SynthesisPipeline(
+            self._synthesize_offline_units,
+            lookahead=2,
+            max_workers=1
+        )
+        self._attach_pipeline(pipeline)
+        if self.is_paused:
+            pipeline.pause()
+            
+        try:
+            for batch, audios in pipeline.run(self._offline_batches(chunks)):
+                self._queue_depth.set(pipeline.queue_depth)
+                for chunk, audio in zip(batch, audios):
+                    # Gestion de la pause (attente sans scrutation)
+                    if not self.control.wait_while_paused():
+                        return
+                        
+                    # Segment non rendu : lecture directe des phrases
+                    self._announce(chunk)
+                    if audio:
+                        self._play_audio(audio, "wav")
+                    else:
+                        self._count_fallback("direct")
+                        self._read_sentence_offline(chunk.text)
+                        
+                    # Mise à jour de la progression
+                    self._report_progress(chunk, progress_callback)
+        finally:
+            pipeline.close()
+            self._release_pipeline(pipeline)
+            
+    def _attach_pipeline(self, pipeline):
+        """
+        Désigne la file de synthèse de la session en cours (visée par
+        pause, resume et stop)
+        
+        Args:
+            pipeline (SynthesisPipeline): File de la session
+        """
+        with self._pipeline_lock:
+            self._pipeline = pipeline
+            
+    def _release_pipeline(self, pipeline):
+        """
+        Oublie la file de synthèse d'une session terminée, sauf si une
+        session plus récente l'a déjà remplacée
+        
+        Args:
+            pipeline (SynthesisPipeline): File de la session terminée
+        """
+        with self._pipeline_lock:
+            if self._pipeline is pipeline:
+                self._pipeline = None
+                
+    def _offline_batches(self, chunks):
+        """
+        Regroupe les blocs en lots pour le rendu hors ligne
+        
+        Le premier lot ne contient qu'un bloc (début de lecture immédiat),
+        la taille double ensuite jusqu'à `offline_batch_size`.
+        
+        Args:
+            chunks (iterable): Blocs de synthèse (SpeechChunk)
+            
+        Yields:
+            list: Lots de blocs
+        """
+        size = 1
+        batch = []
+        for chunk in chunks:
+            batch.append(chunk)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+                size = min(size * 2, self.offline_batch_size)
+        if batch:
+            yield batch
+            
     def _split_into_sentences(self, text):
         """
         Découpe le texte en phrases en respectant la ponctuation
@@ -252,18 +899,7 @@ class VoiceEngine:
             list: Liste des phrases
         """
         # Découpage sur les points, points d'exclamation et d'interrogation
-        sentences = re.split(r'([.!?]+)', text)
-        
-        # Reconstruction des phrases avec leur ponctuation
-        result = []
-        for i in range(0, len(sentences) - 1, 2):
-            if sentences[i].strip():
-                sentence = sentences[i].strip()
-                if i + 1 < len(sentences):
-                    sentence += sentences[i + 1]
-                result.append(sentence)
-                
-        return [s for s in result if s.strip()]
+        return [sentence for _, _, sentence in split_sentences(text)]
         
     def _read_sentence_offline(self, sentence):
         """
@@ -272,10 +908,7 @@ class VoiceEngine:
         Args:
             sentence (str): Phrase à lire
         """
-        # Ajout de pauses pour les virgules et autres ponctuations
-        sentence_with_pauses = sentence.replace(',', ', ')
-        sentence_with_pauses = sentence_with_pauses.replace(';', '; ')
-        sentence_with_pauses = sentence_with_pauses.replace(':', ': ')
+        sentence_with_pauses = self._add_pauses(sentence)
         
         # Détection du ton basé sur la ponctuation finale
         if sentence.strip().endswith('?'):
@@ -286,8 +919,130 @@ class VoiceEngine:
             self._adjust_pitch_offline(1.0)
             
         # Lecture de la phrase
-        self.engine.say(sentence_with_pauses)
-        self.engine.runAndWait()
+        with self._engine_lock:
+            self.engine.say(sentence_with_pauses)
+            self.engine.runAndWait()
+        self._apply_pending_properties()
+        
+    def _add_pauses(self, sentence):
+        """
+        Ajout de pauses pour les virgules et autres ponctuations (pyttsx3)
+        
+        Args:
+            sentence (str): Phrase
+            
+        Returns:
+            str: Phrase avec pauses
+        """
+        sentence_with_pauses = sentence.replace(',', ', ')
+        sentence_with_pauses = sentence_with_pauses.replace(';', '; ')
+        return sentence_with_pauses.replace(':', ': ')
+        
+    def _synthesize_offline_units(self, batch):
+        """
+        Rendu d'un lot de blocs (appelé dans le thread de rendu)
+        
+        Args:
+            batch (list): Blocs de synthèse (SpeechChunk)
+            
+        Returns:
+            list: Audio WAV de chaque bloc (None si le rendu a échoué)
+        """
+        return self._synthesize_offline_batch([self._add_pauses(chunk.text) for chunk in batch])
+        
+    def _synthesize_offline_batch(self, sentences):
+        """
+        Synthèse de plusieurs phrases avec pyttsx3 dans des fichiers audio
+        
+        Les phrases absentes du cache audio sont toutes mises en file
+        (save_to_file) puis rendues par un unique runAndWait : la boucle
+        d'événements du moteur ne démarre qu'une fois par lot.
+        
+        Args:
+            sentences (list): Phrases (avec pauses de ponctuation)
+            
+        Returns:
+            list: Audio WAV de chaque phrase (None si le rendu a échoué)
+        """
+        audios = [None] * len(sentences)
+        keys = [None] * len(sentences)
+        
+        if self.audio_cache:
+            with self._engine_lock:
+                voice = self.engine.getProperty('voice')
+                rate = self.engine.getProperty('rate')
+            for i, sentence in enumerate(sentences):
+                keys[i] = self.audio_cache.make_key(sentence, None, "pyttsx3", voice, rate)
+                audios[i] = self.audio_cache.get(keys[i], "wav")
+                self._audio_cache_lookups["hit" if audios[i] else "miss"].inc()
+                
+        missing = [i for i, audio in enumerate(audios) if not audio]
+        if not missing:
+            return audios
+            
+        temp_dir = tempfile.mkdtemp(prefix="tts_batch_")
+        try:
+            paths = {i: os.path.join(temp_dir, f"{i}.wav") for i in missing}
+            with self._engine_lock:
+                # Clés recalculées si la voix ou la vitesse a changé depuis
+                # la consultation du cache : l'audio est rendu avec celles-ci
+                if self.audio_cache:
+                    render_voice = self.engine.getProperty('voice')
+                    render_rate = self.engine.getProperty('rate')
+                    if (render_voice, render_rate) != (voice, rate):
+                        for i in missing:
+                            keys[i] = self.audio_cache.make_key(
+                                sentences[i], None, "pyttsx3", render_voice, render_rate
+                            )
+                            
+                # Rendu à plein volume : le volume est appliqué à la lecture
+                try:
+                    self.engine.setProperty('volume', 1.0)
+                    for i in missing:
+                        self.engine.save_to_file(sentences[i], paths[i])
+                    started = time.perf_counter()
+                    self.engine.runAndWait()
+                    
+                    # Un seul rendu pour le lot : durée moyenne par phrase
+                    per_sentence = (time.perf_counter() - started) / len(missing)
+                    for _ in missing:
+                        self._synthesis_seconds["offline"].observe(per_sentence)
+                except Exception as e:
+                    print(f"⚠ Rendu audio hors ligne impossible: {e}")
+                    self._count_fallback("render_failed")
+                finally:
+                    self.engine.setProperty('volume', self.volume)
+            self._apply_pending_properties()
+                    
+            for i in missing:
+                try:
+                    with open(paths[i], 'rb') as file:
+                        audios[i] = file.read() or None
+                except OSError:
+                    continue
+                if audios[i] and keys[i]:
+                    self.audio_cache.put(keys[i], "wav", audios[i])
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            
+        return audios
+        
+    def _ensure_mixer(self):
+        """
+        Initialise pygame pour la lecture de l'audio en cache
+        
+        Returns:
+            bool: True si pygame peut lire de l'audio
+        """
+        if self._mixer_ready is None:
+            try:
+                import pygame
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init()
+                self._mixer_ready = True
+            except Exception:
+                self._mixer_ready = False
+        return self._mixer_ready
         
     def _adjust_pitch_offline(self, factor):
         """
@@ -300,62 +1055,100 @@ class VoiceEngine:
         # Cette fonction est un placeholder
         pass
         
-    def _detect_sentence_language(self, sentence):
+    def _detect_sentence_language(self, sentence, default='fr'):
         """
         Détecte la langue d'une phrase (pour gTTS)
         
         Args:
             sentence (str): Phrase à analyser
+            default (str): Langue rendue si la phrase est trop courte
+                pour être identifiée
             
         Returns:
             str: Code de langue ('fr', 'en', etc.)
         """
-        sentence_lower = sentence.lower()
-        
-        # Mots français courants
-        french_words = ['le', 'la', 'les', 'de', 'des', 'un', 'une', 'et', 
-                        'est', 'dans', 'pour', 'que', 'qui', 'par', 'avec']
-        # Mots anglais courants
-        english_words = ['the', 'and', 'of', 'to', 'in', 'is', 'that', 
-                         'for', 'it', 'with', 'as', 'was', 'on', 'are']
+        return get_identifier().detect(sentence, default)
+            
+    @property
+    def is_paused(self):
+        """Lecture en pause"""
+        return self.control.paused
         
-        # Comptage des occurrences
-        french_count = sum(1 for word in french_words if f' {word} ' in f' {sentence_lower} ')
-        english_count = sum(1 for word in english_words if f' {word} ' in f' {sentence_lower} ')
+    @property
+    def should_stop(self):
+        """Arrêt de la lecture demandé"""
+        return self.control.stopped
         
-        # Retour de la langue dominante
-        if french_count > english_count:
-            return 'fr'
-        elif english_count > french_count:
-            return 'en'
-        else:
-            return 'fr'  # Par défaut
-            
     def pause(self):
         """Met en pause la lecture"""
-        self.is_paused = True
+        self.control.pause()
+        # Le silence d'une pause n'est pas un retard de synthèse
+        self._last_audio_end = None
+        pipeline = self._pipeline
+        if pipeline:
+            pipeline.pause()
         
     def resume(self):
         """Reprend la lecture"""
-        self.is_paused = False
+        self.control.resume()
+        pipeline = self._pipeline
+        if pipeline:
+            pipeline.resume()
         
     def stop(self):
         """Arrête la lecture"""
-        self.should_stop = True
-        self.is_paused = False
+        self.control.stop()
+        pipeline = self._pipeline
+        if pipeline:
+            pipeline.cancel()
         
-        if self.current_engine == "online":
+        if self.current_engine == "online" or self._mixer_ready:
             try:
                 import pygame
                 pygame.mixer.music.stop()
             except:
                 pass
-        else:
+        if self.current_engine == "offline":
             try:
                 self.engine.stop()
             except:
                 pass
                 
+    def _set_engine_property(self, name, value):
+        """
+        Modifie une propriété pyttsx3 sans attendre la fin d'un rendu
+        
+        Pendant un runAndWait (lecture ou rendu d'un lot), la valeur est
+        mise en attente : le thread de rendu l'applique une fois le moteur
+        libéré, ce qui évite de changer la voix ou la vitesse au milieu
+        d'un lot déjà associé à ses clés de cache.
+        
+        Args:
+            name (str): Nom de la propriété ('rate', 'volume', 'voice')
+            value: Nouvelle valeur
+        """
+        with self._pending_lock:
+            self._pending_properties[name] = value
+        self._apply_pending_properties()
+        
+    def _apply_pending_properties(self):
+        """
+        Applique les propriétés pyttsx3 en attente si le moteur est libre
+        
+        Appelé après chaque libération de _engine_lock : une valeur mise en
+        attente pendant un rendu est donc toujours appliquée.
+        """
+        while self._pending_properties:
+            if not self._engine_lock.acquire(blocking=False):
+                return
+            try:
+                with self._pending_lock:
+                    pending, self._pending_properties = self._pending_properties, {}
+                for name, value in pending.items():
+                    self.engine.setProperty(name, value)
+            finally:
+                self._engine_lock.release()
+                
     def set_speed(self, speed):
         """
         Définit la vitesse de lecture
@@ -363,11 +1156,13 @@ class VoiceEngine:
         Args:
             speed (float): Vitesse (0.5 à 2.0, normal = 1.0)
         """
+        self.speed = speed
+        
         if self.current_engine == "offline":
             base_rate = 150
             rate = int(base_rate * speed)
             rate = max(50, min(rate, 300))
-            self.engine.setProperty('rate', rate)
+            self._set_engine_property('rate', rate)
         # Pour gTTS, la vitesse est gérée différemment (slow parameter)
         
     def set_volume(self, volume):
@@ -378,27 +1173,84 @@ class VoiceEngine:
             volume (float): Volume (0.0 à 1.0)
         """
         volume = max(0.0, min(volume, 1.0))
+        self.volume = volume
         
         if self.current_engine == "offline":
-            self.engine.setProperty('volume', volume)
-        else:
+            self._set_engine_property('volume', volume)
+        if self.current_engine == "online" or self._mixer_ready:
             try:
                 import pygame
                 pygame.mixer.music.set_volume(volume)
             except:
                 pass
                 
+    def get_cache_stats(self):
+        """
+        Obtient les statistiques du cache audio
+        
+        Returns:
+            dict: Taux de succès et octets économisés (vide si désactivé)
+        """
+        if self.audio_cache is None:
+            return {}
+        return self.audio_cache.stats()
+        
+    def _count_fallback(self, kind):
+        """
+        Compte un basculement vers une solution de repli
+        
+        Args:
+            kind (str): 'offline' (gTTS -> pyttsx3), 'audio_file' (lecture
+                par fichier temporaire), 'render_failed' (rendu par lot en
+                échec), 'direct' (bloc lu sans rendu préalable)
+        """
+        self.metrics.counter(
+            'tts_fallback_total', "Basculements vers une solution de repli", {'kind': kind}
+        ).inc()
+        
+    def get_stats(self):
+        """
+        Obtient les mesures de la lecture (toutes les lectures du processus)
+        
+        Returns:
+            dict: Durées de synthèse par phrase et silences entre deux audios
+                (nombre, moyenne, 95e centile, maximum ; None sans mesure),
+                profondeur de la file, phrases lues, taux de succès du cache
+                audio et basculements par type
+        """
+        snapshot = self.metrics.snapshot('tts_')
+        hits = total(snapshot, 'tts_audio_cache_lookups_total{result="hit"}')
+        lookups = total(snapshot, 'tts_audio_cache_lookups_total')
+        prefix = 'tts_fallback_total{kind="'
+        return {
+            'synthesis_seconds': summarize(snapshot, 'tts_synthesis_seconds'),
+            'gap_seconds': summarize(snapshot, 'tts_gap_seconds'),
+            'queue_depth': snapshot.get('tts_queue_depth', 0),
+            'sentences': total(snapshot, 'tts_sentences_total'),
+            'audio_cache_hit_ratio': hits / lookups if lookups else 0.0,
+            'fallbacks': {
+                key[len(prefix):-2]: value
+                for key, value in snapshot.items() if key.startswith(prefix)
+            }
+        }
+        
     def get_engine_status(self):
         """
         Obtient le statut du moteur actuel
         
         Returns:
-            dict: Informations sur le moteur
+            dict: Informations sur le moteur (avant la première lecture,
+                le moteur prévu d'après la sonde de connexion ; None si la
+                sonde n'a pas encore répondu)
         """
+        engine = self.current_engine
+        if engine is None and self.is_online is not None:
+            engine = "online" if self.is_online else "offline"
+            
         return {
-            'engine': self.current_engine,
+            'engine': engine,
             'is_online': self.is_online,
-            'quality': 'Haute (Google TTS)' if self.current_engine == 'online' else 'Standard (pyttsx3)'
+            'quality': 'Haute (Google TTS)' if engine == 'online' else 'Standard (pyttsx3)'
         }
         
     def get_available_voices(self):
@@ -420,4 +1272,4 @@ class VoiceEngine:
             voice_id (str): ID de la voix
         """
         if self.current_engine == "offline":
-            self.engine.setProperty('voice', voice_id)
\ No newline at end of file
+            self._set_engine_property('voice', voice_id)
\ No newline at end of file